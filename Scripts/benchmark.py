@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+LeetCode解析与代码生成基准测试
+用法:
+    - 运行基准测试: python benchmark.py
+    - 保存为基线: python benchmark.py --save-baseline
+    - 录制题目到语料库: python benchmark.py --record 题号 [题号 ...]
+示例:
+    - python benchmark.py --repeat 50 --threshold 0.1   # 每题运行50次，超过基线10%视为退化
+    - python benchmark.py --filter 1 226                 # 只测试指定的题目
+    - python benchmark.py --record 15 42 146            # 从LeetCode获取题目数据并追加到语料库
+
+语料库Benchmarks/corpus.jsonl每行是questionData查询返回的原始question对象，
+与create_problem.py走相同的转换路径。每道题分别测量两个阶段:
+    - parse: 构建题目的中间表示（转换题目描述、提取示例、解析测试用例）
+    - generate: 从中间表示生成C++和Python测试代码
+报告每道题的p50/p99耗时和整体吞吐量，并与Benchmarks/baseline.json比较。
+每道题分别判断是否退化，以控制计时噪声: p50超过基线的比例大于阈值，且超出基线
+测量时的波动范围（基线的p99）时，重新测量该题，两次都超出才视为性能退化，
+以非零状态退出。仓库中的语料库只是十几道题目的种子，可以用--record扩充。
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+
+# 添加当前脚本所在目录到Python路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from case_ir import build_problem_ir
+from code_generators import CodeGeneratorFactory
+from html_converter import convert_statement
+
+BENCHMARK_DIR = Path(current_dir).parent / "Benchmarks"
+CORPUS_FILE = BENCHMARK_DIR / "corpus.jsonl"
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+
+# 测量代码生成的语言及其在LeetCode中的代码片段名称
+GENERATE_LANGUAGES = {"cpp": "cpp", "py": "python3"}
+
+# 默认的退化阈值（相对基线p50的增长比例）
+DEFAULT_THRESHOLD = 0.2
+
+# 耗时差异小于该值（微秒）时不视为退化，避免极短阶段的计时噪声
+MIN_REGRESSION_US = 20.0
+
+
+def load_corpus(corpus_file: Path):
+    """读取语料库，返回题目信息列表"""
+    from leetcode_api import problem_info_from_question
+
+    problems = []
+    with open(corpus_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                problems.append(problem_info_from_question(json.loads(line)))
+    return problems
+
+
+def record_problems(problem_ids, corpus_file: Path):
+    """从LeetCode获取题目数据并追加到语料库，已存在的题目会被替换"""
+    from leetcode_api import LeetCodeAPI
+
+    records = {}
+    if corpus_file.exists():
+        with open(corpus_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    question = json.loads(line)
+                    records[question["questionFrontendId"]] = question
+
+    api = LeetCodeAPI()
+    for problem_id in problem_ids:
+        try:
+            question = api.get_question_data(api.get_title_slug(problem_id))
+        except Exception as e:
+            print(f"录制题目 {problem_id} 失败: {e}")
+            continue
+        # 只保留需要生成代码的语言，减小语料库体积
+        question["codeSnippets"] = [
+            snippet
+            for snippet in question.get("codeSnippets") or []
+            if snippet["langSlug"] in GENERATE_LANGUAGES.values()
+        ]
+        records[question["questionFrontendId"]] = question
+        print(f"已录制题目 {problem_id}: {question['title']}")
+
+    corpus_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(corpus_file, "w", encoding="utf-8") as f:
+        for question in records.values():
+            f.write(json.dumps(question, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    print(f"语料库共 {len(records)} 道题目: {corpus_file}")
+
+
+def percentile(sorted_samples, fraction: float) -> float:
+    """按最近秩法计算已排序样本的百分位数"""
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def measure(func, repeat: int, setup=None):
+    """多次运行func，返回每次的耗时（微秒，已排序）"""
+    timer = timeit.Timer(func, setup=setup or "pass")
+    return sorted(sample * 1e6 for sample in timer.repeat(repeat=repeat, number=1))
+
+
+def benchmark_problem(problem_info, repeat: int):
+    """测量一道题的解析和代码生成耗时，返回 {阶段: 已排序的样本}"""
+    test_cases = problem_info["test_cases"]
+    meta_data = problem_info["meta_data"]
+    content = problem_info["content"]
+
+    # 每次解析前清空题目描述的转换缓存，测量完整的解析过程
+    results = {
+        "parse": measure(
+            lambda: build_problem_ir(test_cases, meta_data, content),
+            repeat,
+            setup=convert_statement.cache_clear,
+        )
+    }
+
+    problem_ir = build_problem_ir(test_cases, meta_data, content)
+    snippets = problem_info["code_snippets"]
+    generators = [
+        (CodeGeneratorFactory.get_generator(lang), snippets[slug])
+        for lang, slug in GENERATE_LANGUAGES.items()
+        if slug in snippets
+    ]
+
+    def generate():
+        for generator, code_snippet in generators:
+            generator.create_test_code(problem_ir, code_snippet)
+
+    results["generate"] = measure(generate, repeat)
+    return results
+
+
+def summarize(results):
+    """汇总每道题各阶段的p50/p99"""
+    summary = {}
+    for problem_id, phases in results.items():
+        summary[problem_id] = {
+            phase: {
+                "p50": round(percentile(samples, 0.5), 2),
+                "p99": round(percentile(samples, 0.99), 2),
+            }
+            for phase, samples in phases.items()
+        }
+    return summary
+
+
+def print_report(summary):
+    """输出每道题的耗时和各阶段的吞吐量"""
+    print(f"{'题号':<8}{'阶段':<10}{'p50 (us)':>12}{'p99 (us)':>12}")
+    totals = {}
+    for problem_id, phases in summary.items():
+        for phase, stats in phases.items():
+            print(f"{problem_id:<8}{phase:<10}{stats['p50']:>12.1f}{stats['p99']:>12.1f}")
+            totals[phase] = totals.get(phase, 0.0) + stats["p50"]
+
+    print()
+    for phase, total_us in totals.items():
+        throughput = len(summary) / (total_us / 1e6) if total_us else float("inf")
+        print(f"{phase}: 共 {total_us / 1000:.2f} ms，吞吐量 {throughput:.0f} 题/秒")
+
+
+def compare_with_baseline(summary, baseline, threshold: float):
+    """与基线比较p50，返回退化列表 [(题号, 阶段, 基线, 当前)]
+
+    p50还必须超过基线的p99，即超出基线测量时的波动范围。
+    """
+    regressions = []
+    for problem_id, phases in summary.items():
+        for phase, stats in phases.items():
+            base = baseline.get(problem_id, {}).get(phase)
+            if not base:
+                continue
+            current, previous = stats["p50"], base["p50"]
+            if (
+                current > previous * (1 + threshold)
+                and current > base.get("p99", previous)
+                and current - previous > MIN_REGRESSION_US
+            ):
+                regressions.append((problem_id, phase, previous, current))
+    return regressions
+
+
+def confirm_regressions(problems, regressions, baseline, threshold: float, repeat: int):
+    """重新测量出现退化的题目，只保留两次测量都退化的项目（取较小的p50）"""
+    by_id = {problem_info["id"]: problem_info for problem_info in problems}
+    suspects = {problem_id for problem_id, _, _, _ in regressions}
+    print(f"\n重新测量 {len(suspects)} 道疑似退化的题目...")
+    summary = summarize(
+        {problem_id: benchmark_problem(by_id[problem_id], repeat) for problem_id in suspects}
+    )
+    confirmed = {
+        (problem_id, phase): current
+        for problem_id, phase, _, current in compare_with_baseline(
+            summary, baseline, threshold
+        )
+    }
+    return [
+        (problem_id, phase, previous, min(current, confirmed[(problem_id, phase)]))
+        for problem_id, phase, previous, current in regressions
+        if (problem_id, phase) in confirmed
+    ]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="LeetCode解析与代码生成基准测试")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_FILE, help="语料库文件")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="基线文件")
+    parser.add_argument("--repeat", type=int, default=30, help="每道题每个阶段的运行次数")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="p50相对基线增长超过该比例时视为退化",
+    )
+    parser.add_argument("--filter", nargs="+", metavar="题号", help="只测试指定的题目")
+    parser.add_argument("--save-baseline", action="store_true", help="将结果保存为基线")
+    parser.add_argument("--record", nargs="+", metavar="题号", help="录制题目到语料库")
+    args = parser.parse_args()
+
+    if args.record:
+        record_problems(args.record, args.corpus)
+        return 0
+
+    if not args.corpus.exists():
+        print(f"找不到语料库: {args.corpus}")
+        return 1
+
+    problems = load_corpus(args.corpus)
+    if args.filter:
+        problems = [p for p in problems if p["id"] in args.filter]
+    print(f"语料库共 {len(problems)} 道题目，每个阶段运行 {args.repeat} 次\n")
+
+    results = {}
+    for problem_info in problems:
+        results[problem_info["id"]] = benchmark_problem(problem_info, args.repeat)
+    summary = summarize(results)
+    print_report(summary)
+
+    if args.save_baseline:
+        if args.filter and args.baseline.exists():
+            # 只更新指定题目的基线
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                summary = dict(json.load(f), **summary)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\n基线已保存: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("\n没有基线，可以使用 --save-baseline 保存当前结果")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(summary, baseline, args.threshold)
+    if regressions:
+        regressions = confirm_regressions(
+            problems, regressions, baseline, args.threshold, args.repeat
+        )
+    if not regressions:
+        print(f"\n与基线相比没有超过 {args.threshold:.0%} 的退化")
+        return 0
+
+    print(f"\n发现 {len(regressions)} 处超过 {args.threshold:.0%} 的退化:")
+    for problem_id, phase, previous, current in regressions:
+        print(
+            f"- 题目 {problem_id} {phase}: {previous:.1f} us -> {current:.1f} us"
+            f" (+{(current / previous - 1):.0%})"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
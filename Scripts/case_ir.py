@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+LeetCode题目的类型化中间表示 - 各语言代码生成器共享
+
+每道题只构建一次中间表示: 参数和返回值的类型描述、方法名、比较模式，
+以及已解析为类型化值的测试用例。cases.jsonl和各语言的测试代码都是
+从中间表示生成的文本，新增语言只需要新增一个渲染器。
+
+load_problem_ir按(测试用例, 元数据, 题目描述)和解析代码的哈希缓存中间表示:
+同一进程内直接复用（最近使用的IR_CACHE_SIZE道题），并保存在题目目录的
+.problem_ir.json中，重新生成时跳过解析。保存的文件只包含中间表示和输入的哈希，
+解析的输入本身保存在problem.json.gz和cases.jsonl中；解析代码修改后哈希随之
+变化，已保存的结果自动失效。
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lc_trace import debug, info, span
+from leetcode_literal import LiteralParseError, parse_value
+from result_comparator import detect_compare_mode
+from test_case_parser import TestCaseParser
+
+# 链表、树和图的空值表示空结构
+NODE_TYPES = ("ListNode", "TreeNode", "Node")
+
+# 构建中间表示用到的模块，任一源文件变化都会使已保存的解析结果失效
+PARSER_MODULES = (
+    "case_ir.py",
+    "test_case_parser.py",
+    "example_index.py",
+    "html_converter.py",
+    "leetcode_literal.py",
+    "result_comparator.py",
+)
+
+# 进程内缓存的中间表示数量，后台服务长期运行时不会无限增长
+IR_CACHE_SIZE = 64
+
+# 题目目录中保存中间表示的文件名
+IR_CACHE_FILE_NAME = ".problem_ir.json"
+
+# 泛型写法的列表类型，如 list<list<integer>>
+_LIST_TYPE = re.compile(r"list<(.+)>")
+
+
+class TypeDesc:
+    """参数或返回值的类型: 基础类型加数组维数，如 integer[][] 为 (integer, 2)"""
+
+    __slots__ = ("base", "dims")
+
+    def __init__(self, base: str, dims: int = 0):
+        self.base = base
+        self.dims = dims
+
+    @property
+    def name(self) -> str:
+        """LeetCode元数据中的类型名，列表统一写为[]形式"""
+        return self.base + "[]" * self.dims
+
+    def element(self) -> "TypeDesc":
+        """数组元素的类型"""
+        return TypeDesc(self.base, max(self.dims - 1, 0))
+
+    @property
+    def is_void(self) -> bool:
+        return self.base == "void" and self.dims == 0
+
+    @property
+    def is_node(self) -> bool:
+        return self.base in NODE_TYPES and self.dims == 0
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, TypeDesc)
+            and self.base == other.base
+            and self.dims == other.dims
+        )
+
+    def __hash__(self):
+        return hash((self.base, self.dims))
+
+    def __repr__(self):
+        return f"TypeDesc({self.name!r})"
+
+
+@lru_cache(maxsize=None)
+def parse_type(type_name: str) -> TypeDesc:
+    """解析LeetCode元数据中的类型名，支持 integer[][] 和 list<list<integer>> 两种写法"""
+    type_name = (type_name or "").strip()
+    dims = 0
+    while True:
+        match = _LIST_TYPE.fullmatch(type_name)
+        if match:
+            type_name = match.group(1).strip()
+            dims += 1
+        elif type_name.endswith("[]"):
+            type_name = type_name[:-2].strip()
+            dims += 1
+        else:
+            break
+    return TypeDesc(type_name, dims)
+
+
+class ParamIR:
+    """方法参数"""
+
+    __slots__ = ("name", "type")
+
+    def __init__(self, name: str, type_desc: TypeDesc):
+        self.name = name
+        self.type = type_desc
+
+
+class CaseIR:
+    """一个测试用例: 类型化的参数值和期望输出"""
+
+    __slots__ = ("inputs", "expected", "has_expected")
+
+    def __init__(self, inputs: List[Any], expected: Any = None, has_expected=False):
+        self.inputs = inputs
+        self.expected = expected
+        self.has_expected = has_expected
+
+    def to_record(self) -> Dict[str, Any]:
+        """转换为cases.jsonl中一行的JSON对象，没有期望输出时省略expected字段"""
+        record = {"params": self.inputs}
+        if self.has_expected:
+            record["expected"] = self.expected
+        return record
+
+
+class ProblemIR:
+    """一道题目的中间表示，由build_problem_ir构建"""
+
+    def __init__(
+        self,
+        method_name: str,
+        params: List[ParamIR],
+        return_type: TypeDesc,
+        output_param: Optional[int],
+        compare_mode: str,
+        cases: List[CaseIR],
+    ):
+        # 元数据中的方法名，缺失时为空字符串，由渲染器从代码片段中提取
+        self.method_name = method_name
+        self.params = params
+        self.return_type = return_type
+        # void方法中被原地修改并作为输出的参数下标
+        self.output_param = output_param
+        self.compare_mode = compare_mode
+        self.cases = cases
+
+    @property
+    def param_names(self) -> List[str]:
+        return [p.name for p in self.params]
+
+    @property
+    def result_type(self) -> TypeDesc:
+        """结果的类型: 返回值，或void方法中作为输出的参数"""
+        if self.output_param is not None:
+            return self.params[self.output_param].type
+        return self.return_type
+
+    @property
+    def has_result(self) -> bool:
+        return not self.return_type.is_void or self.output_param is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可保存为JSON的字典"""
+        return {
+            "method_name": self.method_name,
+            "params": [[p.name, p.type.name] for p in self.params],
+            "return_type": self.return_type.name,
+            "output_param": self.output_param,
+            "compare_mode": self.compare_mode,
+            "cases": [case.to_record() for case in self.cases],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProblemIR":
+        """从to_dict的结果恢复中间表示"""
+        return cls(
+            data["method_name"],
+            [ParamIR(name, parse_type(type_name)) for name, type_name in data["params"]],
+            parse_type(data["return_type"]),
+            data["output_param"],
+            data["compare_mode"],
+            [
+                CaseIR(case["params"], case.get("expected"), "expected" in case)
+                for case in data["cases"]
+            ],
+        )
+
+
+def to_json_value(value_str: str) -> Any:
+    """将期望输出字符串解析为JSON值，无法解析时保留原始字符串"""
+    value_str = value_str.strip()
+    if not value_str:
+        return None
+    try:
+        return parse_value(value_str)
+    except LiteralParseError:
+        return value_str
+
+
+def validate_test_cases(
+    parsed_cases: List[Dict[str, Any]], meta_data: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """验证测试用例，移除包含不可为空参数却为空值的用例"""
+    valid_cases = []
+    params_info = meta_data.get("params", [])
+
+    for case in parsed_cases:
+        valid = True
+        for param in case["params"]:
+            if param["value"] is None:
+                # 检查参数是否可以为None
+                param_info = next(
+                    (p for p in params_info if p.get("name") == param["name"]), None
+                )
+                if param_info and not param_info.get("nullable", False):
+                    # 链表、树和图的空值表示空结构，是合法输入
+                    if param["type"] not in NODE_TYPES:
+                        valid = False
+                        break
+
+        if valid:
+            valid_cases.append(case)
+
+    return valid_cases
+
+
+def _params_info(meta_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """读取元数据中的参数信息，兼容JSON字符串形式"""
+    params = meta_data.get("params", [])
+    if isinstance(params, str):
+        try:
+            params = json.loads(params)
+        except ValueError:
+            params = []
+    return params
+
+
+def build_problem_ir(
+    test_cases: str, meta_data: Dict[str, Any], problem_content: str = None
+) -> Optional[ProblemIR]:
+    """解析元数据和测试用例，构建题目的中间表示
+
+    元数据缺失或没有参数信息时返回None。
+    """
+    if not meta_data or "params" not in meta_data:
+        return None
+
+    params_info = _params_info(meta_data)
+    params = [
+        ParamIR(p.get("name", f"param{i+1}"), parse_type(p.get("type", "")))
+        for i, p in enumerate(params_info)
+    ]
+
+    return_type = parse_type(meta_data.get("return", {}).get("type", "void"))
+
+    # void方法没有返回值，以被原地修改的参数作为输出
+    output_param = None
+    if return_type.is_void:
+        output_param = meta_data.get("output", {}).get("paramindex", 0)
+        if output_param >= len(params):
+            output_param = None
+
+    # 根据返回类型和题目描述确定结果比较模式
+    compare_mode = detect_compare_mode(return_type.name, problem_content)
+
+    cases = []
+    if test_cases:
+        meta_data = dict(meta_data, params=params_info)
+        parsed_cases = TestCaseParser.parse_test_cases(
+            test_cases, meta_data, problem_content
+        )
+        for case in validate_test_cases(parsed_cases, meta_data):
+            expected_output = case.get("expected_output", "")
+            cases.append(
+                CaseIR(
+                    [p["value"] for p in case["params"]],
+                    to_json_value(expected_output) if expected_output else None,
+                    bool(expected_output),
+                )
+            )
+
+    return ProblemIR(
+        meta_data.get("name") or "",
+        params,
+        return_type,
+        output_param,
+        compare_mode,
+        cases,
+    )
+
+
+# 进程内的中间表示缓存（按最近使用排序），键为problem_key的结果
+_ir_cache: "OrderedDict[str, Optional[ProblemIR]]" = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def parser_version() -> str:
+    """解析代码（PARSER_MODULES）的哈希"""
+    digest = hashlib.sha256()
+    scripts_dir = Path(__file__).resolve().parent
+    for name in PARSER_MODULES:
+        digest.update((scripts_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def problem_key(
+    test_cases: str, meta_data: Dict[str, Any], problem_content: str = None
+) -> str:
+    """计算(测试用例, 元数据, 题目描述)和解析代码的哈希，作为解析结果的缓存键"""
+    payload = json.dumps(
+        [parser_version(), test_cases or "", meta_data, problem_content or ""],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_saved_ir(cache_file: Path, key: str) -> Optional[ProblemIR]:
+    """读取题目目录中保存的中间表示，缓存键不匹配或文件损坏时返回None"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") != key:
+            return None
+        return ProblemIR.from_dict(data["ir"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_saved_ir(cache_file: Path, key: str, problem_ir: ProblemIR):
+    """将中间表示及其缓存键保存到题目目录"""
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"key": key, "ir": problem_ir.to_dict()},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+    except OSError as e:
+        debug("保存解析结果失败: %s", e)
+
+
+def load_problem_ir(
+    test_cases: str,
+    meta_data: Dict[str, Any],
+    problem_content: str = None,
+    directory: Path = None,
+) -> Optional[ProblemIR]:
+    """获取题目的中间表示，同一输入只解析一次
+
+    先查找进程内缓存，再查找directory中保存的结果，都没有时才解析，
+    并将结果保存到directory。返回的中间表示被多个渲染器共享，不应修改。
+    """
+    key = problem_key(test_cases, meta_data, problem_content)
+    if key in _ir_cache:
+        _ir_cache.move_to_end(key)
+        return _ir_cache[key]
+
+    cache_file = Path(directory) / IR_CACHE_FILE_NAME if directory else None
+    problem_ir = _read_saved_ir(cache_file, key) if cache_file else None
+    if problem_ir is not None:
+        info("使用已保存的解析结果: %s", cache_file)
+    else:
+        with span("parse", cases=len(test_cases or "")):
+            problem_ir = build_problem_ir(test_cases, meta_data, problem_content)
+        if problem_ir is not None and cache_file:
+            _write_saved_ir(cache_file, key, problem_ir)
+
+    _ir_cache[key] = problem_ir
+    if len(_ir_cache) > IR_CACHE_SIZE:
+        _ir_cache.popitem(last=False)
+    return problem_ir
+
+
+def load_saved_problem_ir(directory: Path) -> Optional[ProblemIR]:
+    """读取题目目录中保存的中间表示，用于没有problem.json.gz的较早创建的题目
+
+    这类题目没有解析的输入，无法按当前的解析代码重新解析，直接使用保存的结果；
+    旧版本保存的文件仍记录了解析的输入（source），此时重新解析但不覆盖该文件。
+    没有保存的文件或文件损坏时返回None。
+    """
+    cache_file = Path(directory) / IR_CACHE_FILE_NAME
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        source = data.get("source")
+        if source:
+            return load_problem_ir(
+                source["test_cases"], source["meta_data"], source["content"]
+            )
+        return ProblemIR.from_dict(data["ir"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
@@ -12,6 +12,7 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 # 现在导入应该可以正常工作了
+from case_ir import build_problem_ir
 from code_generators import CodeGeneratorFactory
 
 
@@ -25,5 +26,6 @@ if __name__ == "__main__":
     meta_data = {"params": [{"name": "nums", "type": "integer[]"}]}
     code_snippet = "class Solution {\npublic:\n    int countBadPairs(vector<int>& nums) {\n        // 实现代码\n    }\n};"
     
-    test_code = generator.create_test_code(test_cases, meta_data, code_snippet)
+    problem_ir = build_problem_ir(test_cases, meta_data)
+    test_code = generator.create_test_code(problem_ir, code_snippet)
     print(test_code)
\ No newline at end of file
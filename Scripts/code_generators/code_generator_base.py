@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 LeetCode代码生成器 - 抽象基类
+
+代码生成器是题目中间表示（case_ir.ProblemIR）到各语言测试代码的渲染器。
 """
 
 import os
@@ -13,8 +15,6 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-from test_case_parser import TestCaseParser
-
 
 class CodeGenerator(ABC):
     """代码生成器抽象基类"""
@@ -25,50 +25,32 @@ class CodeGenerator(ABC):
         pass
 
     @abstractmethod
-    def create_test_code(
-        self, test_cases, meta_data, code_snippet, problem_content=None
-    ):
-        """创建测试代码
+    def create_test_code(self, problem_ir, code_snippet):
+        """根据题目的中间表示创建测试代码
 
         Args:
-            test_cases: 测试用例字符串
-            meta_data: 元数据信息，包含参数和返回值类型
+            problem_ir: 题目的中间表示（case_ir.ProblemIR），为None时不生成测试代码
             code_snippet: 代码片段字符串
-            problem_content: 可选，题目的完整内容，用于提取期望输出
         """
         pass
 
     @abstractmethod
-    def replace_solution_class(self, template, code_snippet):
-        """替换模板中的Solution类"""
+    def format_solution_class(self, code_snippet):
+        """将LeetCode代码片段整理为模板中solution区块的内容"""
         pass
 
     @abstractmethod
-    def generate_test_statements(self, parsed_cases, params, method_name):
+    def generate_test_statements(self, problem_ir, method_name):
         """
         为特定编程语言生成测试语句
 
+        测试用例保存在cases.jsonl中，生成的语句在运行时读取并执行每个用例
+
         Args:
-            parsed_cases: 解析后的测试用例列表
-            params: 参数信息列表
+            problem_ir: 题目的中间表示，提供参数和返回值的类型
             method_name: 方法名称
 
         Returns:
             测试代码语句列表
         """
         pass
-
-    def parse_test_cases(self, test_cases, meta_data, problem_content=None):
-        """
-        解析测试用例，使用测试用例解析器
-
-        Args:
-            test_cases: 测试用例字符串
-            meta_data: 元数据字典，包含参数和返回值信息
-            problem_content: 可选，题目的完整内容，用于提取期望输出
-
-        Returns:
-            parsed_cases: 解析后的测试用例列表
-        """
-        # 使用测试用例解析器解析测试用例
-        return TestCaseParser.parse_test_cases(test_cases, meta_data, problem_content)
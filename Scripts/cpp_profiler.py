@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+LeetCode C++解决方案性能分析 - 用gprof和perf分析测试代码中Solution成员函数的开销
+
+以-O2 -g -pg（并关闭生成函数克隆的优化）编译并运行测试代码，用gprof读取gmon.out，将平面分析（flat profile）
+和调用图整理为以Solution::成员为主的简表；完整的gprof报告保存在题目目录的gprof.txt。
+gprof按每秒100次采样计时，运行时间很短的用例只有调用次数。
+
+-O2通常会把只调用一次的Solution方法内联到测试函数中，gprof按函数统计时这部分
+时间会计入test_solution()。因此另外读取gmon.out中的采样直方图，用addr2line -i
+按调试信息找到每个采样地址所在的（可能已被内联的）Solution成员和源码行。
+
+系统中有perf时，另外以-O2 -g（不带-pg，避免mcount的干扰）编译，用perf stat
+记录周期、指令、缓存未命中和分支预测失败等硬件计数器，用于区分算法本身的开销
+和内存布局造成的开销。
+通常通过 python test_solution.py 题号 cpp --profile 调用。
+"""
+
+import linecache
+import re
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 默认显示的函数数量
+DEFAULT_TOP = 15
+
+PROFILE_FLAGS = "-O2 -g"
+
+# gprof忽略名称中带"."的符号，GCC在-O2下生成的Solution::f(int) [clone .isra.0]等
+# 克隆函数的耗时会被计入相邻的符号（如frame_dummy），因此关闭生成克隆的优化；
+# -no-pie使采样地址与可执行文件中的地址一致，便于addr2line解析
+GPROF_FLAGS = (
+    "-pg -no-pie -fno-ipa-sra -fno-ipa-cp -fno-partial-inlining "
+    "-fno-reorder-blocks-and-partition"
+)
+
+# gmon.out的文件头（"gmon"、版本和保留字节）长度和记录标记，见glibc的gmon/sys/gmon_out.h
+GMON_HEADER_SIZE = 20
+GMON_TAG_TIME_HIST = 0
+GMON_TAG_CG_ARC = 1
+GMON_FILE_NAME = "gmon.out"
+GPROF_REPORT_FILE_NAME = "gprof.txt"
+
+# perf stat记录的硬件计数器
+PERF_EVENTS = (
+    "cycles",
+    "instructions",
+    "cache-references",
+    "cache-misses",
+    "branches",
+    "branch-misses",
+)
+
+# 平面分析的一行: % time, cumulative, self, [calls, self ms/call, total ms/call,] name
+_FLAT_LINE = re.compile(
+    r"^\s*(?P<percent>[\d.]+)\s+(?P<cumulative>[\d.]+)\s+(?P<self>[\d.]+)\s+"
+    r"(?:(?P<calls>\d+)\s+(?P<self_call>[\d.]+)\s+(?P<total_call>[\d.]+)\s+)?"
+    r"(?P<name>\S.*)$"
+)
+
+# 调用图中的主行: [索引] % time self children called name [索引]
+_GRAPH_PRIMARY = re.compile(
+    r"^\[(?P<index>\d+)\]\s+(?P<percent>[\d.]+)\s+(?P<self>[\d.]+)\s+"
+    r"(?P<children>[\d.]+)\s+(?P<called>[\d+]*)\s*(?P<name>.+?)\s+\[\d+\]$"
+)
+
+# 调用图中调用者或被调用者的行: self children called name [索引]
+_GRAPH_ENTRY = re.compile(
+    r"^\s+(?P<self>[\d.]+)\s+(?P<children>[\d.]+)\s+(?P<called>\d+(?:/\d+)?)\s+"
+    r"(?P<name>.+?)\s+\[\d+\]$"
+)
+
+
+def is_solution_member(name: str) -> bool:
+    return name.startswith("Solution::")
+
+
+def compile_solution(solution_file: Path, exe: Path, flags: str) -> bool:
+    """编译解决方案；使用绝对路径，测试代码按__FILE__查找cases.jsonl"""
+    compile_cmd = f'g++ {flags} "{solution_file.resolve()}" -o "{exe}"'
+    print(f"正在编译: {compile_cmd}")
+    process = subprocess.run(compile_cmd, shell=True, capture_output=True, text=True)
+    if process.returncode != 0:
+        print("编译失败:")
+        print(process.stderr)
+        return False
+    return True
+
+
+def parse_flat_profile(text: str) -> List[Dict]:
+    """解析gprof -p的输出，返回每个函数的统计"""
+    entries = []
+    for line in text.splitlines():
+        match = _FLAT_LINE.match(line)
+        if not match:
+            continue
+        entries.append(
+            {
+                "name": match["name"].strip(),
+                "percent": float(match["percent"]),
+                "self": float(match["self"]),
+                "calls": int(match["calls"]) if match["calls"] else None,
+                "total_call": float(match["total_call"]) if match["total_call"] else None,
+            }
+        )
+    return entries
+
+
+def parse_call_graph(text: str) -> Dict[str, Dict[str, List[Dict]]]:
+    """解析gprof -q的输出，返回{函数名: {"callers": 调用者列表, "callees": 被调用者列表}}"""
+    graph: Dict[str, Dict[str, List[Dict]]] = {}
+    callers: List[Dict] = []
+    current = None
+    for line in text.splitlines():
+        if line.startswith("-----"):
+            callers, current = [], None
+            continue
+        primary = _GRAPH_PRIMARY.match(line)
+        if primary:
+            current = primary["name"]
+            graph[current] = {"callers": callers, "callees": []}
+            continue
+        entry = _GRAPH_ENTRY.match(line)
+        if not entry:
+            continue
+        item = {
+            "name": entry["name"],
+            "time": float(entry["self"]) + float(entry["children"]),
+            "called": entry["called"],
+        }
+        # 主行之前的是调用者，之后的是被调用者
+        if current is None:
+            callers.append(item)
+        else:
+            graph[current]["callees"].append(item)
+    return graph
+
+
+def print_gprof_summary(flat: List[Dict], graph: Dict[str, Dict[str, List[Dict]]], top: int):
+    """输出Solution成员的平面分析和调用关系"""
+    members = [entry for entry in flat if is_solution_member(entry["name"])]
+    member_percent = sum(entry["percent"] for entry in members)
+    print(f"\ngprof记录的Solution成员（未被内联，占采样时间的 {member_percent:.1f}%）:")
+    if not members:
+        print("  没有，Solution的方法都已被内联到调用处")
+    else:
+        print(f"{'时间%':>8}{'自身 (s)':>10}{'调用次数':>10}{'每次 (ms)':>11}  函数")
+        for entry in members[:top]:
+            calls = "" if entry["calls"] is None else str(entry["calls"])
+            per_call = "" if entry["total_call"] is None else f"{entry['total_call']:.2f}"
+            print(
+                f"{entry['percent']:>8.1f}{entry['self']:>10.2f}{calls:>10}{per_call:>11}"
+                f"  {entry['name']}"
+            )
+
+    others = [
+        entry for entry in flat if not is_solution_member(entry["name"]) and entry["self"]
+    ]
+    if others:
+        print("\n其他耗时最高的函数（测试代码、标准库等）:")
+        for entry in others[: min(top, 5)]:
+            print(f"{entry['percent']:>8.1f}{entry['self']:>10.2f}  {entry['name']}")
+
+    # 调用图按flat profile的顺序显示，被调用者按耗时排序
+    linked = [
+        (entry["name"], graph[entry["name"]])
+        for entry in members[:top]
+        if entry["name"] in graph
+    ]
+    if linked:
+        print("\nSolution成员的调用关系:")
+        for name, edges in linked:
+            print(f"  {name}")
+            for item in edges["callers"]:
+                print(f"      <- {item['name']} ({item['called']} 次)")
+            ranked = sorted(edges["callees"], key=lambda item: item["time"], reverse=True)
+            for item in ranked[:5]:
+                print(f"      -> {item['name']} ({item['called']} 次, {item['time']:.2f} s)")
+
+
+def read_histogram(gmon_file: Path):
+    """读取gmon.out中的采样直方图，返回([(地址, 采样数)], 每秒采样次数)"""
+    data = gmon_file.read_bytes()
+    pointer = "Q" if struct.calcsize("P") == 8 else "I"
+    hist_header = struct.Struct(f"<{pointer}{pointer}II15sc")
+    arc_size = struct.calcsize(f"<{pointer}{pointer}I")
+
+    samples, rate = [], 100
+    pos = GMON_HEADER_SIZE
+    while pos < len(data):
+        tag = data[pos]
+        pos += 1
+        if tag == GMON_TAG_TIME_HIST:
+            low, high, size, rate, _, _ = hist_header.unpack_from(data, pos)
+            pos += hist_header.size
+            bins = struct.unpack_from(f"<{size}H", data, pos)
+            pos += 2 * size
+            step = (high - low) / size if size else 0
+            samples.extend((low + int(i * step), count) for i, count in enumerate(bins) if count)
+        elif tag == GMON_TAG_CG_ARC:
+            pos += arc_size
+        else:
+            # 基本块计数等其他记录，glibc不会生成
+            break
+    return samples, rate
+
+
+def inline_attribution(exe: Path, gmon_file: Path):
+    """按调试信息将采样归属到Solution成员和源码行，包括被内联的代码
+
+    返回({成员: 采样数}, {(文件, 行号): 采样数}, 全部采样数, 每秒采样次数)；
+    没有addr2line时返回None。
+    """
+    if not shutil.which("addr2line"):
+        return None
+    samples, rate = read_histogram(gmon_file)
+    total = sum(count for _, count in samples)
+    members: Dict[str, int] = {}
+    lines: Dict[tuple, int] = {}
+    if not samples:
+        return members, lines, total, rate
+
+    # -a在每个地址的结果前输出地址，-i输出内联链（从最内层到外层），每层为函数名和位置两行
+    output = subprocess.run(
+        ["addr2line", "-a", "-f", "-i", "-C", "-e", str(exe)],
+        input="\n".join(hex(address) for address, _ in samples),
+        capture_output=True,
+        text=True,
+    ).stdout
+    chains: List[List[tuple]] = []
+    rows = output.splitlines()
+    index = 0
+    while index < len(rows):
+        if rows[index].startswith("0x"):
+            chains.append([])
+            index += 1
+            continue
+        if chains and index + 1 < len(rows):
+            chains[-1].append((rows[index], rows[index + 1]))
+        index += 2
+
+    for (_, count), chain in zip(samples, chains):
+        for function, location in chain:
+            if not is_solution_member(function):
+                continue
+            members[function] = members.get(function, 0) + count
+            match = re.match(r"(.*):(\d+)", location)
+            if match:
+                key = (match.group(1), int(match.group(2)))
+                lines[key] = lines.get(key, 0) + count
+            break
+    return members, lines, total, rate
+
+
+def print_inline_attribution(attribution, top: int):
+    members, lines, total, rate = attribution
+    solution_samples = sum(members.values())
+    print(
+        f"\n按调试信息归属的Solution成员（包括被内联的代码，"
+        f"共 {total} 个采样，每个 {1000 / rate:.0f} ms）:"
+    )
+    if not solution_samples:
+        print("  没有落在Solution中的采样，运行时间太短；可以在cases.jsonl中加入更大的输入")
+        return
+    print(f"{'采样':>8}{'时间%':>8}{'秒':>8}  函数")
+    for name, count in sorted(members.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{count:>8}{count / total:>8.1%}{count / rate:>8.2f}  {name}")
+
+    print("\nSolution中采样最多的行:")
+    hottest = sorted(lines.items(), key=lambda item: item[1], reverse=True)
+    for (filename, line), count in hottest[:top]:
+        text = linecache.getline(filename, line).strip()
+        print(f"{count:>8}{count / total:>8.1%}  {Path(filename).name}:{line}  {text}")
+
+
+def gprof_profile(solution_file: Path, cpp_flags: str, top: int) -> bool:
+    """以-pg编译运行测试代码，输出gprof的分析结果"""
+    problem_dir = solution_file.parent
+    exe = (problem_dir / "solution.prof.exe").resolve()
+    if not compile_solution(solution_file, exe, f"{cpp_flags} {PROFILE_FLAGS} {GPROF_FLAGS}"):
+        return False
+
+    gmon_file = problem_dir / GMON_FILE_NAME
+    if gmon_file.exists():
+        gmon_file.unlink()
+    print("编译成功，正在运行...")
+    process = subprocess.run([str(exe)], cwd=problem_dir, capture_output=True, text=True)
+    print(process.stdout)
+    if process.stderr:
+        print("错误:")
+        print(process.stderr)
+    if not gmon_file.exists():
+        print(f"错误: 运行后没有生成 {gmon_file}")
+        return False
+
+    if not shutil.which("gprof"):
+        print("错误: 找不到gprof（通常包含在binutils中）")
+        return False
+    flat = subprocess.run(
+        ["gprof", "-b", "-p", str(exe), str(gmon_file)], capture_output=True, text=True
+    ).stdout
+    graph = subprocess.run(
+        ["gprof", "-b", "-q", str(exe), str(gmon_file)], capture_output=True, text=True
+    ).stdout
+
+    print("===== gprof分析 =====")
+    attribution = inline_attribution(exe, gmon_file)
+    if attribution is not None:
+        print_inline_attribution(attribution, top)
+    print_gprof_summary(parse_flat_profile(flat), parse_call_graph(graph), top)
+
+    report_file = problem_dir / GPROF_REPORT_FILE_NAME
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write(flat)
+        f.write("\n")
+        f.write(graph)
+    print(f"\n已保存完整的gprof报告: {report_file}")
+    return True
+
+
+def parse_perf_stat(text: str) -> Dict[str, Optional[float]]:
+    """解析perf stat -x,的输出，不支持或未计数的事件为None"""
+    counters: Dict[str, Optional[float]] = {}
+    for line in text.splitlines():
+        fields = line.split(",")
+        if len(fields) < 3:
+            continue
+        value, event = fields[0], fields[2]
+        # 部分架构的事件名带有后缀，如cycles:u
+        event = event.split(":")[0]
+        try:
+            counters[event] = float(value)
+        except ValueError:
+            counters[event] = None
+    return counters
+
+
+def perf_counters(solution_file: Path, cpp_flags: str) -> bool:
+    """系统中有perf时，记录硬件计数器；没有perf时跳过"""
+    if not shutil.which("perf"):
+        print("\n未找到perf，跳过硬件计数器（安装linux-perf等软件包后可用）")
+        return True
+
+    problem_dir = solution_file.parent
+    exe = (problem_dir / "solution.perf.exe").resolve()
+    print()
+    if not compile_solution(solution_file, exe, f"{cpp_flags} {PROFILE_FLAGS}"):
+        return False
+    process = subprocess.run(
+        ["perf", "stat", "-x", ",", "-e", ",".join(PERF_EVENTS), "--", str(exe)],
+        cwd=problem_dir,
+        capture_output=True,
+        text=True,
+    )
+    counters = parse_perf_stat(process.stderr)
+    if not any(value is not None for value in counters.values()):
+        print("perf stat没有返回计数器（可能受kernel.perf_event_paranoid限制）:")
+        print(process.stderr.strip())
+        return True
+
+    print("===== 硬件计数器（perf stat） =====")
+    for event in PERF_EVENTS:
+        value = counters.get(event)
+        shown = "不支持" if value is None else f"{value:,.0f}"
+        print(f"  {event:<18}{shown:>20}")
+
+    def ratio(numerator, denominator):
+        a, b = counters.get(numerator), counters.get(denominator)
+        return a / b if a is not None and b else None
+
+    ipc = ratio("instructions", "cycles")
+    cache_miss = ratio("cache-misses", "cache-references")
+    branch_miss = ratio("branch-misses", "branches")
+    if ipc is not None:
+        print(f"  每周期指令数 (IPC): {ipc:.2f}")
+    if cache_miss is not None:
+        print(f"  缓存未命中率: {cache_miss:.2%}")
+    if branch_miss is not None:
+        print(f"  分支预测失败率: {branch_miss:.2%}")
+    return True
+
+
+def profile_cpp_solution(solution_file: Path, cpp_flags: str, top: int = DEFAULT_TOP) -> bool:
+    """分析C++解决方案: gprof的平面分析和调用图，以及可用时的perf硬件计数器"""
+    if not gprof_profile(solution_file, cpp_flags, top):
+        return False
+    return perf_counters(solution_file, cpp_flags)
@@ -2,16 +2,16 @@
 """
 LeetCode题目创建工具 - 根据题号自动创建题目目录和代码框架
 用法: python create_problem.py 题号 [编程语言]
+      python create_problem.py --regen 题号|all
 示例: python create_problem.py 100 cpp     # 创建第100题的C++解决方案
       python create_problem.py 100 all     # 创建第100题的所有语言解决方案
+      python create_problem.py --regen all # 用当前的生成器重新生成所有题目的测试代码，
+                                           # 保留Solution类，不请求LeetCode
 支持的语言: cpp, py, md, all
 """
 
 import os
 import sys
-import json
-import re
-import html
 from pathlib import Path
 
 # 添加当前脚本所在目录到Python路径
@@ -20,7 +20,13 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 from code_generators import CodeGeneratorFactory
-from leetcode_api import LeetCodeAPI
+from html_converter import convert_statement
+from lc_trace import debug, info, lazy_json, span
+from leetcode_api import get_shared_api
+from case_ir import load_problem_ir
+from problem_store import load_local_problem_info, save_problem_info
+from template_engine import load_template
+from test_case_store import CASES_FILE_NAME, dump_cases, write_cases
 
 # 语言映射
 LANGUAGE_MAP = {
@@ -30,11 +36,17 @@ LANGUAGE_MAP = {
 
 
 def get_problem_info(problem_id):
-    """从LeetCode获取题目信息"""
+    """获取题目信息，优先使用题目目录中保存的数据，没有时从LeetCode获取"""
+    problem_info = load_local_problem_info(problem_id)
+    if problem_info:
+        print("使用本地保存的题目数据（删除题目目录中的problem.json.gz可重新获取）")
+        return problem_info
+
     try:
         # 使用API客户端获取题目信息
-        api = LeetCodeAPI()
-        problem_info = api.get_problem_by_id(problem_id)
+        api = get_shared_api()
+        with span("fetch", problem=problem_id):
+            problem_info = api.get_problem_by_id(problem_id)
         return problem_info
     except Exception as e:
         print(f"错误: {str(e)}")
@@ -43,30 +55,66 @@ def get_problem_info(problem_id):
 
 def parse_test_cases(test_cases, meta_data):
     """解析测试用例"""
-    print(f"\n[调试] 开始解析测试用例:")
-    print(f"测试用例内容: {test_cases}")
-    print(f"元数据类型: {type(meta_data)}")
+    debug("开始解析测试用例: %s", test_cases)
+    debug("元数据类型: %s", type(meta_data))
 
     test_cases = test_cases.strip()
     if not test_cases:
-        print("[调试] 警告: 测试用例为空")
+        debug("警告: 测试用例为空")
         return []
 
     # 分割测试用例
     cases = test_cases.split("\n")
-    print(f"[调试] 分割后的测试用例: {cases}")
+    debug("分割后的测试用例: %s", cases)
     return cases
 
 
-def create_directory_structure(problem_info, lang=None):
-    """创建题目目录结构"""
-    problem_id = problem_info["id"]
-    difficulty = {"Easy": "Easy", "Medium": "Medium", "Hard": "Hard"}.get(
+def get_difficulty(problem_info):
+    """题目难度，用作目录名"""
+    return {"Easy": "Easy", "Medium": "Medium", "Hard": "Hard"}.get(
         problem_info["difficulty"], "Unknown"
     )
 
-    # 如果没有标签，使用"其他"作为默认标签
-    topics = problem_info["topics"] if problem_info["topics"] else ["其他"]
+
+def get_topics(problem_info):
+    """题目标签，如果没有标签，使用"其他"作为默认标签"""
+    return problem_info["topics"] if problem_info["topics"] else ["其他"]
+
+
+def template_variables(problem_info):
+    """模板中的通用变量"""
+    return {
+        "problem_id": problem_info["id"],
+        "problem_title": problem_info["title"],
+        "problem_slug": problem_info["title_slug"],
+        "difficulty": get_difficulty(problem_info),
+    }
+
+
+def render_readme(problem_info, template_dir=Path("Templates")):
+    """渲染题目的README.md，提示/数据范围部分单独写入，描述中不包含"""
+    # 题目描述为HTML，转换器一次遍历即得到Markdown描述和提示（数据范围）部分
+    with span("convert", problem=problem_info["id"]):
+        statement = convert_statement(problem_info["content"])
+
+    return load_template(template_dir / "readme_template.md").render(
+        dict(
+            template_variables(problem_info),
+            topics="\n".join(f"- {topic}" for topic in get_topics(problem_info)),
+            description=statement.description,
+            data_range=statement.constraints_markdown or "暂无数据范围信息",
+            test_cases=problem_info["test_cases"],
+        ),
+        # 没有测试用例时省略示例测试用例部分
+        {} if problem_info["test_cases"] else {"examples": ""},
+    )
+
+
+def create_directory_structure(problem_info, lang=None):
+    """创建题目目录结构"""
+    problem_id = problem_info["id"]
+    difficulty = get_difficulty(problem_info)
+    topics = get_topics(problem_info)
 
     # 选择主标签作为目录名
     main_topic = topics[0]
@@ -75,54 +123,19 @@ def create_directory_structure(problem_info, lang=None):
     base_dir = Path(f"Tags/{main_topic}/{difficulty}/{problem_id}")
     base_dir.mkdir(parents=True, exist_ok=True)
 
-    # 清理HTML标签
-    content = re.sub(r"<[^>]+>", "", problem_info["content"])
-    content = html.unescape(content)  # 解码HTML实体
+    # 保存完整的题目信息，之后添加语言或重新生成时不再请求LeetCode
+    save_problem_info(base_dir, problem_info)
 
-    # 尝试提取数据范围信息
-    data_range = ""
-    modified_content = content
-    try:
-        # 查找提示部分
-        hints_match = re.search(r"提示[：:](.*?)(?=##|\Z)", content, re.DOTALL)
-        if hints_match:
-            data_range = hints_match.group(1).strip()
-            # 从原始内容中移除提示部分，避免重复
-            modified_content = re.sub(
-                r"提示[：:].*?(?=##|\Z)", "", content, flags=re.DOTALL
-            )
-    except Exception as e:
-        print(f"提取数据范围时出错: {str(e)}")
+    template_dir = Path("Templates")
+    variables = template_variables(problem_info)
+    content = problem_info["content"]
 
     # 创建README.md文件记录题目信息
-    with open(base_dir / "README.md", "w", encoding="utf-8") as f:
-        f.write(f"# {problem_id}. {problem_info['title']}\n\n")
-        f.write(f"- 难度: {difficulty}\n")
-        f.write(
-            f"- 题目链接: https://leetcode.com/problems/{problem_info['title_slug']}/\n"
-        )
-        f.write(
-            f"- 中文链接: https://leetcode.cn/problems/{problem_info['title_slug']}/\n\n"
-        )
-        f.write("## 标签\n\n")
-        for topic in topics:
-            f.write(f"- {topic}\n")
-        f.write("\n## 题目描述\n\n")
-        # 使用修改后的内容，不包含提示/数据范围部分
-        f.write(modified_content.strip())
-
-        # 添加数据范围部分
-        f.write("\n\n## 数据范围\n\n")
-        if data_range:
-            f.write(data_range)
-        else:
-            f.write("暂无数据范围信息")
-
-        # 添加测试用例
-        if problem_info["test_cases"]:
-            f.write("\n\n## 示例测试用例\n\n```\n")
-            f.write(problem_info["test_cases"])
-            f.write("\n```\n")
+    readme = render_readme(problem_info, template_dir)
+    with span("write", file="README.md"), open(
+        base_dir / "README.md", "w", encoding="utf-8"
+    ) as f:
+        f.write(readme)
 
     # 获取代码片段和测试用例
     code_snippets = problem_info["code_snippets"]
@@ -130,17 +143,22 @@ def create_directory_structure(problem_info, lang=None):
     meta_data = problem_info["meta_data"]
 
     # 打印调试信息
-    print(f"\n[调试] 创建解决方案文件前:")
-    print(f"测试用例: {test_cases}")
-    print(f"元数据类型: {type(meta_data)}")
-    if meta_data:
-        print(
-            f"元数据内容: {json.dumps(meta_data, indent=2, ensure_ascii=False)[:200]}..."
-        )
+    debug("创建解决方案文件前，测试用例: %s", test_cases)
+    debug("元数据内容: %s", lazy_json(meta_data, limit=200))
 
     # 复制并填充对应语言的模板
     languages = ["cpp", "py", "md"] if lang == "all" else [lang]
-    template_dir = Path("Templates")
+
+    # 题目只构建一次中间表示，测试用例保存为各语言共享的cases.jsonl，
+    # 各语言的测试代码都从中间表示生成；解析结果保存在题目目录中，重新生成时复用。
+    # 之后添加其他语言时cases.jsonl已经存在，其中可能有用户添加的用例，不再覆盖
+    problem_ir = None
+    if any(l in ["cpp", "py"] for l in languages):
+        problem_ir = load_problem_ir(test_cases, meta_data, content, base_dir)
+        if not (base_dir / CASES_FILE_NAME).exists():
+            case_data = dump_cases(problem_ir) if problem_ir and test_cases else ""
+            cases_file = write_cases(base_dir, case_data)
+            info("测试用例数据已写入: %s", cases_file)
 
     for lang in languages:
         if lang == "md" and difficulty != "Hard":
@@ -159,84 +177,44 @@ def create_directory_structure(problem_info, lang=None):
 
         output_file = base_dir / f"solution.{lang}"
 
-        with open(template_file, "r", encoding="utf-8") as f:
-            template = f.read()
-
-        # 替换模板中的标记
-        template = template.replace("{{problem_id}}", problem_id)
-        template = template.replace("{{problem_title}}", problem_info["title"])
-        template = template.replace("{{problem_slug}}", problem_info["title_slug"])
-        template = template.replace("{{difficulty}}", difficulty)
+        # 模板编译一次后缓存，Solution类和测试函数作为命名区块填入
+        template = load_template(template_file)
+        sections = {}
 
         # 添加LeetCode提供的代码片段
         leetcode_lang = LANGUAGE_MAP.get(lang)
         if leetcode_lang and leetcode_lang in code_snippets:
             code_snippet = code_snippets[leetcode_lang]
-            print(f"\n[调试] 处理{lang}语言的代码片段:")
-            print(f"代码片段前几行: {code_snippet.split('\n')[:3]}")
+            debug("处理%s语言的代码片段，前几行: %s", lang, code_snippet[:200])
 
             # 使用代码生成器工厂获取对应语言的代码生成器
             try:
                 if lang in ["cpp", "py"]:
                     generator = CodeGeneratorFactory.get_generator(lang)
-                    print(f"[调试] 使用代码生成器: {type(generator).__name__}")
-
-                    # 替换Solution类
-                    template = generator.replace_solution_class(template, code_snippet)
-
-                    # 查找模板中的测试函数部分
-                    test_function_patterns = {
-                        "cpp": r"// 测试函数\nvoid test_solution\(\)[^{]*\{(?:(?!\n}$)[\s\S])*\n}",
-                        "py": r"# 测试函数\ndef test_solution\(\):.+?(?=\n\n|\Z)",
-                    }
-
-                    pattern = test_function_patterns.get(lang)
-                    if pattern:
-                        # 生成测试代码
-                        print(f"[调试] 为{lang}生成测试代码")
-                        print(f"测试用例: {test_cases}")
-                        print(
-                            f"元数据: {json.dumps(meta_data, indent=2, ensure_ascii=False)[:200]}..."
-                        )
-
-                        # 修改: 将完整的题目描述内容传递给测试用例解析器
-                        # 使用原始内容而不是修改后的内容，确保包含所有示例
-                        test_code = generator.create_test_code(
-                            test_cases, meta_data, code_snippet, content
-                        )
-                        print(
-                            f"[调试] 生成的测试代码前几行: {test_code.split('\n')[:3]}"
-                        )
-
-                        # 替换模板中的测试函数部分
-                        template = re.sub(pattern, test_code, template, flags=re.DOTALL)
+                    debug("使用代码生成器: %s", type(generator).__name__)
+
+                    sections["solution"] = generator.format_solution_class(
+                        code_snippet
+                    )
+
+                    # 生成测试代码，没有测试代码时保留模板中的默认测试函数
+                    with span("generate", lang=lang):
+                        test_code = generator.create_test_code(problem_ir, code_snippet)
+                    debug("生成的%s测试代码共 %s 行", lang, test_code.count("\n") + 1)
+                    if test_code:
+                        sections["test"] = test_code
             except Exception as e:
                 print(f"警告: 生成测试代码时出错 ({lang}): {str(e)}")
-                # 失败时使用原来的方式
-                if lang == "cpp":
-                    # 替换Solution类
-                    if (
-                        "class Solution" in template
-                        and "class Solution" in code_snippet
-                    ):
-                        template = re.sub(
-                            r"class Solution\s*{[^}]*}", code_snippet, template
-                        )
-                elif lang == "py":
-                    # 替换Solution类
-                    if (
-                        "class Solution" in template
-                        and "class Solution" in code_snippet
-                    ):
-                        template = re.sub(
-                            r"class Solution:.*?pass",
-                            code_snippet,
-                            template,
-                            flags=re.DOTALL,
-                        )
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(template)
+                # 失败时直接使用代码片段作为Solution类
+                sections["solution"] = code_snippet
+
+        content = template.render(variables, sections)
+        if not content.endswith("\n"):
+            content += "\n"
+        with span("write", file=output_file.name), open(
+            output_file, "w", encoding="utf-8"
+        ) as f:
+            f.write(content)
 
     print(f"题目 {problem_id} 的目录结构和文件已创建在: {base_dir}")
     print(f"题目标签: {', '.join(topics)}")
@@ -249,9 +227,16 @@ def main():
     """主函数"""
     if len(sys.argv) < 2:
         print("用法: python create_problem.py 题号 [编程语言]")
+        print("      python create_problem.py --regen 题号|all")
         print("支持的语言: cpp, py, md, all")
         return
 
+    if sys.argv[1] == "--regen":
+        from harness_regen import regenerate_workspace
+
+        regenerate_workspace(sys.argv[2] if len(sys.argv) > 2 else "all")
+        return
+
     problem_id = sys.argv[1]
     lang = sys.argv[2] if len(sys.argv) > 2 else "py"  # 默认为py，而不是all
 
@@ -9,12 +9,11 @@ LeetCode每日一题获取工具
 
 import os
 import sys
-import subprocess
-from pathlib import Path
 
 # 导入LeetCode API客户端
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from leetcode_api import LeetCodeAPI
+from create_problem import create_directory_structure, get_problem_info
+from leetcode_api import get_shared_api
 
 
 def create_daily_question(lang="all"):
@@ -23,7 +22,7 @@ def create_daily_question(lang="all"):
 
     try:
         # 使用API客户端获取每日一题
-        api = LeetCodeAPI()
+        api = get_shared_api()
         daily_question = api.get_daily_question()
 
         if not daily_question:
@@ -39,18 +38,13 @@ def create_daily_question(lang="all"):
         print(f"标题: {title}")
         print(f"难度: {difficulty}")
 
-        # 调用create_problem.py创建题目目录和文件
-        create_problem_script = Path("Scripts") / "create_problem.py"
-
-        if not create_problem_script.exists():
-            print(f"错误: 找不到创建题目的脚本 {create_problem_script}")
-            return
-
         print(f"\n正在创建题目 {question_id} 的解决方案...")
 
-        # 使用subprocess调用create_problem.py脚本
-        cmd = [sys.executable, str(create_problem_script), question_id, lang]
-        subprocess.run(cmd, check=True)
+        # 在当前进程中创建题目目录和文件，复用已导入的模块和API客户端
+        problem_info = get_problem_info(question_id)
+        if not problem_info:
+            return
+        create_directory_structure(problem_info, lang)
 
         print(f"您可以开始解题了！")
 
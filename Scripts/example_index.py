@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+LeetCode示例索引 - 将题目描述中的示例一次性解析为结构化数据
+
+题目描述只扫描一遍，按出现顺序得到每个示例的输入绑定（参数名 = 值）、
+输出和解释。之后按用例下标查找期望输出是O(1)操作，不再对每个用例、
+每种输出类型重复搜索整个题目描述。
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from html_converter import convert_statement, is_html
+from lc_trace import debug
+from leetcode_literal import LiteralParseError, parse_value_at
+
+# 示例标题，如"示例 1："或"Example 1:"
+_EXAMPLE_HEADER = re.compile(r"(?:示例|Example)\s*(\d+)\s*[:：]", re.IGNORECASE)
+
+# 示例之后的其他部分，最后一个示例在此处结束
+_SECTION_END = re.compile(
+    r"提示\s*[:：]|进阶\s*[:：]|Constraints\s*:|Follow[- ]up|^## ",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# 示例中的字段标签
+_FIELD_LABEL = re.compile(
+    r"(输入|Input|输出|Output|解释|Explanation)\s*[:：]", re.IGNORECASE
+)
+
+_FIELD_NAMES = {
+    "输入": "input",
+    "input": "input",
+    "输出": "output",
+    "output": "output",
+    "解释": "explanation",
+    "explanation": "explanation",
+}
+
+# 输入中的参数绑定，如"nums = "
+_BINDING_NAME = re.compile(r"\s*([A-Za-z_]\w*)\s*=(?!=)\s*")
+
+
+class Example:
+    """题目描述中的一个示例"""
+
+    def __init__(self, number: int):
+        self.number = number
+        # 输入绑定列表，元素为(参数名, 值)，没有参数名时为(None, 值)
+        self.inputs: List[Tuple[Optional[str], Any]] = []
+        # 输出的原始文本
+        self.output = ""
+        self.explanation = ""
+
+
+def _parse_bindings(text: str, start: int, end: int) -> List[Tuple[Optional[str], Any]]:
+    """解析输入中的参数绑定，如 nums = [2,7,11,15], target = 9"""
+    bindings = []
+    pos = start
+    while pos < end:
+        while pos < end and (text[pos].isspace() or text[pos] == ","):
+            pos += 1
+        if pos >= end:
+            break
+        name = None
+        match = _BINDING_NAME.match(text, pos, end)
+        if match:
+            name = match.group(1)
+            pos = match.end()
+        value, pos = parse_value_at(text, pos)
+        if pos > end:
+            raise LiteralParseError("输入值超出了示例范围", text, end)
+        bindings.append((name, value))
+    return bindings
+
+
+def _value_text(text: str, start: int, end: int) -> str:
+    """提取字段开头的一个值的原始文本，无法解析时取字段的第一行"""
+    try:
+        _, value_end = parse_value_at(text, start)
+        if value_end <= end:
+            return text[start:value_end].strip()
+    except LiteralParseError:
+        pass
+    return text[start:end].strip().split("\n", 1)[0].strip()
+
+
+def _parse_fields(example: Example, text: str, start: int, end: int):
+    """解析一个示例中的输入、输出和解释字段"""
+    labels = list(_FIELD_LABEL.finditer(text, start, end))
+    for j, label in enumerate(labels):
+        field = _FIELD_NAMES[label.group(1).lower()]
+        field_start = label.end()
+        field_end = labels[j + 1].start() if j + 1 < len(labels) else end
+        if field == "input":
+            try:
+                example.inputs = _parse_bindings(text, field_start, field_end)
+            except LiteralParseError as e:
+                debug("示例 %s 的输入解析失败: %s", example.number, e)
+                example.inputs = []
+        elif field == "output":
+            example.output = _value_text(text, field_start, field_end)
+        else:
+            example.explanation = text[field_start:field_end].strip()
+
+
+def parse_examples(content: str) -> List[Example]:
+    """按出现顺序解析题目描述中的所有示例
+
+    HTML格式的题目描述由转换器按文档结构切分示例，纯文本则按示例标题切分。
+    """
+    examples = []
+    if not content:
+        return examples
+
+    if is_html(content):
+        for number, text in convert_statement(content).examples:
+            example = Example(number)
+            _parse_fields(example, text, 0, len(text))
+            examples.append(example)
+        return examples
+
+    headers = list(_EXAMPLE_HEADER.finditer(content))
+    for i, header in enumerate(headers):
+        start = header.end()
+        if i + 1 < len(headers):
+            end = headers[i + 1].start()
+        else:
+            section_end = _SECTION_END.search(content, start)
+            end = section_end.start() if section_end else len(content)
+
+        example = Example(int(header.group(1)))
+        _parse_fields(example, content, start, end)
+        examples.append(example)
+
+    return examples
+
+
+class ExampleIndex:
+    """题目示例的索引，题目描述只解析一次"""
+
+    def __init__(self, content: str):
+        self.examples = parse_examples(content)
+
+    def __len__(self):
+        return len(self.examples)
+
+    def output(self, case_idx: int) -> str:
+        """返回第case_idx个示例的输出文本，不存在时返回空字符串"""
+        if 0 <= case_idx < len(self.examples):
+            return self.examples[case_idx].output
+        return ""
+
+    def cases(self, param_names: List[str]) -> List[Dict[str, Any]]:
+        """将示例转换为测试用例，输入按参数名对应到方法参数的顺序
+
+        输入没有参数名时按位置对应；参数数量或名称不匹配的示例会被跳过。
+        """
+        cases = []
+        for example in self.examples:
+            if len(example.inputs) != len(param_names):
+                continue
+            names = [name for name, _ in example.inputs]
+            if all(name is None for name in names):
+                inputs = [value for _, value in example.inputs]
+            elif sorted(names) == sorted(param_names):
+                bound = dict(example.inputs)
+                inputs = [bound[name] for name in param_names]
+            else:
+                continue
+            cases.append({"inputs": inputs, "output": example.output})
+        return cases
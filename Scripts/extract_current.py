@@ -10,9 +10,11 @@ LeetCode提取代码辅助脚本
 import os
 import sys
 import re
-import subprocess
 from pathlib import Path
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from test_solution import extract_solution, find_solution_file
+
 
 def get_current_file():
     """获取当前VSCode打开文件的路径"""
@@ -80,19 +82,16 @@ def main():
             print("支持的语言: py, cpp")
             return
 
-    # 调用test_solution.py提取代码
-    cmd = [sys.executable, "Scripts/test_solution.py", problem_id, lang, "--extract"]
-
-    if auto_open:
-        cmd.append("--open")
-
     print(f"正在提取题号 {problem_id} 的 {lang} 解决方案...")
 
-    # 执行命令
+    # 在当前进程中提取代码，与test_solution.py --extract相同
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"提取代码时出错: {str(e)}")
+        solution_file = find_solution_file(problem_id, lang)
+        if not solution_file:
+            print(f"错误: 找不到题号 {problem_id} 的 {lang} 解决方案")
+            return
+        print(f"找到解决方案文件: {solution_file}")
+        extract_solution(solution_file, lang, problem_id, auto_open)
     except Exception as e:
         print(f"执行过程中出错: {str(e)}")
 
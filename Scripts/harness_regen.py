@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+LeetCode测试代码重新生成 - 只替换解决方案文件中的测试代码，保留用户的解题代码
+
+解决方案文件中的测试代码位于两行标记之间:
+    # 测试函数 ... # 测试函数结束          (Python)
+    // 测试函数 ... // 测试函数结束        (C++)
+重新生成时从题目目录中保存的题目信息（problem.json.gz，较早创建的题目使用
+.problem_ir.json中保存的中间表示）构建中间表示，用当前的代码生成器生成测试代码
+并替换标记之间的内容，标记之外的内容保持不变；README.md也按当前的模板重新渲染。
+cases.jsonl中已有的用例（包括用户添加的）保持不变，只追加新解析出的示例。
+没有结束标记的旧文件按模板的布局确定测试代码的范围，并补上结束标记。
+
+各题目在进程池中并行处理，只写入内容实际发生变化的文件。
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from case_ir import load_problem_ir, load_saved_problem_ir
+from code_generators import CodeGeneratorFactory
+from create_problem import render_readme
+from lc_trace import debug, span
+from problem_store import find_problem_dirs, load_problem_info
+from test_case_store import CASES_FILE_NAME, dump_cases, merge_cases
+
+# 各语言测试代码的开始和结束标记（独占一行）
+HARNESS_MARKERS = {
+    "cpp": ("// 测试函数", "// 测试函数结束"),
+    "py": ("# 测试函数", "# 测试函数结束"),
+}
+
+# 旧版Python文件中紧跟测试代码的入口
+_PY_MAIN_PATTERN = re.compile(r'^if __name__ == "__main__":', re.MULTILINE)
+
+
+def splice_harness(source: str, lang: str, test_code: str) -> Optional[str]:
+    """将解决方案文件中的测试代码替换为test_code，找不到开始标记时返回None"""
+    begin, end = HARNESS_MARKERS[lang]
+    begin_match = re.search(rf"^{re.escape(begin)}$", source, re.MULTILINE)
+    if not begin_match:
+        return None
+    start = begin_match.start()
+    harness = test_code.strip("\n") + "\n"
+
+    end_match = re.compile(rf"^{re.escape(end)}$", re.MULTILINE).search(source, start)
+    if end_match:
+        return source[:start] + harness + source[end_match.start() :]
+
+    # 旧文件没有结束标记: C++测试代码直到文件末尾，Python测试代码直到入口之前
+    rest = ""
+    if lang == "py":
+        main_match = _PY_MAIN_PATTERN.search(source, start)
+        if main_match:
+            rest = "\n\n" + source[main_match.start() :]
+    return source[:start] + harness + end + "\n" + rest
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """内容与文件现有内容不同时才写入，返回是否写入"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+def _skip_reason(problem_info: Optional[Dict[str, Any]]) -> str:
+    """无法构建中间表示时跳过题目的原因"""
+    if problem_info is None:
+        return "跳过: 没有保存的题目数据，请重新创建题目"
+    if "params" not in (problem_info.get("meta_data") or {}):
+        # 设计类题目的元数据只有classname和methods，不生成测试代码
+        return "跳过: 设计类题目不生成测试代码"
+    return "跳过: 无法解析保存的题目数据"
+
+
+def regenerate_problem(problem_dir: Path) -> List[Tuple[str, str]]:
+    """重新生成一道题目的测试代码、测试用例数据和README
+
+    返回 [(文件名, 状态)]，状态为"已更新"、"未变化"或跳过的原因。
+    """
+    problem_dir = Path(problem_dir)
+    results = []
+    problem_info = load_problem_info(problem_dir)
+    if problem_info:
+        problem_ir = load_problem_ir(
+            problem_info["test_cases"],
+            problem_info["meta_data"],
+            problem_info["content"],
+            problem_dir,
+        )
+        readme = render_readme(problem_info)
+        changed = write_if_changed(problem_dir / "README.md", readme)
+        results.append(("README.md", "已更新" if changed else "未变化"))
+    else:
+        problem_ir = load_saved_problem_ir(problem_dir)
+    if problem_ir is None:
+        return results + [("", _skip_reason(problem_info))]
+
+    # 用户可能在cases.jsonl中添加了用例，只追加新解析出的示例，不替换已有的用例
+    cases_file = problem_dir / CASES_FILE_NAME
+    if cases_file.exists():
+        added = merge_cases(cases_file, dump_cases(problem_ir))
+        results.append((CASES_FILE_NAME, "已更新" if added else "未变化"))
+
+    for lang in HARNESS_MARKERS:
+        solution_file = problem_dir / f"solution.{lang}"
+        if not solution_file.exists():
+            continue
+
+        with open(solution_file, "r", encoding="utf-8") as f:
+            source = f.read()
+        begin_match = re.search(
+            rf"^{re.escape(HARNESS_MARKERS[lang][0])}$", source, re.MULTILINE
+        )
+        if not begin_match:
+            results.append((solution_file.name, "跳过: 找不到测试代码标记"))
+            continue
+
+        # 测试代码之前的内容（含Solution类）作为代码片段，用于提取方法名和节点类型
+        generator = CodeGeneratorFactory.get_generator(lang)
+        with span("generate", lang=lang, problem=problem_dir.name):
+            test_code = generator.create_test_code(
+                problem_ir, source[: begin_match.start()]
+            )
+        if not test_code:
+            results.append((solution_file.name, "跳过: 没有生成测试代码"))
+            continue
+
+        content = splice_harness(source, lang, test_code)
+        changed = write_if_changed(solution_file, content)
+        results.append((solution_file.name, "已更新" if changed else "未变化"))
+
+    return results
+
+
+def regenerate_workspace(target: str = "all", workers: int = None) -> int:
+    """在进程池中重新生成多道题目的测试代码，返回更新的文件数"""
+    problem_dirs = find_problem_dirs(target)
+    if not problem_dirs:
+        print(f"找不到题目: {target}")
+        return 0
+
+    workers = min(workers or os.cpu_count() or 1, len(problem_dirs))
+    debug("使用 %s 个进程重新生成 %s 道题目", workers, len(problem_dirs))
+
+    if workers == 1:
+        all_results = [regenerate_problem(path) for path in problem_dirs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            all_results = list(executor.map(regenerate_problem, problem_dirs))
+
+    updated = unchanged = skipped = 0
+    for problem_dir, results in zip(problem_dirs, all_results):
+        for file_name, status in results:
+            if status == "已更新":
+                updated += 1
+                print(f"已更新: {problem_dir / file_name}")
+            elif status == "未变化":
+                unchanged += 1
+            else:
+                skipped += 1
+                print(f"{status}: {problem_dir / file_name}")
+
+    print(f"共 {len(problem_dirs)} 道题目: {updated} 个文件已更新，"
+          f"{unchanged} 个文件未变化，{skipped} 个文件跳过")
+    return updated
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+LeetCode题目描述转换器 - 将题目描述的HTML转换为Markdown并提取结构化信息
+
+基于html.parser流式遍历HTML一次，同时得到:
+    - 题目描述的Markdown（保留<pre>代码块、<sup>指数如10^5、列表和图片）
+    - 按顺序排列的示例文本，供示例索引解析输入和输出
+    - 提示（数据范围）部分的Markdown和每个条目
+"""
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# 示例、提示和进阶部分的标题
+_EXAMPLE_HEADER = re.compile(r"(?:示例|Example)\s*(\d+)\s*[:：]?", re.IGNORECASE)
+_CONSTRAINTS_HEADER = re.compile(r"(?:提示|Constraints)\s*[:：]?", re.IGNORECASE)
+_FOLLOW_UP_HEADER = re.compile(r"(?:进阶|Follow[- ]?up)\b", re.IGNORECASE)
+
+# 判断文本是否为HTML
+_HTML_TAG = re.compile(r"<(?:p|pre|div|ul|ol|strong|code)\b", re.IGNORECASE)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 需要与前后内容分段的块级元素
+_BLOCK_TAGS = {"p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote"}
+
+# 通过捕获内容再决定输出形式的行内元素及其Markdown标记
+_INLINE_MARKERS = {"strong": "**", "b": "**", "em": "*", "i": "*", "code": "`"}
+
+
+def is_html(content: str) -> bool:
+    """判断题目描述是否为HTML"""
+    return bool(content) and bool(_HTML_TAG.search(content))
+
+
+class Statement:
+    """转换后的题目描述"""
+
+    def __init__(
+        self,
+        description: str,
+        constraints_markdown: str,
+        constraints: List[str],
+        examples: List[Tuple[int, str]],
+    ):
+        # 题目描述的Markdown，不包含提示部分
+        self.description = description
+        # 提示部分的Markdown
+        self.constraints_markdown = constraints_markdown
+        # 提示中的每个条目（纯文本）
+        self.constraints = constraints
+        # 示例列表，元素为(示例编号, 示例的纯文本)
+        self.examples = examples
+
+
+class _StatementConverter(HTMLParser):
+    """遍历题目描述的HTML，同时生成Markdown、示例文本和提示条目"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._section = "description"
+        self._buffers = {"description": [], "constraints": []}
+        # 行内元素的捕获栈，元素为(标签, Markdown片段, 纯文本片段)
+        self._captures = []
+        self._pre_depth = 0
+        self._pre_start = False
+        self._lists = []
+        self._links = []
+        self._examples = []
+        self._example_text: Optional[List[str]] = None
+        self._constraints = []
+        self._item_text: Optional[List[str]] = None
+
+    # 输出
+
+    def _write(self, markdown: str, plain: str):
+        """将内容写入当前位置：捕获中的行内元素或当前部分的Markdown，以及示例/条目文本"""
+        if self._captures:
+            _, markdown_parts, plain_parts = self._captures[-1]
+            markdown_parts.append(markdown)
+            plain_parts.append(plain)
+            return
+        buffer = self._buffers[self._section]
+        if markdown.startswith(" ") and (not buffer or buffer[-1].endswith("\n")):
+            markdown = markdown.lstrip(" ")
+        if markdown:
+            buffer.append(markdown)
+        if self._example_text is not None:
+            self._example_text.append(plain)
+        if self._item_text is not None:
+            self._item_text.append(plain)
+
+    def _block_break(self):
+        self._write("\n\n", "\n")
+
+    def _finish_example(self):
+        if self._example_text is not None:
+            self._examples[-1] = (self._examples[-1][0], "".join(self._example_text))
+            self._example_text = None
+
+    def _handle_header(self, text: str) -> bool:
+        """处理示例、提示和进阶标题，返回标题是否已被消费（不再输出）"""
+        match = _EXAMPLE_HEADER.fullmatch(text)
+        if match:
+            self._finish_example()
+            self._section = "description"
+            self._examples.append((int(match.group(1)), ""))
+            self._example_text = []
+            return False
+        if _CONSTRAINTS_HEADER.fullmatch(text):
+            self._finish_example()
+            self._section = "constraints"
+            return True
+        if _FOLLOW_UP_HEADER.match(text):
+            self._finish_example()
+            self._section = "description"
+        return False
+
+    # HTMLParser回调
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in _BLOCK_TAGS:
+            self._block_break()
+        elif tag == "br":
+            self._write("\n", "\n")
+        elif tag == "pre":
+            self._write("\n\n```\n", "\n")
+            self._pre_depth += 1
+            self._pre_start = True
+        elif tag in _INLINE_MARKERS:
+            self._captures.append((tag, [], []))
+        elif tag == "sup":
+            self._write("^", "^")
+        elif tag == "sub":
+            self._write("_", "_")
+        elif tag in ("ul", "ol"):
+            self._lists.append([tag, 0])
+        elif tag == "li":
+            indent = "   " * (len(self._lists) - 1) if self._lists else ""
+            marker = "- "
+            if self._lists and self._lists[-1][0] == "ol":
+                self._lists[-1][1] += 1
+                marker = f"{self._lists[-1][1]}. "
+            self._write(f"\n{indent}{marker}", "\n")
+            if self._section == "constraints":
+                self._item_text = []
+        elif tag == "img":
+            alt = attrs.get("alt") or ""
+            src = attrs.get("src") or ""
+            self._write(f"![{alt}]({src})", "")
+        elif tag == "a":
+            self._links.append(attrs.get("href") or "")
+            self._write("[", "")
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_TAGS:
+            self._block_break()
+        elif tag == "pre" and self._pre_depth:
+            self._pre_depth -= 1
+            buffer = self._buffers[self._section]
+            if not self._captures and buffer:
+                # 代码块末尾的换行由结束标记提供
+                buffer[-1] = buffer[-1].rstrip("\n")
+            self._write("\n```\n\n", "\n")
+        elif tag in _INLINE_MARKERS and self._captures and self._captures[-1][0] == tag:
+            _, markdown_parts, plain_parts = self._captures.pop()
+            markdown = "".join(markdown_parts)
+            plain = "".join(plain_parts)
+            if tag in ("strong", "b") and self._handle_header(plain.strip()):
+                return
+            if not self._pre_depth and markdown.strip():
+                # 标记紧贴文本，首尾空白放在标记之外
+                marker = _INLINE_MARKERS[tag]
+                stripped = markdown.strip()
+                lead = " " if markdown[0].isspace() else ""
+                trail = " " if markdown[-1].isspace() else ""
+                markdown = f"{lead}{marker}{stripped}{marker}{trail}"
+            self._write(markdown, plain)
+        elif tag in ("ul", "ol") and self._lists:
+            self._lists.pop()
+            if not self._lists:
+                self._block_break()
+        elif tag == "li" and self._item_text is not None:
+            item = _WHITESPACE.sub(" ", "".join(self._item_text)).strip()
+            self._item_text = None
+            if item:
+                self._constraints.append(item)
+        elif tag == "a" and self._links:
+            self._write(f"]({self._links.pop()})", "")
+
+    def handle_data(self, data):
+        if self._pre_depth:
+            if self._pre_start:
+                data = data.lstrip("\n")
+                self._pre_start = False
+            text = data.replace("\xa0", " ")
+        else:
+            text = _WHITESPACE.sub(" ", data.replace("\xa0", " "))
+        if text:
+            self._write(text, text)
+
+    # 结果
+
+    def result(self) -> Statement:
+        self.close()
+        while self._captures:
+            # 未闭合的行内元素按原样输出
+            _, markdown_parts, plain_parts = self._captures.pop()
+            self._write("".join(markdown_parts), "".join(plain_parts))
+        self._finish_example()
+
+        def tidy(parts):
+            markdown = "".join(parts)
+            markdown = re.sub(r"[ \t]+\n", "\n", markdown)
+            markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+            return markdown.strip()
+
+        return Statement(
+            tidy(self._buffers["description"]),
+            tidy(self._buffers["constraints"]),
+            self._constraints,
+            self._examples,
+        )
+
+
+@lru_cache(maxsize=16)
+def convert_statement(html_content: str) -> Statement:
+    """转换题目描述的HTML，同一内容只转换一次（结果不应被修改）"""
+    converter = _StatementConverter()
+    converter.feed(html_content or "")
+    return converter.result()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+LeetCode命令入口 - VS Code任务使用的轻量客户端
+
+后台服务（lc_daemon.py）正在运行时，把命令转发给服务执行；否则在当前进程中
+直接执行，结果与直接运行对应的脚本相同。
+用法: python lc.py 命令 [参数 ...]
+示例: python lc.py create_problem 100 cpp
+      python lc.py test_solution 100 py
+支持的命令: create_problem, daily_question, test_solution, extract_current
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from lc_daemon import COMMANDS, run_command, send_request
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print("用法: python lc.py 命令 [参数 ...]")
+        print(f"支持的命令: {', '.join(COMMANDS)}")
+        return 2
+
+    command, args = sys.argv[1], sys.argv[2:]
+    sys.stdout.flush()
+    response = send_request(
+        {
+            "action": "run",
+            "command": command,
+            "args": args,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        },
+        fds=(0, 1, 2),
+    )
+    if response and "exit" in response:
+        return response["exit"]
+
+    # 后台服务未运行或要求客户端自行执行
+    return run_command(command, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
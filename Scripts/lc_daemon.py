@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+LeetCode常驻后台服务 - 保持脚本模块、API会话和各种缓存常驻内存，加快VS Code任务
+
+每个VS Code任务原本都会启动新的解释器，重新导入gql、requests和代码生成器，
+并重新创建API客户端。启动后台服务后，任务通过Scripts/lc.py把命令行参数经
+Unix域套接字转发给服务，由服务在已预热的进程中执行命令。
+
+客户端连同请求一起传递自己的标准输入、输出和错误的文件描述符以及全部环境变量，
+服务执行命令期间将其替换为进程的0/1/2号描述符和环境变量，因此命令的输出（包括
+g++等子进程的输出）直接写入客户端所在的终端，input()也从客户端读取，LC_TRACE
+等设置与直接运行相同。服务一次只执行一个命令。
+
+套接字位于$XDG_RUNTIME_DIR，或临时目录中只有当前用户可以访问（0700）的目录；
+客户端和服务都用SO_PEERCRED检查对方是否是同一用户，不会把终端交给其他用户的进程。
+
+后台服务是可选的: 服务未运行或平台不支持Unix域套接字（如Windows）时，
+lc.py在当前进程中直接执行命令，行为与直接运行脚本相同。脚本修改后，服务会在
+处理下一个请求前重新启动，避免执行旧代码。
+
+用法:
+    python lc_daemon.py            # 在前台启动后台服务
+    python lc_daemon.py --status   # 查看服务是否在运行
+    python lc_daemon.py --stop     # 停止服务
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
+
+# 可以通过后台服务执行的命令（Scripts目录下的脚本名）
+COMMANDS = ("create_problem", "daily_question", "test_solution", "extract_current")
+
+# 单条请求或响应的最大长度，请求中包括客户端的全部环境变量
+MESSAGE_SIZE = 1 << 20
+
+
+def supported() -> bool:
+    """当前平台是否支持通过Unix域套接字传递文件描述符"""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def _private_dir() -> str:
+    """存放套接字的目录: $XDG_RUNTIME_DIR，或临时目录中只有当前用户可以访问的目录
+
+    目录已存在但属于其他用户或权限不是0700时抛出OSError。
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    directory = os.path.join(tempfile.gettempdir(), f"lc-daemon-{os.getuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) != 0o700
+    ):
+        raise OSError(f"套接字目录不安全（应为当前用户所有且权限为0700）: {directory}")
+    return directory
+
+
+def socket_path(workspace: Path = None) -> str:
+    """工作区对应的套接字路径，可通过LC_DAEMON_SOCKET环境变量指定"""
+    if os.environ.get("LC_DAEMON_SOCKET"):
+        return os.environ["LC_DAEMON_SOCKET"]
+    workspace = Path(workspace or os.getcwd()).resolve()
+    digest = hashlib.sha1(str(workspace).encode("utf-8")).hexdigest()[:12]
+    # 套接字路径长度有限制，放在运行时目录而不是工作区中
+    return os.path.join(_private_dir(), f"lc-daemon-{digest}.sock")
+
+
+def same_user(conn: socket.socket) -> bool:
+    """套接字另一端的进程是否属于当前用户；不支持SO_PEERCRED的平台只依赖目录权限"""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def run_command(command: str, args) -> int:
+    """在当前进程中执行命令，返回退出码"""
+    if command not in COMMANDS:
+        print(f"不支持的命令: {command}")
+        print(f"支持的命令: {', '.join(COMMANDS)}")
+        return 2
+
+    from lc_trace import flush_trace
+
+    module = importlib.import_module(command)
+    saved_argv = sys.argv
+    sys.argv = [str(SCRIPTS_DIR / f"{command}.py"), *args]
+    try:
+        result = module.main()
+        return result if isinstance(result, int) else 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        sys.argv = saved_argv
+        flush_trace()
+
+
+def send_request(request, fds=()):
+    """连接后台服务并发送请求，返回服务的响应；服务未运行时返回None"""
+    if not supported():
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path())
+        if not same_user(client):
+            print("警告: 后台服务的套接字属于其他用户，已忽略")
+            return None
+        socket.send_fds(client, [json.dumps(request).encode("utf-8")], list(fds))
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = client.recv(MESSAGE_SIZE)
+            if not chunk:
+                break
+            data += chunk
+        return json.loads(data) if data else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        client.close()
+
+
+def _source_mtime() -> int:
+    """脚本文件的最新修改时间，用于检测代码更新"""
+    return max(
+        path.stat().st_mtime_ns
+        for pattern in ("*.py", "code_generators/*.py")
+        for path in SCRIPTS_DIR.glob(pattern)
+    )
+
+
+class Daemon:
+    """后台服务，顺序处理客户端的请求"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started_mtime = _source_mtime()
+        self.running = True
+        # 脚本修改后停止接受请求，并在退出前重新启动
+        self.reload = False
+
+    def preload(self):
+        """预先导入所有命令的模块，并创建共享的API客户端"""
+        for command in COMMANDS:
+            importlib.import_module(command)
+        try:
+            from leetcode_api import get_shared_api
+
+            get_shared_api()
+        except Exception as e:
+            print(f"创建API客户端失败，将在首次请求时重试: {e}")
+
+    def serve(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # 创建时即只有当前用户可以连接
+        saved_umask = os.umask(0o077)
+        try:
+            server.bind(self.path)
+        finally:
+            os.umask(saved_umask)
+        server.listen()
+        print(f"后台服务已启动: {self.path}")
+        try:
+            while self.running:
+                conn, _ = server.accept()
+                with conn:
+                    if same_user(conn):
+                        self.handle(conn)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+        if not self.running and self.reload:
+            print("脚本已修改，正在重新启动后台服务...")
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+        print("后台服务已停止")
+
+    def handle(self, conn):
+        try:
+            data, fds, _, _ = socket.recv_fds(conn, MESSAGE_SIZE, 3)
+            request = json.loads(data)
+        except (OSError, ValueError):
+            return
+
+        try:
+            action = request.get("action", "run")
+            if action == "ping":
+                response = {"pid": os.getpid()}
+            elif action == "stop":
+                self.running = False
+                response = {"stopped": True}
+            elif _source_mtime() != self.started_mtime:
+                # 脚本已修改: 让客户端在自己的进程中执行，服务随后重新启动
+                self.running = False
+                self.reload = True
+                response = {"fallback": True}
+            elif len(fds) != 3:
+                response = {"fallback": True}
+            else:
+                response = {"exit": self.execute(request, fds)}
+        finally:
+            for fd in fds:
+                os.close(fd)
+        conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+
+    def execute(self, request, fds) -> int:
+        """使用客户端的标准输入输出和工作目录执行命令"""
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+        saved_cwd = os.getcwd()
+        saved_env = dict(os.environ)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        try:
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request.get("env", {}))
+            return run_command(request["command"], request.get("args", []))
+        except Exception:
+            traceback.print_exc()
+            return 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for target, fd in enumerate(saved_fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+
+def main():
+    """主函数"""
+    if not supported():
+        print("当前平台不支持Unix域套接字，无法启动后台服务；lc.py会直接执行命令")
+        return 1
+
+    if "--status" in sys.argv:
+        response = send_request({"action": "ping"})
+        if response:
+            print(f"后台服务正在运行 (pid {response['pid']}): {socket_path()}")
+            return 0
+        print("后台服务未运行")
+        return 1
+
+    if "--stop" in sys.argv:
+        if send_request({"action": "stop"}):
+            print("后台服务已停止")
+            return 0
+        print("后台服务未运行")
+        return 1
+
+    if send_request({"action": "ping"}):
+        print(f"后台服务已经在运行: {socket_path()}")
+        return 0
+
+    try:
+        daemon = Daemon(socket_path())
+    except OSError as e:
+        print(f"无法启动后台服务: {e}")
+        return 1
+    daemon.preload()
+    daemon.serve()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
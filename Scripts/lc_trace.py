@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+LeetCode工具追踪 - 分级的调试输出和各阶段的计时区间
+
+默认关闭，通过环境变量开启:
+    LC_TRACE=1          输出各阶段（获取、解析、生成、写入）的耗时和摘要信息
+    LC_TRACE=2          另外输出逐个测试用例的详细调试信息
+    LC_TRACE_FILE=路径   将计时区间导出为Chrome trace event格式的JSON，
+                        可在chrome://tracing或Perfetto中查看
+
+调试信息使用惰性格式化: 消息模板和参数只在对应级别开启时才格式化，
+关闭时每次调用只读取一次环境变量，不会产生终端输出。环境变量在每次调用时读取，
+因此后台服务（lc_daemon.py）执行命令时使用的是客户端的设置；计时区间在命令
+结束时（flush_trace）或进程退出时写入LC_TRACE_FILE。
+
+用法:
+    from lc_trace import debug, info, lazy_json, span
+
+    with span("parse", problem=problem_id):
+        debug("参数信息: %s", lazy_json(params_info))
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+# 追踪级别
+INFO = 1
+DEBUG = 2
+
+
+def trace_level() -> int:
+    """读取LC_TRACE环境变量，非数字的非空值视为INFO级别"""
+    value = os.environ.get("LC_TRACE", "").strip()
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        return INFO
+
+
+def trace_file():
+    """LC_TRACE_FILE环境变量指定的追踪文件，未设置时为None"""
+    return os.environ.get("LC_TRACE_FILE") or None
+
+
+# 记录的计时区间（Chrome trace event），只在设置了LC_TRACE_FILE时记录
+_events = []
+_origin_ns = time.perf_counter_ns()
+
+
+def enabled(level: int = DEBUG) -> bool:
+    """指定级别的追踪是否开启，用于跳过只为调试输出而做的计算"""
+    return trace_level() >= level
+
+
+class lazy_json:
+    """惰性的JSON格式化参数，只有在消息实际输出时才调用json.dumps"""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit: int = None):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        text = json.dumps(self.value, ensure_ascii=False, default=str)
+        if self.limit is not None and len(text) > self.limit:
+            return text[: self.limit] + "..."
+        return text
+
+
+def _emit(message: str, args: tuple):
+    if args:
+        message = message % args
+    print(f"[调试] {message}")
+
+
+def info(message: str, *args):
+    """输出摘要信息（LC_TRACE>=1），参数按%格式化"""
+    if trace_level() >= INFO:
+        _emit(message, args)
+
+
+def debug(message: str, *args):
+    """输出详细调试信息（LC_TRACE>=2），参数按%格式化"""
+    if trace_level() >= DEBUG:
+        _emit(message, args)
+
+
+class _Span:
+    """一个计时区间，结束时输出耗时并记录为trace event"""
+
+    __slots__ = ("name", "args", "start_ns")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        if trace_file():
+            _events.append(
+                {
+                    "name": self.name,
+                    "cat": "leetcode",
+                    "ph": "X",
+                    "ts": (self.start_ns - _origin_ns) / 1000,
+                    "dur": duration_ns / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {key: str(value) for key, value in self.args.items()},
+                }
+            )
+        if trace_level() >= INFO:
+            details = " ".join(f"{key}={value}" for key, value in self.args.items())
+            suffix = f" ({details})" if details else ""
+            print(f"[追踪] {self.name}{suffix}: {duration_ns / 1e6:.3f} ms")
+        return False
+
+
+class _NullSpan:
+    """追踪关闭时使用的空区间"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **args):
+    """创建一个计时区间，用于with语句；追踪关闭时返回共享的空区间"""
+    if trace_level() < INFO and not trace_file():
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def export_trace(path: str):
+    """将记录的计时区间写入Chrome trace event格式的JSON文件"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"traceEvents": _events, "displayTimeUnit": "ms"},
+            f,
+            ensure_ascii=False,
+        )
+
+
+def flush_trace():
+    """将记录的计时区间写入LC_TRACE_FILE并清空，每个命令结束时调用"""
+    path = trace_file()
+    if _events and path:
+        try:
+            export_trace(path)
+        except OSError as e:
+            print(f"[追踪] 导出追踪文件失败: {e}")
+    _events.clear()
+
+
+atexit.register(flush_trace)
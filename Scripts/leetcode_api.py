@@ -23,6 +23,44 @@ LEETCODE_CN_API_URL = "https://leetcode.cn/graphql"
 LEETCODE_CN_PROBLEMS_URL = "https://leetcode.cn/api/problems/all/"
 
 
+def problem_info_from_question(question: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将questionData查询返回的题目数据转换为题目信息字典
+
+    Args:
+        question: GraphQL查询结果中的question对象
+
+    Returns:
+        字典，包含题目的详细信息
+    """
+    # 处理元数据
+    meta_data = {}
+    try:
+        if question.get("metaData"):
+            meta_data = json.loads(question.get("metaData", "{}"))
+    except Exception as e:
+        logger.warning(f"解析元数据时出错: {str(e)}")
+
+    # 构建题目信息字典
+    return {
+        "id": question["questionFrontendId"],
+        "title": question["translatedTitle"] or question["title"],
+        "title_slug": question["titleSlug"],
+        "difficulty": question["difficulty"],
+        "topics": [
+            tag["translatedName"] or tag["name"] for tag in question["topicTags"]
+        ],
+        "content": question["translatedContent"] or question["content"],
+        "code_snippets": {
+            snippet["langSlug"]: snippet["code"]
+            for snippet in question["codeSnippets"]
+        },
+        "test_cases": question.get("exampleTestcases", "")
+        or question.get("sampleTestCase", ""),
+        "meta_data": meta_data,
+    }
+
+
 class LeetCodeAPI:
     """LeetCode API客户端类"""
 
@@ -97,18 +135,16 @@ class LeetCodeAPI:
             logger.error(f"获取每日一题失败: {str(e)}")
             raise
 
-    def get_problem_details(self, title_slug: str) -> Dict[str, Any]:
+    def get_question_data(self, title_slug: str) -> Dict[str, Any]:
         """
-        获取题目详情
+        获取questionData查询返回的原始题目数据
 
         Args:
             title_slug: 题目的标题Slug
 
         Returns:
-            字典，包含题目的详细信息
+            GraphQL查询结果中的question对象
         """
-        logger.info(f"正在获取题目详情: {title_slug}")
-
         # 定义GraphQL查询
         query = gql(
             """
@@ -140,40 +176,27 @@ class LeetCodeAPI:
         """
         )
 
-        try:
-            # 执行查询
-            variables = {"titleSlug": title_slug}
-            result = self.client.execute(query, variable_values=variables)
+        # 执行查询
+        variables = {"titleSlug": title_slug}
+        result = self.client.execute(query, variable_values=variables)
+        return result["question"]
 
-            question = result["question"]
+    def get_problem_details(self, title_slug: str) -> Dict[str, Any]:
+        """
+        获取题目详情
 
-            # 处理元数据
-            meta_data = {}
-            try:
-                if question.get("metaData"):
-                    meta_data = json.loads(question.get("metaData", "{}"))
-            except Exception as e:
-                logger.warning(f"解析元数据时出错: {str(e)}")
+        Args:
+            title_slug: 题目的标题Slug
 
-            # 构建题目信息字典
-            problem_info = {
-                "id": question["questionFrontendId"],
-                "title": question["translatedTitle"] or question["title"],
-                "title_slug": question["titleSlug"],
-                "difficulty": question["difficulty"],
-                "topics": [
-                    tag["translatedName"] or tag["name"]
-                    for tag in question["topicTags"]
-                ],
-                "content": question["translatedContent"] or question["content"],
-                "code_snippets": {
-                    snippet["langSlug"]: snippet["code"]
-                    for snippet in question["codeSnippets"]
-                },
-                "test_cases": question.get("exampleTestcases", "")
-                or question.get("sampleTestCase", ""),
-                "meta_data": meta_data,
-            }
+        Returns:
+            字典，包含题目的详细信息
+        """
+        logger.info(f"正在获取题目详情: {title_slug}")
+
+        try:
+            problem_info = problem_info_from_question(
+                self.get_question_data(title_slug)
+            )
 
             logger.info(
                 f"成功获取题目详情: {problem_info['id']} - {problem_info['title']}"
@@ -184,53 +207,72 @@ class LeetCodeAPI:
             logger.error(f"获取题目详情失败: {str(e)}")
             raise
 
-    def get_problem_by_id(self, problem_id: str) -> Dict[str, Any]:
+    def get_title_slug(self, problem_id: str) -> str:
         """
-        根据题号获取题目详情
+        根据题号查找题目的标题Slug
 
         Args:
             problem_id: 题目ID
 
         Returns:
-            字典，包含题目的详细信息
+            题目的标题Slug
         """
-        logger.info(f"正在获取题号为 {problem_id} 的题目信息")
+        # LeetCode中国站的API与国际版不同，需要先通过problems/all接口获取titleSlug
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        }
+        response = requests.get(LEETCODE_CN_PROBLEMS_URL, headers=headers)
 
-        try:
-            # LeetCode中国站的API与国际版不同，需要先通过problems/all接口获取titleSlug
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            }
-            response = requests.get(LEETCODE_CN_PROBLEMS_URL, headers=headers)
+        if response.status_code != 200:
+            logger.error(f"获取题目列表失败，状态码: {response.status_code}")
+            raise Exception(f"API请求失败，状态码: {response.status_code}")
 
-            if response.status_code != 200:
-                logger.error(f"获取题目列表失败，状态码: {response.status_code}")
-                raise Exception(f"API请求失败，状态码: {response.status_code}")
+        problems_data = response.json()
 
-            problems_data = response.json()
-            title_slug = None
+        # 在问题列表中找到对应题号的题目
+        for problem in problems_data.get("stat_status_pairs", []):
+            if str(problem["stat"]["frontend_question_id"]) == str(problem_id):
+                title_slug = problem["stat"]["question__title_slug"]
+                logger.info(f"找到题号 {problem_id} 对应的title_slug: {title_slug}")
+                return title_slug
 
-            # 在问题列表中找到对应题号的题目
-            for problem in problems_data.get("stat_status_pairs", []):
-                if str(problem["stat"]["frontend_question_id"]) == str(problem_id):
-                    title_slug = problem["stat"]["question__title_slug"]
-                    break
+        logger.error(f"找不到题号为 {problem_id} 的题目")
+        raise ValueError(f"找不到题号为 {problem_id} 的题目")
 
-            if not title_slug:
-                logger.error(f"找不到题号为 {problem_id} 的题目")
-                raise ValueError(f"找不到题号为 {problem_id} 的题目")
+    def get_problem_by_id(self, problem_id: str) -> Dict[str, Any]:
+        """
+        根据题号获取题目详情
 
-            logger.info(f"找到题号 {problem_id} 对应的title_slug: {title_slug}")
+        Args:
+            problem_id: 题目ID
+
+        Returns:
+            字典，包含题目的详细信息
+        """
+        logger.info(f"正在获取题号为 {problem_id} 的题目信息")
 
+        try:
             # 通过title_slug获取完整题目详情
-            return self.get_problem_details(title_slug)
+            return self.get_problem_details(self.get_title_slug(problem_id))
 
         except Exception as e:
             logger.error(f"获取题号 {problem_id} 的题目信息失败: {str(e)}")
             raise
 
 
+# 进程内共享的API客户端，后台服务中多次请求复用同一个HTTP会话
+_shared_api: Optional[LeetCodeAPI] = None
+
+
+def get_shared_api() -> LeetCodeAPI:
+    """获取进程内共享的API客户端，首次调用时创建"""
+    global _shared_api
+    if _shared_api is None:
+        _shared_api = LeetCodeAPI()
+    return _shared_api
+
+
 # 使用示例
 if __name__ == "__main__":
     api = LeetCodeAPI()
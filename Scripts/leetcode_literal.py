@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+LeetCode字面量解析器 - 解析测试用例中的参数值
+
+LeetCode测试用例中的值使用类似JSON的语法: 嵌套数组、带转义的双引号字符串、
+null、true/false、负数和浮点数。多个值之间用换行分隔（也允许用逗号分隔）。
+
+解析器由词法分析器和递归下降解析器组成，一次扫描即得到类型化的值
+（list、str、int、float、bool、None），时间复杂度与输入长度成线性关系。
+数组和字符串会先尝试C实现的JSON解码器作为快速路径，失败时再由递归下降
+解析器处理，并给出出错位置的行号和列号。
+"""
+
+import json
+import re
+from typing import Any, Iterator, List, Tuple
+
+# 词法单元: 空白、数字、字符串、标识符（null/true/false）和标点
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>\s+)
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<string>"(?:[^"\\\n]|\\.)*")
+  | (?P<word>[A-Za-z_]\w*)
+  | (?P<punct>[\[\],])
+    """,
+    re.VERBOSE,
+)
+
+# 字面量关键字，兼容Python风格的写法
+_KEYWORDS = {
+    "null": None,
+    "None": None,
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+}
+
+# 快速路径使用的JSON解码器
+_DECODER = json.JSONDecoder()
+
+
+class LiteralParseError(ValueError):
+    """字面量解析错误，包含出错位置的行号和列号（从1开始）"""
+
+    def __init__(self, message: str, text: str, pos: int):
+        self.message = message
+        self.pos = pos
+        self.line = text.count("\n", 0, pos) + 1
+        self.column = pos - (text.rfind("\n", 0, pos) + 1) + 1
+        super().__init__(f"第{self.line}行第{self.column}列: {message}")
+
+
+class _LiteralParser:
+    """递归下降解析器，按需从词法分析器读取词法单元"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str, pos: int = None) -> LiteralParseError:
+        return LiteralParseError(message, self.text, self.pos if pos is None else pos)
+
+    def next_token(self) -> Tuple[str, str, int]:
+        """读取下一个非空白词法单元，返回(类型, 文本, 起始位置)，结束时类型为eof"""
+        text = self.text
+        while self.pos < len(text):
+            match = _TOKEN_PATTERN.match(text, self.pos)
+            if not match:
+                if text[self.pos] == '"':
+                    raise self.error("字符串缺少结束引号")
+                raise self.error(f"无法识别的字符 {text[self.pos]!r}")
+            start = self.pos
+            self.pos = match.end()
+            kind = match.lastgroup
+            if kind != "space":
+                return kind, match.group(), start
+        return "eof", "", self.pos
+
+    def peek_char(self) -> str:
+        """跳过空白后返回下一个字符（不消耗该字符）"""
+        text = self.text
+        while self.pos < len(text) and text[self.pos].isspace():
+            self.pos += 1
+        return text[self.pos] if self.pos < len(text) else ""
+
+    def parse_value(self) -> Any:
+        """解析一个值，优先使用JSON快速路径"""
+        if self.peek_char() in ('[', '"'):
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except ValueError:
+                pass
+            else:
+                self.pos = end
+                return value
+        return self.parse_value_slow()
+
+    def parse_value_slow(self) -> Any:
+        """递归下降解析一个值"""
+        kind, token, start = self.next_token()
+        if kind == "number":
+            if "." in token or "e" in token or "E" in token:
+                return float(token)
+            return int(token)
+        if kind == "string":
+            try:
+                return json.loads(token)
+            except ValueError:
+                raise self.error("字符串中包含无效的转义序列", start)
+        if kind == "word":
+            if token not in _KEYWORDS:
+                raise self.error(f"无法识别的标识符 {token!r}", start)
+            return _KEYWORDS[token]
+        if token == "[":
+            return self.parse_array_items(start)
+        if kind == "eof":
+            raise self.error("缺少值", start)
+        raise self.error(f"意外的 {token!r}", start)
+
+    def parse_array_items(self, start: int) -> List[Any]:
+        """解析数组中'['之后的元素"""
+        items = []
+        if self.peek_char() == "]":
+            self.pos += 1
+            return items
+        while True:
+            items.append(self.parse_value_slow())
+            kind, token, pos = self.next_token()
+            if token == ",":
+                continue
+            if token == "]":
+                return items
+            if kind == "eof":
+                raise self.error("数组缺少结束的 ']'", start)
+            raise self.error(f"数组元素之间应为 ',' 或 ']'，实际为 {token!r}", pos)
+
+
+def iter_values(text: str) -> Iterator[Tuple[Any, int, int]]:
+    """依次解析文本中的所有值，产出(值, 起始位置, 结束位置)
+
+    值之间用空白（通常是换行）或逗号分隔。
+    """
+    parser = _LiteralParser(text)
+    while True:
+        char = parser.peek_char()
+        if char == ",":
+            parser.pos += 1
+            continue
+        if not char:
+            return
+        start = parser.pos
+        value = parser.parse_value()
+        yield value, start, parser.pos
+
+
+def parse_values(text: str) -> List[Any]:
+    """解析文本中的所有值"""
+    return [value for value, _, _ in iter_values(text)]
+
+
+def parse_value_at(text: str, pos: int) -> Tuple[Any, int]:
+    """从指定位置开始解析一个值，返回(值, 结束位置)，之后的内容不做检查"""
+    parser = _LiteralParser(text)
+    parser.pos = pos
+    value = parser.parse_value()
+    return value, parser.pos
+
+
+def parse_value(text: str) -> Any:
+    """解析恰好包含一个值的文本"""
+    parser = _LiteralParser(text)
+    value = parser.parse_value()
+    if parser.peek_char():
+        raise parser.error("值之后存在多余的内容")
+    return value
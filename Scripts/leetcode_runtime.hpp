@@ -0,0 +1,850 @@
+/**
+ * LeetCode C++运行时 - 生成的解决方案共享的节点类型与测试辅助函数
+ *
+ * 解决方案模板首先包含此头文件，生成的测试函数使用这里的用例读取、
+ * 格式化输出和结果比较函数，不再在每个文件中粘贴一份辅助代码。
+ *
+ * - ListNode和TreeNode从节点内存池中按块分配，delete时放回空闲链表
+ * - 链表和二叉树的构造与序列化都是迭代实现，null使用std::optional表示
+ * - FastWriter将输出写入缓冲区，支持嵌套vector、vector<string>和bool
+ * - CaseRecorder记录每个用例的耗时和验证结果，供test_solution.py读取
+ *
+ * 此头文件会被预编译为leetcode_runtime.hpp.gch（见test_solution.py），
+ * 修改后会在下次测试时自动重新生成。
+ */
+
+#ifndef LEETCODE_RUNTIME_HPP
+#define LEETCODE_RUNTIME_HPP
+
+#include <algorithm>
+#include <array>
+#include <bitset>
+#include <cctype>
+#include <charconv>
+#include <chrono>
+#include <climits>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <deque>
+#include <fstream>
+#include <functional>
+#include <iostream>
+#include <list>
+#include <map>
+#include <memory>
+#include <new>
+#include <numeric>
+#include <optional>
+#include <queue>
+#include <set>
+#include <sstream>
+#include <stack>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+#include <type_traits>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <sys/resource.h>
+#endif
+
+// 节点内存池：按块分配固定大小的节点，释放的节点进入空闲链表以便复用，
+// 内存块在程序结束时统一归还
+template <typename T>
+class NodeArena {
+public:
+    NodeArena() = default;
+    NodeArena(const NodeArena&) = delete;
+    NodeArena& operator=(const NodeArena&) = delete;
+
+    ~NodeArena() {
+        for (void* block : blocks_) {
+            ::operator delete(block);
+        }
+    }
+
+    void* allocate() {
+        if (freeList_) {
+            FreeSlot* slot = freeList_;
+            freeList_ = slot->next;
+            return slot;
+        }
+        if (used_ == kBlockSize) {
+            grow();
+        }
+        return current_ + (used_++) * kSlotSize;
+    }
+
+    void deallocate(void* p) noexcept {
+        FreeSlot* slot = static_cast<FreeSlot*>(p);
+        slot->next = freeList_;
+        freeList_ = slot;
+    }
+
+private:
+    struct FreeSlot {
+        FreeSlot* next;
+    };
+
+    static constexpr std::size_t kBlockSize = 4096;
+    static constexpr std::size_t kSlotSize =
+        (std::max(sizeof(T), sizeof(FreeSlot)) + alignof(std::max_align_t) - 1) /
+        alignof(std::max_align_t) * alignof(std::max_align_t);
+
+    void grow() {
+        current_ = static_cast<char*>(::operator new(kBlockSize * kSlotSize));
+        blocks_.push_back(current_);
+        used_ = 0;
+    }
+
+    std::vector<void*> blocks_;
+    char* current_ = nullptr;
+    std::size_t used_ = kBlockSize;
+    FreeSlot* freeList_ = nullptr;
+};
+
+template <typename T>
+NodeArena<T>& nodeArena() {
+    static NodeArena<T> arena;
+    return arena;
+}
+
+// Definition for singly-linked list.
+struct ListNode {
+    int val;
+    ListNode *next;
+    ListNode() : val(0), next(nullptr) {}
+    ListNode(int x) : val(x), next(nullptr) {}
+    ListNode(int x, ListNode *next) : val(x), next(next) {}
+
+    // 节点从内存池中分配，解决方案中的new/delete同样生效
+    static void* operator new(std::size_t size) {
+        return size == sizeof(ListNode) ? nodeArena<ListNode>().allocate() : ::operator new(size);
+    }
+    static void operator delete(void* p, std::size_t size) noexcept {
+        if (size == sizeof(ListNode)) {
+            nodeArena<ListNode>().deallocate(p);
+        } else {
+            ::operator delete(p);
+        }
+    }
+};
+
+// Definition for a binary tree node.
+struct TreeNode {
+    int val;
+    TreeNode *left;
+    TreeNode *right;
+    TreeNode() : val(0), left(nullptr), right(nullptr) {}
+    TreeNode(int x) : val(x), left(nullptr), right(nullptr) {}
+    TreeNode(int x, TreeNode *left, TreeNode *right) : val(x), left(left), right(right) {}
+
+    // 节点从内存池中分配，解决方案中的new/delete同样生效
+    static void* operator new(std::size_t size) {
+        return size == sizeof(TreeNode) ? nodeArena<TreeNode>().allocate() : ::operator new(size);
+    }
+    static void operator delete(void* p, std::size_t size) noexcept {
+        if (size == sizeof(TreeNode)) {
+            nodeArena<TreeNode>().deallocate(p);
+        } else {
+            ::operator delete(p);
+        }
+    }
+};
+
+// 根据数组构造单链表
+inline ListNode* buildLinkedList(const std::vector<int>& values) {
+    ListNode dummy;
+    ListNode* tail = &dummy;
+    for (int value : values) {
+        tail->next = new ListNode(value);
+        tail = tail->next;
+    }
+    return dummy.next;
+}
+
+// 将单链表转换为数组
+inline std::vector<int> linkedListToValues(const ListNode* head) {
+    std::vector<int> values;
+    for (; head; head = head->next) {
+        values.push_back(head->val);
+    }
+    return values;
+}
+
+// 根据层序遍历数组构造二叉树，std::nullopt表示空节点
+inline TreeNode* buildTree(const std::vector<std::optional<int>>& values) {
+    if (values.empty() || !values[0]) {
+        return nullptr;
+    }
+    TreeNode* root = new TreeNode(*values[0]);
+    // 使用数组加读指针作为队列，每个节点只入队一次
+    std::vector<TreeNode*> pending = {root};
+    std::size_t head = 0;
+    std::size_t i = 1;
+    while (head < pending.size() && i < values.size()) {
+        TreeNode* node = pending[head++];
+        if (values[i]) {
+            node->left = new TreeNode(*values[i]);
+            pending.push_back(node->left);
+        }
+        ++i;
+        if (i < values.size() && values[i]) {
+            node->right = new TreeNode(*values[i]);
+            pending.push_back(node->right);
+        }
+        ++i;
+    }
+    return root;
+}
+
+// 将二叉树转换为层序遍历数组，去掉末尾的null
+inline std::vector<std::optional<int>> treeToValues(const TreeNode* root) {
+    std::vector<std::optional<int>> values;
+    std::vector<const TreeNode*> pending;
+    if (root) {
+        pending.push_back(root);
+    }
+    for (std::size_t head = 0; head < pending.size(); ++head) {
+        const TreeNode* node = pending[head];
+        if (!node) {
+            values.push_back(std::nullopt);
+            continue;
+        }
+        values.push_back(node->val);
+        pending.push_back(node->left);
+        pending.push_back(node->right);
+    }
+    while (!values.empty() && !values.back()) {
+        values.pop_back();
+    }
+    return values;
+}
+
+// 测试用例数据文件，与解决方案源文件位于同一目录
+inline std::string casesFilePath(const char* sourceFile) {
+    std::string source = sourceFile;
+    std::size_t slash = source.find_last_of("/\\");
+    std::string dir = slash == std::string::npos ? "" : source.substr(0, slash + 1);
+    return dir + "cases.jsonl";
+}
+
+// 测试用例读取器：在一行JSON文本上按参数类型依次读取值
+struct CaseReader {
+    const std::string& text;
+    std::size_t pos;
+    // 当前的用例序号（从1开始）和正在读取的字段，用于错误信息
+    int caseIdx;
+    const char* field;
+
+    explicit CaseReader(const std::string& line, int caseIdx = 0)
+        : text(line), pos(0), caseIdx(caseIdx), field(nullptr) {}
+
+    // 报告格式错误：用例序号、字段、位置和附近的内容
+    [[noreturn]] void fail(const std::string& message) const {
+        std::string where = "cases.jsonl";
+        if (caseIdx > 0) {
+            where += "第" + std::to_string(caseIdx) + "个用例";
+        }
+        if (field) {
+            where += std::string("的") + field;
+        }
+        throw std::runtime_error(where + "格式错误: " + message + "（位置 " +
+                                 std::to_string(pos) + "，附近的内容: " +
+                                 text.substr(pos, 20) + "）");
+    }
+
+    void skipSpace() {
+        while (pos < text.size() && std::isspace((unsigned char)text[pos])) {
+            ++pos;
+        }
+    }
+
+    bool consume(char c) {
+        skipSpace();
+        if (pos < text.size() && text[pos] == c) {
+            ++pos;
+            return true;
+        }
+        return false;
+    }
+
+    void expect(char c) {
+        if (!consume(c)) {
+            fail(std::string("缺少 '") + c + "'");
+        }
+    }
+
+    bool consumeNull() {
+        skipSpace();
+        if (text.compare(pos, 4, "null") == 0) {
+            pos += 4;
+            return true;
+        }
+        return false;
+    }
+
+    // 跳过一个不需要的JSON值
+    void skipValue() {
+        skipSpace();
+        int depth = 0;
+        bool inString = false;
+        for (; pos < text.size(); ++pos) {
+            char c = text[pos];
+            if (inString) {
+                if (c == '\\') {
+                    ++pos;
+                } else if (c == '"') {
+                    inString = false;
+                }
+            } else if (c == '"') {
+                inString = true;
+            } else if (c == '[' || c == '{') {
+                ++depth;
+            } else if (c == ']' || c == '}' || c == ',') {
+                if (depth == 0) {
+                    return;
+                }
+                if (c != ',') {
+                    --depth;
+                }
+            }
+        }
+    }
+};
+
+template <typename T>
+void readValue(CaseReader& r, std::vector<T>& v);
+template <typename T>
+void readValue(CaseReader& r, std::optional<T>& v);
+
+template <typename T>
+void readInteger(CaseReader& r, T& v) {
+    r.skipSpace();
+    auto [end, ec] = std::from_chars(r.text.data() + r.pos, r.text.data() + r.text.size(), v);
+    if (ec == std::errc::result_out_of_range) {
+        r.fail("整数超出范围");
+    }
+    if (ec != std::errc()) {
+        r.fail("应为整数");
+    }
+    r.pos = end - r.text.data();
+}
+
+inline void readValue(CaseReader& r, int& v) { readInteger(r, v); }
+
+inline void readValue(CaseReader& r, long long& v) { readInteger(r, v); }
+
+inline void readValue(CaseReader& r, double& v) {
+    r.skipSpace();
+    const char* begin = r.text.c_str() + r.pos;
+    char* end;
+    v = std::strtod(begin, &end);
+    if (end == begin) {
+        r.fail("应为数字");
+    }
+    r.pos = end - r.text.c_str();
+}
+
+inline void readValue(CaseReader& r, float& v) {
+    double d;
+    readValue(r, d);
+    v = (float)d;
+}
+
+inline void readValue(CaseReader& r, bool& v) {
+    r.skipSpace();
+    v = r.text.compare(r.pos, 4, "true") == 0;
+    if (!v && r.text.compare(r.pos, 5, "false") != 0) {
+        r.fail("应为true或false");
+    }
+    r.pos += v ? 4 : 5;
+}
+
+inline void readValue(CaseReader& r, std::string& v) {
+    r.expect('"');
+    v.clear();
+    while (r.pos < r.text.size() && r.text[r.pos] != '"') {
+        char c = r.text[r.pos++];
+        if (c == '\\' && r.pos < r.text.size()) {
+            char e = r.text[r.pos++];
+            if (e == 'n') {
+                c = '\n';
+            } else if (e == 't') {
+                c = '\t';
+            } else if (e == 'r') {
+                c = '\r';
+            } else if (e == 'u') {
+                // 仅处理基本多文种平面内的字符，按UTF-8编码
+                unsigned code = std::strtoul(r.text.substr(r.pos, 4).c_str(), nullptr, 16);
+                r.pos += 4;
+                if (code < 0x80) {
+                    v += (char)code;
+                } else if (code < 0x800) {
+                    v += (char)(0xC0 | (code >> 6));
+                    v += (char)(0x80 | (code & 0x3F));
+                } else {
+                    v += (char)(0xE0 | (code >> 12));
+                    v += (char)(0x80 | ((code >> 6) & 0x3F));
+                    v += (char)(0x80 | (code & 0x3F));
+                }
+                continue;
+            } else {
+                c = e;
+            }
+        }
+        v += c;
+    }
+    r.expect('"');
+}
+
+inline void readValue(CaseReader& r, char& v) {
+    std::string s;
+    readValue(r, s);
+    v = s.empty() ? '\0' : s[0];
+}
+
+// 从测试用例中读取链表
+inline void readValue(CaseReader& r, ListNode*& head) {
+    std::vector<int> values;
+    if (!r.consumeNull()) {
+        readValue(r, values);
+    }
+    head = buildLinkedList(values);
+}
+
+// 从测试用例中读取二叉树
+inline void readValue(CaseReader& r, TreeNode*& root) {
+    std::vector<std::optional<int>> values;
+    if (!r.consumeNull()) {
+        readValue(r, values);
+    }
+    root = buildTree(values);
+}
+
+template <typename T>
+void readValue(CaseReader& r, std::optional<T>& v) {
+    if (r.consumeNull()) {
+        v.reset();
+        return;
+    }
+    T item{};
+    readValue(r, item);
+    v = std::move(item);
+}
+
+template <typename T>
+void readValue(CaseReader& r, std::vector<T>& v) {
+    v.clear();
+    r.expect('[');
+    if (r.consume(']')) {
+        return;
+    }
+    do {
+        T item{};
+        readValue(r, item);
+        v.push_back(std::move(item));
+    } while (r.consume(','));
+    r.expect(']');
+}
+
+// 读取用例的一个字段（参数或期望值），出错时错误信息中包含字段名
+template <typename T>
+void readField(CaseReader& r, const char* field, T& v) {
+    r.field = field;
+    readValue(r, v);
+    r.field = nullptr;
+}
+
+// 带缓冲的输出：内容先写入缓冲区，缓冲区满或显式flush时一次写出。
+// stream为nullptr时只写入缓冲区，用于格式化为字符串
+class FastWriter {
+public:
+    explicit FastWriter(std::FILE* stream = stdout) : stream_(stream) {
+        buffer_.reserve(kBufferSize);
+    }
+
+    FastWriter(const FastWriter&) = delete;
+    FastWriter& operator=(const FastWriter&) = delete;
+
+    ~FastWriter() { flush(); }
+
+    FastWriter& write(const char* data, std::size_t size) {
+        buffer_.append(data, size);
+        if (stream_ && buffer_.size() >= kBufferSize) {
+            flush();
+        }
+        return *this;
+    }
+
+    FastWriter& put(char c) {
+        buffer_.push_back(c);
+        if (stream_ && buffer_.size() >= kBufferSize) {
+            flush();
+        }
+        return *this;
+    }
+
+    // 将缓冲区写出，调用解决方案前需要先flush，以免与其中的cout输出交错
+    void flush() {
+        if (stream_ && !buffer_.empty()) {
+            std::fwrite(buffer_.data(), 1, buffer_.size(), stream_);
+            std::fflush(stream_);
+            buffer_.clear();
+        }
+    }
+
+    const std::string& str() const { return buffer_; }
+
+private:
+    static constexpr std::size_t kBufferSize = 1 << 16;
+
+    std::FILE* stream_;
+    std::string buffer_;
+};
+
+// 标准输出的共享FastWriter
+inline FastWriter& stdoutWriter() {
+    static FastWriter writer(stdout);
+    return writer;
+}
+
+template <typename T>
+void writeValue(FastWriter& w, const std::vector<T>& v);
+template <typename T>
+void writeValue(FastWriter& w, const std::optional<T>& v);
+
+// 将值按JSON写出，与LeetCode的显示格式一致
+template <typename T, typename std::enable_if<std::is_integral<T>::value &&
+                                                  !std::is_same<T, bool>::value &&
+                                                  !std::is_same<T, char>::value,
+                                              int>::type = 0>
+void writeValue(FastWriter& w, T v) {
+    char buf[24];
+    auto [end, ec] = std::to_chars(buf, buf + sizeof(buf), v);
+    w.write(buf, end - buf);
+}
+
+inline void writeValue(FastWriter& w, double v) {
+    char buf[32];
+    int n = std::snprintf(buf, sizeof(buf), "%g", v);
+    w.write(buf, n);
+}
+
+inline void writeValue(FastWriter& w, float v) {
+    writeValue(w, (double)v);
+}
+
+inline void writeValue(FastWriter& w, bool v) {
+    if (v) {
+        w.write("true", 4);
+    } else {
+        w.write("false", 5);
+    }
+}
+
+inline void writeValue(FastWriter& w, std::string_view v) {
+    w.put('"');
+    for (char c : v) {
+        switch (c) {
+            case '"':
+                w.write("\\\"", 2);
+                break;
+            case '\\':
+                w.write("\\\\", 2);
+                break;
+            case '\n':
+                w.write("\\n", 2);
+                break;
+            case '\t':
+                w.write("\\t", 2);
+                break;
+            case '\r':
+                w.write("\\r", 2);
+                break;
+            default:
+                if ((unsigned char)c < 0x20) {
+                    char buf[8];
+                    int n = std::snprintf(buf, sizeof(buf), "\\u%04x", (unsigned char)c);
+                    w.write(buf, n);
+                } else {
+                    w.put(c);
+                }
+        }
+    }
+    w.put('"');
+}
+
+inline void writeValue(FastWriter& w, const std::string& v) {
+    writeValue(w, std::string_view(v));
+}
+
+inline void writeValue(FastWriter& w, const char* v) {
+    writeValue(w, std::string_view(v));
+}
+
+inline void writeValue(FastWriter& w, char v) {
+    writeValue(w, std::string_view(&v, 1));
+}
+
+inline void writeValue(FastWriter& w, const ListNode* head) {
+    writeValue(w, linkedListToValues(head));
+}
+
+inline void writeValue(FastWriter& w, const TreeNode* root) {
+    writeValue(w, treeToValues(root));
+}
+
+template <typename T>
+void writeValue(FastWriter& w, const std::optional<T>& v) {
+    if (v) {
+        writeValue(w, *v);
+    } else {
+        w.write("null", 4);
+    }
+}
+
+// vector<bool>的元素以bool值返回，同样适用
+template <typename T>
+void writeValue(FastWriter& w, const std::vector<T>& v) {
+    w.put('[');
+    for (std::size_t i = 0; i < v.size(); ++i) {
+        if (i > 0) {
+            w.put(',');
+        }
+        writeValue(w, static_cast<const T&>(v[i]));
+    }
+    w.put(']');
+}
+
+// 用于在输出中标记按JSON格式写出的值
+template <typename T>
+struct JsonValue {
+    const T& value;
+};
+
+template <typename T>
+JsonValue<T> json(const T& value) {
+    return {value};
+}
+
+inline FastWriter& operator<<(FastWriter& w, const char* text) {
+    return w.write(text, std::strlen(text));
+}
+
+inline FastWriter& operator<<(FastWriter& w, const std::string& text) {
+    return w.write(text.data(), text.size());
+}
+
+inline FastWriter& operator<<(FastWriter& w, char c) {
+    return w.put(c);
+}
+
+inline FastWriter& operator<<(FastWriter& w, int v) {
+    writeValue(w, v);
+    return w;
+}
+
+template <typename T>
+FastWriter& operator<<(FastWriter& w, const JsonValue<T>& v) {
+    writeValue(w, v.value);
+    return w;
+}
+
+// 将值格式化为与LeetCode一致的字符串
+template <typename T>
+std::string formatValue(const T& value) {
+    FastWriter w(nullptr);
+    writeValue(w, value);
+    return w.str();
+}
+
+// 结果比较模式
+enum class CompareMode { Exact, FloatTolerance, Unordered, NestedUnordered };
+
+// 浮点数比较的容差，与LeetCode判题一致
+const double kTolerance = 1e-5;
+
+// 结构化比较，遇到第一个差异立即返回，不构造字符串
+template <typename T>
+bool sameValue(const T& a, const T& b, CompareMode mode) {
+    return a == b;
+}
+
+inline bool sameValue(double a, double b, CompareMode mode) {
+    if (mode != CompareMode::FloatTolerance) {
+        return a == b;
+    }
+    return std::fabs(a - b) <= kTolerance * std::max(1.0, std::fabs(b));
+}
+
+// 逐节点比较两个链表
+inline bool sameValue(const ListNode* a, const ListNode* b, CompareMode mode) {
+    while (a && b) {
+        if (a->val != b->val) {
+            return false;
+        }
+        a = a->next;
+        b = b->next;
+    }
+    return a == nullptr && b == nullptr;
+}
+
+// 迭代比较两棵二叉树的结构和节点值
+inline bool sameValue(const TreeNode* a, const TreeNode* b, CompareMode mode) {
+    std::vector<std::pair<const TreeNode*, const TreeNode*>> pending = {{a, b}};
+    while (!pending.empty()) {
+        auto [x, y] = pending.back();
+        pending.pop_back();
+        if (!x || !y) {
+            if (x != y) {
+                return false;
+            }
+            continue;
+        }
+        if (x->val != y->val) {
+            return false;
+        }
+        pending.push_back({x->right, y->right});
+        pending.push_back({x->left, y->left});
+    }
+    return true;
+}
+
+inline bool sameValue(ListNode* a, ListNode* b, CompareMode mode) {
+    return sameValue(static_cast<const ListNode*>(a), static_cast<const ListNode*>(b), mode);
+}
+
+inline bool sameValue(TreeNode* a, TreeNode* b, CompareMode mode) {
+    return sameValue(static_cast<const TreeNode*>(a), static_cast<const TreeNode*>(b), mode);
+}
+
+template <typename T>
+bool sameValue(const std::vector<T>& a, const std::vector<T>& b, CompareMode mode) {
+    if (a.size() != b.size()) {
+        return false;
+    }
+    for (std::size_t i = 0; i < a.size(); ++i) {
+        if (!sameValue(static_cast<const T&>(a[i]), static_cast<const T&>(b[i]), mode)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+template <typename T>
+struct IsVector : std::false_type {};
+
+template <typename T>
+struct IsVector<std::vector<T>> : std::true_type {};
+
+template <typename T>
+bool compareResult(const T& actual, const T& expected, CompareMode mode) {
+    return sameValue(actual, expected, mode);
+}
+
+// 顺序无关的比较：排序后逐元素比较（多重集合语义）
+// 只有顺序无关时才复制结果和期望值用于排序，按顺序比较时直接比较
+template <typename T>
+bool compareResult(const std::vector<T>& actual, const std::vector<T>& expected,
+                   CompareMode mode) {
+    if (actual.size() != expected.size()) {
+        return false;
+    }
+    if constexpr (!std::is_pointer<T>::value) {
+        if (mode == CompareMode::Unordered || mode == CompareMode::NestedUnordered) {
+            std::vector<T> sortedActual = actual;
+            std::vector<T> sortedExpected = expected;
+            if constexpr (IsVector<T>::value) {
+                if (mode == CompareMode::NestedUnordered) {
+                    for (auto& item : sortedActual) std::sort(item.begin(), item.end());
+                    for (auto& item : sortedExpected) std::sort(item.begin(), item.end());
+                }
+            }
+            std::sort(sortedActual.begin(), sortedActual.end());
+            std::sort(sortedExpected.begin(), sortedExpected.end());
+            return sameValue(sortedActual, sortedExpected, mode);
+        }
+    }
+    return sameValue(actual, expected, mode);
+}
+
+// 用例计时与结果记录：设置了LC_RESULT_FILE环境变量时，测试结束后将每个用例的
+// 耗时（毫秒）和验证结果写入该文件，格式与Python运行时的CaseRecorder相同
+class CaseRecorder {
+public:
+    void start() { start_ = std::chrono::steady_clock::now(); }
+
+    // 结束计时，返回本次调用的耗时（毫秒）
+    double stop() {
+        auto elapsed = std::chrono::steady_clock::now() - start_;
+        lastMillis_ = std::chrono::duration<double, std::milli>(elapsed).count();
+        return lastMillis_;
+    }
+
+    // 记录最近一次计时的用例，verdict为1通过、0失败、-1没有期望输出
+    void add(int verdict) {
+        char buf[64];
+        int n = std::snprintf(buf, sizeof(buf), "%s{\"ms\":%.6f,\"passed\":%s}",
+                              cases_.empty() ? "" : ",", lastMillis_,
+                              verdict < 0 ? "null" : (verdict ? "true" : "false"));
+        cases_.append(buf, n);
+    }
+
+    void finish(bool allPassed) const {
+        const char* resultFile = std::getenv("LC_RESULT_FILE");
+        if (!resultFile || !*resultFile) {
+            return;
+        }
+        std::FILE* f = std::fopen(resultFile, "w");
+        if (!f) {
+            return;
+        }
+        long peakKb = peakMemoryKb();
+        std::fprintf(f, "{\"passed\":%s,\"peak_kb\":", allPassed ? "true" : "false");
+        if (peakKb >= 0) {
+            std::fprintf(f, "%ld", peakKb);
+        } else {
+            std::fputs("null", f);
+        }
+        std::fprintf(f, ",\"cases\":[%s]}", cases_.c_str());
+        std::fclose(f);
+    }
+
+    // 当前进程的峰值常驻内存（KB），不支持的平台返回-1
+    static long peakMemoryKb() {
+#if defined(__unix__) || defined(__APPLE__)
+        struct rusage usage;
+        if (getrusage(RUSAGE_SELF, &usage) == 0) {
+#ifdef __APPLE__
+            return usage.ru_maxrss / 1024;
+#else
+            return usage.ru_maxrss;
+#endif
+        }
+#endif
+        return -1;
+    }
+
+private:
+    std::chrono::steady_clock::time_point start_;
+    double lastMillis_ = 0;
+    std::string cases_;
+};
+
+// 将耗时格式化为保留三位小数的毫秒数
+inline std::string formatMillis(double ms) {
+    char buf[32];
+    int n = std::snprintf(buf, sizeof(buf), "%.3f", ms);
+    return std::string(buf, n);
+}
+
+#endif  // LEETCODE_RUNTIME_HPP
@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+LeetCode Python运行时 - 生成的解决方案共享的节点类型与测试辅助函数
+
+解决方案文件通过 from leetcode_runtime import * 导入这里的节点类型，
+生成的测试函数使用这里的构造、序列化和用例读取函数，不再在每个文件中
+粘贴一份辅助代码。
+
+所有构造和序列化都是基于deque的迭代实现，时间复杂度O(n)，不受递归深度
+限制；批量构造节点时会暂停垃圾回收，避免大量小对象触发频繁的GC扫描。
+"""
+
+import ast
+import gc
+import inspect
+import json
+import os
+import sys
+import textwrap
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "ListNode",
+    "TreeNode",
+    "NaryNode",
+    "GraphNode",
+    "RandomNode",
+    "build_linked_list",
+    "linked_list_to_list",
+    "build_tree",
+    "tree_to_list",
+    "build_nary_tree",
+    "nary_tree_to_list",
+    "build_graph",
+    "graph_to_adjacency",
+    "build_random_list",
+    "random_list_to_pairs",
+]
+
+
+# Definition for singly-linked list.
+class ListNode:
+    __slots__ = ("val", "next")
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+    def __repr__(self):
+        return f"ListNode({self.val})"
+
+
+# Definition for a binary tree node.
+class TreeNode:
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f"TreeNode({self.val})"
+
+
+# Definition for a N-ary tree node (LeetCode中名为Node).
+class NaryNode:
+    __slots__ = ("val", "children")
+
+    def __init__(self, val=None, children=None):
+        self.val = val
+        self.children = children if children is not None else []
+
+    def __repr__(self):
+        return f"Node({self.val})"
+
+
+# Definition for a graph node (LeetCode中名为Node).
+class GraphNode:
+    __slots__ = ("val", "neighbors")
+
+    def __init__(self, val=0, neighbors=None):
+        self.val = val
+        self.neighbors = neighbors if neighbors is not None else []
+
+    def __repr__(self):
+        return f"Node({self.val})"
+
+
+# Definition for a linked list node with a random pointer (LeetCode中名为Node).
+class RandomNode:
+    __slots__ = ("val", "next", "random")
+
+    def __init__(self, x=0, next=None, random=None):
+        self.val = int(x)
+        self.next = next
+        self.random = random
+
+    def __repr__(self):
+        return f"Node({self.val})"
+
+
+# LeetCode中统一命名为Node的节点类型
+NODE_KINDS = {
+    "nary": NaryNode,
+    "graph": GraphNode,
+    "random": RandomNode,
+}
+
+
+@contextmanager
+def gc_paused():
+    """在批量构造节点期间暂停垃圾回收"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def build_linked_list(values: Optional[List[Any]]) -> Optional[ListNode]:
+    """根据数组构造单链表"""
+    if not values:
+        return None
+    with gc_paused():
+        dummy = tail = ListNode()
+        for val in values:
+            tail.next = tail = ListNode(val)
+    return dummy.next
+
+
+def linked_list_to_list(head: Optional[ListNode]) -> List[Any]:
+    """将单链表转换为数组"""
+    values = []
+    while head is not None:
+        values.append(head.val)
+        head = head.next
+    return values
+
+
+def build_tree(values: Optional[List[Any]]) -> Optional[TreeNode]:
+    """根据层序遍历数组（null表示空节点）构造二叉树"""
+    if not values or values[0] is None:
+        return None
+    with gc_paused():
+        root = TreeNode(values[0])
+        queue = deque([root])
+        i, n = 1, len(values)
+        while queue and i < n:
+            node = queue.popleft()
+            if values[i] is not None:
+                node.left = TreeNode(values[i])
+                queue.append(node.left)
+            i += 1
+            if i < n and values[i] is not None:
+                node.right = TreeNode(values[i])
+                queue.append(node.right)
+            i += 1
+    return root
+
+
+def tree_to_list(root: Optional[TreeNode]) -> List[Any]:
+    """将二叉树转换为层序遍历数组，去掉末尾的null"""
+    values = []
+    queue = deque([root] if root is not None else [])
+    while queue:
+        node = queue.popleft()
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.val)
+        queue.append(node.left)
+        queue.append(node.right)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def build_nary_tree(values: Optional[List[Any]]) -> Optional[NaryNode]:
+    """根据LeetCode的N叉树层序表示构造N叉树
+
+    格式为根节点、null，之后每个节点的子节点依次排列，组与组之间用null分隔，
+    如 [1,null,3,2,4,null,5,6]。
+    """
+    if not values or values[0] is None:
+        return None
+    with gc_paused():
+        root = NaryNode(values[0])
+        queue = deque([root])
+        i, n = 2, len(values)
+        while queue and i < n:
+            parent = queue.popleft()
+            while i < n and values[i] is not None:
+                child = NaryNode(values[i])
+                parent.children.append(child)
+                queue.append(child)
+                i += 1
+            i += 1
+    return root
+
+
+def nary_tree_to_list(root: Optional[NaryNode]) -> List[Any]:
+    """将N叉树转换为LeetCode的层序表示"""
+    if root is None:
+        return []
+    values = [root.val, None]
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for child in node.children:
+            values.append(child.val)
+            queue.append(child)
+        values.append(None)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def build_graph(adjacency: Optional[List[List[int]]]) -> Optional[GraphNode]:
+    """根据邻接表构造无向图，节点值从1开始，返回节点1"""
+    if not adjacency:
+        return None
+    with gc_paused():
+        nodes = [GraphNode(i + 1) for i in range(len(adjacency))]
+        for node, neighbors in zip(nodes, adjacency):
+            node.neighbors = [nodes[j - 1] for j in neighbors]
+    return nodes[0]
+
+
+def graph_to_adjacency(node: Optional[GraphNode]) -> List[List[int]]:
+    """从任一节点出发遍历图，按节点值输出邻接表"""
+    if node is None:
+        return []
+    seen = {id(node): node}
+    queue = deque([node])
+    while queue:
+        current = queue.popleft()
+        for neighbor in current.neighbors:
+            if id(neighbor) not in seen:
+                seen[id(neighbor)] = neighbor
+                queue.append(neighbor)
+    nodes = sorted(seen.values(), key=lambda n: n.val)
+    return [[neighbor.val for neighbor in n.neighbors] for n in nodes]
+
+
+def build_random_list(pairs: Optional[List[List[Any]]]) -> Optional[RandomNode]:
+    """根据[[val, random_index], ...]构造带随机指针的链表"""
+    if not pairs:
+        return None
+    with gc_paused():
+        nodes = [RandomNode(val) for val, _ in pairs]
+        for i, (_, random_index) in enumerate(pairs):
+            if i + 1 < len(nodes):
+                nodes[i].next = nodes[i + 1]
+            if random_index is not None:
+                nodes[i].random = nodes[random_index]
+    return nodes[0]
+
+
+def random_list_to_pairs(head: Optional[RandomNode]) -> List[List[Any]]:
+    """将带随机指针的链表转换为[[val, random_index], ...]"""
+    nodes = []
+    index = {}
+    while head is not None:
+        index[id(head)] = len(nodes)
+        nodes.append(head)
+        head = head.next
+    return [
+        [node.val, index.get(id(node.random)) if node.random is not None else None]
+        for node in nodes
+    ]
+
+
+def build_value(value: Any, param_type: str, node_kind: Optional[str] = None) -> Any:
+    """根据参数类型将JSON值构造为方法的实际参数"""
+    if value is None:
+        return None
+    if param_type == "ListNode":
+        return build_linked_list(value)
+    if param_type == "TreeNode":
+        return build_tree(value)
+    if param_type == "Node":
+        if node_kind == "graph":
+            return build_graph(value)
+        if node_kind == "random":
+            return build_random_list(value)
+        return build_nary_tree(value)
+    if param_type in ("ListNode[]", "list<ListNode>"):
+        return [build_linked_list(item) for item in value]
+    if param_type in ("TreeNode[]", "list<TreeNode>"):
+        return [build_tree(item) for item in value]
+    return value
+
+
+def build_args(
+    values: List[Any], param_types: List[str], node_kind: Optional[str] = None
+) -> List[Any]:
+    """根据参数类型将一组JSON值构造为方法的实际参数"""
+    return [
+        build_value(value, param_type, node_kind)
+        for value, param_type in zip(values, param_types)
+    ]
+
+
+# 以数组表示的节点类型，空结构表示为[]
+NODE_TYPES = {"ListNode", "TreeNode", "Node"}
+
+# 所有节点类
+NODE_CLASSES = (ListNode, TreeNode, NaryNode, GraphNode, RandomNode)
+
+
+def element_type(value_type: Optional[str]) -> Optional[str]:
+    """列表类型的元素类型（ListNode[]和list<ListNode>都是ListNode），不是列表类型时返回None"""
+    if not value_type:
+        return None
+    if value_type.endswith("[]"):
+        return value_type[:-2].strip()
+    if value_type.startswith("list<") and value_type.endswith(">"):
+        return value_type[5:-1].strip()
+    return None
+
+
+def is_node_type(value_type: Optional[str]) -> bool:
+    """value_type是节点类型或元素为节点的（多维）列表类型"""
+    while True:
+        item_type = element_type(value_type)
+        if item_type is None:
+            return value_type in NODE_TYPES
+        value_type = item_type
+
+
+def serialize(value: Any, value_type: Optional[str] = None) -> Any:
+    """将节点结构转换为与LeetCode一致的JSON值，其他值原样返回
+
+    Args:
+        value: 要转换的值
+        value_type: 可选，值的LeetCode类型；节点类型（包括节点列表中的元素）
+            的None会转换为[]。未指定时按列表中是否有节点判断
+    """
+    if value is None:
+        return [] if value_type in NODE_TYPES else None
+    if isinstance(value, ListNode):
+        return linked_list_to_list(value)
+    if isinstance(value, TreeNode):
+        return tree_to_list(value)
+    if isinstance(value, NaryNode):
+        return nary_tree_to_list(value)
+    if isinstance(value, GraphNode):
+        return graph_to_adjacency(value)
+    if isinstance(value, RandomNode):
+        return random_list_to_pairs(value)
+    if isinstance(value, (list, tuple)):
+        if value_type:
+            # 按声明的类型转换，元素不是节点的列表原样返回，不需要逐个检查
+            if is_node_type(value_type):
+                item_type = element_type(value_type)
+                return [serialize(item, item_type) for item in value]
+        elif any(isinstance(item, NODE_CLASSES) for item in value):
+            return [serialize(item) for item in value]
+    return value
+
+
+def format_value(value: Any, value_type: Optional[str] = None) -> str:
+    """将值格式化为与LeetCode一致的字符串，用于显示"""
+    value = serialize(value, value_type)
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def load_test_cases(cases_file: str) -> Iterator[Tuple[int, List[Any], Any]]:
+    """逐行读取cases.jsonl，产出用例下标、原始参数值和期望输出"""
+    with open(cases_file, "r", encoding="utf-8") as f:
+        case_idx = 0
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            case = json.loads(line)
+            yield case_idx, case["params"], case.get("expected")
+            case_idx += 1
+
+
+# 测试结果文件的环境变量，由test_solution.py设置
+RESULT_FILE_ENV = "LC_RESULT_FILE"
+
+# 设置后使用tracemalloc统计每个用例的内存，会明显拖慢运行，只用于性能基线
+MEMORY_TRACE_ENV = "LC_TRACE_MEMORY"
+
+
+class CaseRecorder:
+    """记录每个用例的耗时和验证结果
+
+    设置了LC_RESULT_FILE环境变量时，测试结束后将结果写入该文件:
+        {"passed": 是否全部通过, "peak_kb": 峰值内存,
+         "cases": [{"ms": 耗时, "passed": true/false/null}]}
+    没有期望输出的用例passed为null；无法获取峰值内存的平台peak_kb为null。
+    设置了LC_TRACE_MEMORY时，每个用例还包括kb: 从上一个用例结束到该用例结束之间
+    tracemalloc统计的内存峰值相对开始时的增长（KB）。
+    """
+
+    def __init__(self):
+        self.cases = []
+        self.trace_memory = bool(os.environ.get(MEMORY_TRACE_ENV))
+        if self.trace_memory:
+            import tracemalloc
+
+            tracemalloc.start()
+            self._reset_memory()
+
+    def _reset_memory(self):
+        import tracemalloc
+
+        tracemalloc.reset_peak()
+        self.memory_start = tracemalloc.get_traced_memory()[0]
+
+    def add(self, elapsed_ms: float, passed: Optional[bool]):
+        case = {"ms": round(elapsed_ms, 6), "passed": passed}
+        if self.trace_memory:
+            import tracemalloc
+
+            peak = tracemalloc.get_traced_memory()[1]
+            case["kb"] = round(max(peak - self.memory_start, 0) / 1024, 1)
+            self._reset_memory()
+        self.cases.append(case)
+
+    def finish(self, all_passed: bool):
+        result_file = os.environ.get(RESULT_FILE_ENV)
+        if not result_file:
+            return
+        with open(result_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"passed": all_passed, "peak_kb": peak_memory_kb(), "cases": self.cases},
+                f,
+            )
+
+
+def peak_memory_kb() -> Optional[int]:
+    """当前进程的峰值常驻内存（KB），不支持的平台返回None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS的ru_maxrss单位为字节，Linux为KB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# 会原地修改对象的常用方法
+MUTATING_METHODS = {
+    "append", "appendleft", "extend", "extendleft", "insert", "pop", "popleft",
+    "remove", "clear", "sort", "reverse", "rotate", "add", "discard", "update",
+    "setdefault", "popitem", "difference_update", "intersection_update",
+    "symmetric_difference_update",
+}  # fmt: skip
+
+# 不会修改参数的常用内置函数
+PURE_FUNCTIONS = {
+    "len", "sorted", "sum", "min", "max", "abs", "any", "all", "enumerate",
+    "range", "zip", "map", "filter", "reversed", "iter", "next", "list", "tuple",
+    "set", "frozenset", "dict", "str", "int", "float", "bool", "ord", "chr",
+    "print", "isinstance", "id", "hash", "Counter", "deque",
+}  # fmt: skip
+
+
+def mutates_inputs(method) -> bool:
+    """分析方法源码，判断是否可能原地修改参数
+
+    当前生成的测试代码在调用前格式化输入，不再使用；较早生成的测试代码仍会导入。
+    """
+    try:
+        func = ast.parse(textwrap.dedent(inspect.getsource(method))).body[0]
+    except (OSError, TypeError, SyntaxError, IndexError):
+        # 无法分析时保守地认为会修改参数
+        return True
+    names = {arg.arg for arg in func.args.args[1:]}
+
+    def root_name(node):
+        while isinstance(node, (ast.Subscript, ast.Attribute, ast.Starred)):
+            node = node.value
+        return node.id if isinstance(node, ast.Name) else None
+
+    def flatten(targets):
+        for target in targets:
+            if isinstance(target, (ast.Tuple, ast.List)):
+                yield from flatten(target.elts)
+            else:
+                yield target
+
+    # 记录参数的别名，如 arr = nums
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Name):
+            if node.value.id in names:
+                names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+
+    for node in ast.walk(func):
+        if isinstance(node, (ast.Assign, ast.Delete)):
+            for target in flatten(node.targets):
+                if not isinstance(target, ast.Name) and root_name(target) in names:
+                    return True
+        elif isinstance(node, ast.AugAssign) and root_name(node.target) in names:
+            return True
+        elif isinstance(node, ast.Call):
+            callee = node.func
+            if isinstance(callee, ast.Attribute) and root_name(callee.value) in names:
+                if callee.attr in MUTATING_METHODS:
+                    return True
+            # 参数被传给其他函数时无法确定是否被修改，保守处理
+            callee_name = callee.id if isinstance(callee, ast.Name) else None
+            if callee_name not in PURE_FUNCTIONS and any(
+                root_name(arg) in names for arg in node.args
+            ):
+                return True
+    return False
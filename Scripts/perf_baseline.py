@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+LeetCode性能基线 - 固定已调优解决方案的每个用例的耗时和内存，之后的测试超出基线时失败
+
+python test_solution.py 题号 [语言] --pin-baseline 重复运行测试（默认PIN_REPEAT次），
+取每个用例耗时的中位数，连同用例内存（仅Python，由tracemalloc统计）和进程峰值内存
+保存到题目目录的baseline_<语言>.json。之后该题目的每次测试都会重复运行
+CHECK_REPEAT次并与基线比较，任一用例超出基线的比例大于容差时测试失败，并列出
+超出的用例。基线文件应随解决方案一起提交。
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 基线文件格式版本
+BASELINE_VERSION = 1
+
+# 固定基线和检查时默认的重复运行次数
+PIN_REPEAT = 5
+CHECK_REPEAT = 3
+
+# 默认容差（超出基线的比例）
+DEFAULT_TOLERANCE = 0.25
+
+# 差异小于这些值时不视为超出基线，避免极短用例和小对象的测量噪声
+MIN_DIFF_MS = 0.05
+MIN_DIFF_KB = 64
+MIN_PEAK_DIFF_KB = 1024
+
+
+def baseline_file(solution_file: Path, lang: str) -> Path:
+    return Path(solution_file).parent / f"baseline_{lang}.json"
+
+
+def load_baseline(solution_file: Path, lang: str) -> Optional[Dict[str, Any]]:
+    """读取解决方案的性能基线，不存在或无法解析时返回None"""
+    try:
+        with open(baseline_file(solution_file, lang), "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if baseline.get("version") != BASELINE_VERSION:
+        return None
+    return baseline
+
+
+def summarize_runs(
+    runs: List[Dict[str, Any]], memory_run: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """合并多次运行记录的结果，返回(每个用例的结果, 进程峰值内存)
+
+    耗时和进程峰值内存取中位数，验证结果以第一次运行为准，
+    每个用例的内存（kb）来自单独的memory_run。
+    """
+    cases = []
+    for index, case in enumerate(runs[0]["cases"]):
+        merged = {
+            "ms": round(statistics.median(run["cases"][index]["ms"] for run in runs), 6),
+            "passed": case["passed"],
+        }
+        if memory_run and index < len(memory_run["cases"]):
+            kb = memory_run["cases"][index].get("kb")
+            if kb is not None:
+                merged["kb"] = kb
+        cases.append(merged)
+
+    peaks = [run["peak_kb"] for run in runs if run.get("peak_kb") is not None]
+    peak_kb = int(statistics.median(peaks)) if peaks else None
+    return cases, peak_kb
+
+
+def save_baseline(
+    solution_file: Path,
+    lang: str,
+    result: Dict[str, Any],
+    tolerance: float,
+    profile: str,
+    cases_digest: str,
+) -> Path:
+    """将测试结果（execute_solution的返回值）保存为性能基线"""
+    baseline = {
+        "version": BASELINE_VERSION,
+        "tolerance": tolerance,
+        "repeat": result.get("repeat", 1),
+        "profile": profile,
+        "cases_digest": cases_digest,
+        "pinned_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "peak_kb": result.get("peak_kb"),
+        "cases": [
+            {key: case[key] for key in ("ms", "kb") if key in case}
+            for case in result["cases"]
+        ],
+    }
+    path = baseline_file(solution_file, lang)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return path
+
+
+def _exceeds(current, base, tolerance, min_diff) -> bool:
+    return current > base * (1 + tolerance) and current - base > min_diff
+
+
+def _change(current, base) -> str:
+    return f"{current / base - 1:+.0%}" if base else "+inf"
+
+
+def compare_baseline(
+    baseline: Dict[str, Any],
+    result: Dict[str, Any],
+    cases_digest: str,
+    tolerance: Optional[float] = None,
+) -> List[str]:
+    """比较测试结果与基线，返回超出基线的项目说明，全部在容差内时返回空列表"""
+    if baseline.get("cases_digest") != cases_digest:
+        return ["测试用例已修改，基线不再适用"]
+    cases = result["cases"]
+    if len(cases) != len(baseline["cases"]):
+        return [f"用例数量与基线不同（基线 {len(baseline['cases'])} 个，当前 {len(cases)} 个）"]
+
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    violations = []
+    for index, (case, base) in enumerate(zip(cases, baseline["cases"]), 1):
+        if _exceeds(case["ms"], base["ms"], tolerance, MIN_DIFF_MS):
+            violations.append(
+                f"用例 {index}: 耗时 {base['ms']:.3f} ms -> {case['ms']:.3f} ms "
+                f"({_change(case['ms'], base['ms'])})"
+            )
+        if "kb" in case and "kb" in base and _exceeds(
+            case["kb"], base["kb"], tolerance, MIN_DIFF_KB
+        ):
+            violations.append(
+                f"用例 {index}: 内存 {base['kb']:.1f} KB -> {case['kb']:.1f} KB "
+                f"({_change(case['kb'], base['kb'])})"
+            )
+
+    peak_kb, base_peak = result.get("peak_kb"), baseline.get("peak_kb")
+    if peak_kb is not None and base_peak is not None:
+        if _exceeds(peak_kb, base_peak, tolerance, MIN_PEAK_DIFF_KB):
+            violations.append(
+                f"进程峰值内存: {base_peak} KB -> {peak_kb} KB ({_change(peak_kb, base_peak)})"
+            )
+    return violations
+
+
+def format_violations(
+    violations: List[str], baseline: Dict[str, Any], profile: str, tolerance: float
+) -> str:
+    """超出基线时追加到测试输出的说明"""
+    lines = [f"\n性能基线检查失败（容差 {tolerance:.0%}，基线固定于 {baseline.get('pinned_at')}）:"]
+    lines.extend(f"  {violation}" for violation in violations)
+    if baseline.get("profile") != profile:
+        lines.append(f"  注意: 构建配置已变化: {baseline.get('profile')} -> {profile}")
+    lines.append("若性能变化符合预期，请使用--pin-baseline重新固定基线")
+    return "\n".join(lines)
+
+
+def format_baseline(baseline_path: Path, result: Dict[str, Any]) -> str:
+    """固定基线后显示的每个用例的耗时和内存"""
+    lines = [f"已固定性能基线（{result.get('repeat', 1)} 次运行的中位数）: {baseline_path}"]
+    for index, case in enumerate(result["cases"], 1):
+        memory = f"  {case['kb']:.1f} KB" if "kb" in case else ""
+        lines.append(f"  用例 {index}: {case['ms']:.3f} ms{memory}")
+    if result.get("peak_kb") is not None:
+        lines.append(f"  进程峰值内存: {result['peak_kb']} KB")
+    return "\n".join(lines)
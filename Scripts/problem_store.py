@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+LeetCode题目数据存档 - 将题目信息保存在题目目录中，供之后的操作离线使用
+
+创建题目时，LeetCode返回的题目信息（元数据、所有语言的代码片段、示例测试用例、
+原始HTML描述等）以gzip压缩的JSON保存为题目目录下的problem.json.gz。
+之后添加语言、重新生成测试代码和README都读取该文件，不再请求LeetCode。
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lc_trace import debug
+
+# 题目目录中保存题目信息的文件名
+PROBLEM_FILE_NAME = "problem.json.gz"
+
+# 存档格式版本，保存的字段变化时递增
+PROBLEM_FILE_VERSION = 1
+
+
+def save_problem_info(directory: Path, problem_info: Dict[str, Any]) -> Path:
+    """将题目信息保存到题目目录，内容相同时生成的文件也相同"""
+    problem_file = Path(directory) / PROBLEM_FILE_NAME
+    payload = json.dumps(
+        {"version": PROBLEM_FILE_VERSION, "problem": problem_info},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    # 固定压缩文件头中的时间戳，避免内容未变时文件被视为已修改
+    with open(problem_file, "wb") as f:
+        f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    return problem_file
+
+
+def load_problem_info(directory: Path) -> Optional[Dict[str, Any]]:
+    """读取题目目录中保存的题目信息，文件不存在、损坏或版本不同时返回None"""
+    problem_file = Path(directory) / PROBLEM_FILE_NAME
+    try:
+        with gzip.open(problem_file, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        if problem_file.exists():
+            debug("读取题目数据失败: %s (%s)", problem_file, e)
+        return None
+    if data.get("version") != PROBLEM_FILE_VERSION:
+        return None
+    return data.get("problem")
+
+
+def find_problem_dirs(target: str = "all", tags_dir: Path = Path("Tags")) -> List[Path]:
+    """查找Tags/主标签/难度/题号形式的题目目录，target为题号或all"""
+    if not tags_dir.is_dir():
+        return []
+    pattern = "*/*/*" if target == "all" else f"*/*/{target}"
+    return sorted(path for path in tags_dir.glob(pattern) if path.is_dir())
+
+
+def load_local_problem_info(problem_id: str) -> Optional[Dict[str, Any]]:
+    """在工作区中查找题目已保存的题目信息"""
+    for problem_dir in find_problem_dirs(str(problem_id)):
+        problem_info = load_problem_info(problem_dir)
+        if problem_info:
+            return problem_info
+    return None
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+LeetCode测试结果缓存 - 解决方案未变化时直接返回上次的测试结果
+
+缓存键由以下内容的哈希组成:
+    - 解决方案的规范化指纹: Python为去掉文档字符串后的AST（注释和格式不影响AST），
+      C++为去掉注释和空白后的词法单元序列
+    - 测试用例数据（cases.jsonl）和共享运行时等测试代码依赖的文件
+    - 解释器或编译器的版本和编译选项
+因此只修改注释或格式时仍然命中缓存。结果保存在题目目录的
+.test_result_<语言>.json中，每种语言只保留最近一次的结果。
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# 缓存格式版本，指纹算法或结果格式变化时递增
+CACHE_VERSION = 2
+
+# C++中由多个字符组成的运算符，按最长匹配切分，避免 a++ + b 与 a + ++b 得到相同的词法单元
+_CPP_OPERATORS = (
+    "<<=", ">>=", "<=>", "->*", "...",
+    "::", "->", ".*", "++", "--", "<<", ">>", "<=", ">=", "==", "!=",
+    "&&", "||", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "##",
+)
+
+# C++词法单元: 注释、字符串和字符字面量、预处理指令（到行尾注释为止）、标识符、运算符和符号
+_CPP_TOKEN = re.compile(
+    r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<literal>R"(?P<delim>[^(\s]*)\(.*?\)(?P=delim)"
+        | "(?:\\.|[^"\\\n])*"
+        | '(?:\\.|[^'\\\n])*')
+    | (?P<directive>^[ \t]*\#(?:[^\n/]|/(?![/*]))*)
+    | (?P<token>\w+|OPERATORS|[^\w\s])
+    """.replace("OPERATORS", "|".join(re.escape(op) for op in _CPP_OPERATORS)),
+    re.DOTALL | re.MULTILINE | re.VERBOSE,
+)
+
+
+def result_cache_file(solution_file: Path, lang: str) -> Path:
+    return Path(solution_file).parent / f".test_result_{lang}.json"
+
+
+def _strip_docstrings(tree: ast.AST) -> ast.AST:
+    """移除模块、类和函数开头的文档字符串"""
+    for node in ast.walk(tree):
+        if isinstance(
+            node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+        ):
+            body = node.body
+            if (
+                body
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                node.body = body[1:] or [ast.Pass()]
+    return tree
+
+
+def normalize_python(source: str) -> str:
+    """Python源码的规范形式: 去掉文档字符串后的AST，不含行号"""
+    try:
+        return ast.dump(_strip_docstrings(ast.parse(source)))
+    except SyntaxError:
+        # 语法错误时按原文比较，修改后一定重新测试
+        return source
+
+
+def normalize_cpp(source: str) -> str:
+    """C++源码的规范形式: 去掉注释和空白的词法单元序列，预处理指令各占一行"""
+    parts = []
+    for match in _CPP_TOKEN.finditer(source):
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        if kind == "directive":
+            parts.append("\n" + " ".join(match.group().split()) + "\n")
+        else:
+            parts.append(match.group())
+    return " ".join(parts)
+
+
+def fingerprint(source: str, lang: str) -> str:
+    """解决方案的规范化指纹"""
+    normalized = normalize_python(source) if lang == "py" else normalize_cpp(source)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """文件内容的哈希，文件不存在时为空字符串"""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def toolchain_version(command: str) -> str:
+    """解释器或编译器的版本信息（--version输出的第一行）
+
+    按命令解析到的可执行文件及其修改时间缓存，长期运行的后台服务中
+    升级编译器或修改PATH后会重新读取版本。
+    """
+    path = shutil.which(command)
+    try:
+        stamp = os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        stamp = None
+    return _toolchain_version(command, path, stamp, os.environ.get("PATH"))
+
+
+@lru_cache(maxsize=32)
+def _toolchain_version(command: str, path, stamp, search_path) -> str:
+    try:
+        process = subprocess.run(
+            f"{command} --version", shell=True, capture_output=True, text=True
+        )
+    except OSError:
+        return ""
+    output = (process.stdout or process.stderr).strip()
+    return output.splitlines()[0] if output else ""
+
+
+def result_key(
+    solution_file: Path, lang: str, toolchain: str, dependencies: Iterable[Path]
+) -> str:
+    """计算测试结果的缓存键"""
+    with open(solution_file, "r", encoding="utf-8") as f:
+        source = f.read()
+    payload = json.dumps(
+        [
+            CACHE_VERSION,
+            lang,
+            fingerprint(source, lang),
+            [file_digest(path) for path in dependencies],
+            toolchain,
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_result(solution_file: Path, lang: str, key: str) -> Optional[Dict[str, Any]]:
+    """读取缓存的测试结果，缓存键不匹配时返回None"""
+    try:
+        with open(result_cache_file(solution_file, lang), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return data.get("result")
+
+
+def save_result(solution_file: Path, lang: str, key: str, result: Dict[str, Any]):
+    """保存测试结果"""
+    try:
+        with open(result_cache_file(solution_file, lang), "w", encoding="utf-8") as f:
+            json.dump({"key": key, "result": result}, f, ensure_ascii=False)
+    except OSError:
+        pass
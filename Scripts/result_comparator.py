@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+LeetCode结果比较器 - 结构化比较解决方案的输出与期望值
+
+期望值在cases.jsonl中以JSON保存，读取时即被解析为列表、字符串、数字等
+类型化结构。比较直接在结构上进行，遇到第一个差异立即返回，整体开销为
+O(n)，不需要把结果转换为字符串。
+
+支持的比较模式:
+    exact            - 精确比较
+    float            - 浮点数按容差比较
+    unordered        - 忽略最外层元素顺序（多重集合，基于哈希）
+    nested_unordered - 同时忽略外层和内层元素顺序，适用于"按任意顺序返回"的二维结果
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Optional
+
+from leetcode_runtime import linked_list_to_list, serialize, tree_to_list
+
+# 比较模式
+EXACT = "exact"
+FLOAT = "float"
+UNORDERED = "unordered"
+NESTED_UNORDERED = "nested_unordered"
+
+COMPARE_MODES = (EXACT, FLOAT, UNORDERED, NESTED_UNORDERED)
+
+# 浮点数比较的默认容差，与LeetCode判题一致
+DEFAULT_TOLERANCE = 1e-5
+
+# 题目描述中表示结果顺序无关的措辞
+_ANY_ORDER_PATTERN = re.compile(r"任意顺序|任何顺序|any order", re.IGNORECASE)
+# 内层元素顺序同样无关的常见题型（子集、组合、字母异位词分组等）
+_INNER_UNORDERED_PATTERN = re.compile(
+    r"子集|组合|异位词|subsets?|combinations?|anagrams?", re.IGNORECASE
+)
+
+
+def detect_compare_mode(return_type: str, problem_content: Optional[str] = None) -> str:
+    """根据返回类型和题目描述推断比较模式"""
+    return_type = return_type or ""
+    if return_type.startswith(("double", "float")) or return_type in (
+        "list<double>",
+        "list<float>",
+    ):
+        return FLOAT
+
+    is_sequence = return_type.endswith("[]") or return_type.startswith("list<")
+    if is_sequence and problem_content and _ANY_ORDER_PATTERN.search(problem_content):
+        is_nested = return_type.endswith("[][]") or return_type.startswith(
+            "list<list<"
+        )
+        if is_nested and _INNER_UNORDERED_PATTERN.search(problem_content):
+            return NESTED_UNORDERED
+        return UNORDERED
+
+    return EXACT
+
+
+def normalize(value: Any) -> Any:
+    """将链表、二叉树等节点结构转换为与LeetCode表示一致的列表
+
+    共享运行时中的节点类型按类型序列化；其他节点类（如旧的解决方案文件中
+    自行定义的ListNode、TreeNode）通过属性判断；其他值原样返回。
+    """
+    if value is None or isinstance(value, (bool, int, float, str, list)):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    serialized = serialize(value)
+    if serialized is not value:
+        return serialized
+    if hasattr(value, "next") and hasattr(value, "val"):
+        return linked_list_to_list(value)
+    if hasattr(value, "left") and hasattr(value, "right"):
+        return tree_to_list(value)
+    return value
+
+
+def _scalar_equal(actual: Any, expected: Any, tolerance: Optional[float]) -> bool:
+    """比较两个标量值"""
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        # 避免True与1被视为相等
+        return type(actual) is type(expected) and actual == expected
+    if tolerance is not None and isinstance(expected, (int, float)):
+        if not isinstance(actual, (int, float)):
+            return False
+        return math.isclose(actual, expected, rel_tol=tolerance, abs_tol=tolerance)
+    return actual == expected
+
+
+def _structural_equal(actual: Any, expected: Any, tolerance: Optional[float]) -> bool:
+    """逐元素比较两个嵌套结构，遇到第一个差异立即返回"""
+    stack = [(actual, expected)]
+    while stack:
+        actual, expected = stack.pop()
+        actual = normalize(actual)
+        if isinstance(expected, list):
+            if not isinstance(actual, list) or len(actual) != len(expected):
+                return False
+            if tolerance is None and actual == expected:
+                # 快速路径：内置列表比较在C层完成，且同样会短路；
+                # 但内置比较认为True == 1，含布尔值时仍需逐元素比较，
+                # 嵌套的列表也需要分别检查
+                types = set(map(type, actual)) | set(map(type, expected))
+                if bool not in types:
+                    if list in types:
+                        stack.extend(
+                            pair for pair in zip(actual, expected) if isinstance(pair[1], list)
+                        )
+                    continue
+            # 逆序压栈，使比较按从前到后的顺序进行
+            stack.extend(zip(reversed(actual), reversed(expected)))
+        elif not _scalar_equal(actual, expected, tolerance):
+            return False
+    return True
+
+
+def _freeze(value: Any, nested_unordered: bool = False) -> Any:
+    """将值转换为可哈希的形式，用于多重集合比较"""
+    value = normalize(value)
+    if isinstance(value, list):
+        items = (_freeze(item) for item in value)
+        if nested_unordered:
+            # 内层同样忽略顺序：使用元素计数构成的集合
+            return frozenset(Counter(items).items())
+        return tuple(items)
+    if isinstance(value, bool):
+        # 区分布尔值与整数
+        return ("bool", value)
+    return value
+
+
+def compare_results(
+    actual: Any,
+    expected: Any,
+    mode: str = EXACT,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> bool:
+    """按照指定模式比较解决方案的输出与期望值
+
+    Args:
+        actual: 解决方案的返回值，可以是链表或二叉树节点
+        expected: 已解析的期望值（来自cases.jsonl）
+        mode: 比较模式，见COMPARE_MODES
+        tolerance: float模式下的容差
+
+    Returns:
+        是否相等
+    """
+    if mode == FLOAT:
+        return _structural_equal(actual, expected, tolerance)
+    if mode in (UNORDERED, NESTED_UNORDERED):
+        actual = normalize(actual)
+        if not isinstance(expected, list) or not isinstance(actual, list):
+            return _structural_equal(actual, expected, None)
+        if len(actual) != len(expected):
+            return False
+        nested = mode == NESTED_UNORDERED
+        try:
+            return Counter(_freeze(item, nested) for item in actual) == Counter(
+                _freeze(item, nested) for item in expected
+            )
+        except TypeError:
+            # 存在不可哈希的元素时退化为精确比较
+            return _structural_equal(actual, expected, None)
+    return _structural_equal(actual, expected, None)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+LeetCode测试历史 - 将每次实际运行的测试结果追加到本地SQLite数据库
+
+每条记录包括题号、语言、构建配置（编译器或解释器版本和编译选项）、解决方案指纹、
+测试用例数据（cases.jsonl）的哈希、每个用例的耗时、峰值内存、验证结果和时间。
+使用缓存结果的测试没有重新运行，不会记录。
+
+find_regressions只比较与最近一次运行使用相同测试用例的运行，逐个用例比较最近几次
+通过的运行的耗时中位数与历史最佳，用于发现重构或修改编译选项后变慢的题目；
+添加或修改用例后重新开始比较。数据库默认为工作区根目录下的
+.lc_history.sqlite3，可以通过LC_HISTORY_FILE环境变量指定。
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HISTORY_FILE = ".lc_history.sqlite3"
+
+# 默认的退化阈值（最近中位数相对历史最佳的增长比例）
+DEFAULT_THRESHOLD = 0.2
+
+# 计算最近中位数使用的运行次数
+RECENT_RUNS = 5
+
+# 耗时差异小于该值（毫秒）时不视为退化，避免极短用例的计时噪声
+MIN_REGRESSION_MS = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    problem_id TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    total_ms REAL,
+    case_times TEXT,
+    cases_digest TEXT,
+    peak_kb INTEGER,
+    elapsed REAL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_problem ON runs (problem_id, lang, created_at);
+"""
+
+
+def history_file() -> Path:
+    return Path(os.environ.get("LC_HISTORY_FILE") or DEFAULT_HISTORY_FILE)
+
+
+def connect(path: Path = None) -> sqlite3.Connection:
+    """打开历史数据库，不存在时创建；多个测试并行写入时等待锁"""
+    conn = sqlite3.connect(str(path or history_file()), timeout=30)
+    conn.executescript(_SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+    if "cases_digest" not in columns:
+        # 较早创建的数据库没有测试用例的哈希，这些记录不参与之后的比较
+        conn.execute("ALTER TABLE runs ADD COLUMN cases_digest TEXT")
+    return conn
+
+
+def record_run(
+    problem_id: str,
+    lang: str,
+    profile: str,
+    fingerprint: str,
+    result: Dict[str, Any],
+    cases_digest: Optional[str] = None,
+):
+    """记录一次实际运行的测试结果（run_solution的返回值）"""
+    cases = result.get("cases")
+    if cases is None:
+        verdict, total_ms, case_times = "error", None, None
+    else:
+        verdict = "pass" if result["success"] else "fail"
+        total_ms = sum(case["ms"] for case in cases)
+        case_times = json.dumps([case["ms"] for case in cases])
+
+    try:
+        with connect() as conn:
+            conn.execute(
+                "INSERT INTO runs (problem_id, lang, profile, fingerprint, verdict,"
+                " total_ms, case_times, cases_digest, peak_kb, elapsed, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    problem_id,
+                    lang,
+                    profile,
+                    fingerprint,
+                    verdict,
+                    total_ms,
+                    case_times,
+                    cases_digest,
+                    result.get("peak_kb"),
+                    result.get("elapsed"),
+                    time.time(),
+                ),
+            )
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"警告: 无法记录测试历史: {e}")
+
+
+class Regression:
+    """一个变慢的解决方案，best_ms和recent_ms是变慢最多的用例的耗时"""
+
+    def __init__(
+        self, problem_id, lang, case_index, best_ms, best_profile, recent_ms, recent_profile
+    ):
+        self.problem_id = problem_id
+        self.lang = lang
+        self.case_index = case_index
+        self.best_ms = best_ms
+        self.best_profile = best_profile
+        self.recent_ms = recent_ms
+        self.recent_profile = recent_profile
+
+    @property
+    def ratio(self) -> float:
+        return self.recent_ms / self.best_ms - 1 if self.best_ms else float("inf")
+
+
+def find_regressions(
+    threshold: float = DEFAULT_THRESHOLD, recent_runs: int = RECENT_RUNS
+) -> List[Regression]:
+    """查找有用例最近几次通过的运行的耗时中位数比历史最佳慢threshold以上的解决方案
+
+    只比较与最近一次运行的测试用例相同（cases.jsonl的哈希一致）的运行。
+    """
+    path = history_file()
+    if not path.exists():
+        return []
+
+    conn = connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT problem_id, lang, profile, verdict, case_times, cases_digest FROM runs"
+            " ORDER BY problem_id, lang, created_at, id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    runs: Dict[tuple, List[tuple]] = {}
+    for problem_id, lang, profile, verdict, case_times, cases_digest in rows:
+        runs.setdefault((problem_id, lang), []).append(
+            (profile, verdict, case_times, cases_digest)
+        )
+
+    regressions = []
+    for (problem_id, lang), history in runs.items():
+        latest_digest = history[-1][3]
+        if latest_digest is None:
+            continue
+        passed = [
+            (profile, json.loads(case_times))
+            for profile, verdict, case_times, cases_digest in history
+            if verdict == "pass" and case_times and cases_digest == latest_digest
+        ]
+        if len(passed) < 2:
+            continue
+        recent = passed[-recent_runs:]
+
+        worst = None
+        for index in range(len(passed[0][1])):
+            best_ms, best_profile = min((times[index], profile) for profile, times in passed)
+            recent_ms = statistics.median(times[index] for _, times in recent)
+            if (
+                recent_ms > best_ms * (1 + threshold)
+                and recent_ms - best_ms > MIN_REGRESSION_MS
+            ):
+                regression = Regression(
+                    problem_id, lang, index, best_ms, best_profile, recent_ms, recent[-1][0]
+                )
+                if worst is None or regression.ratio > worst.ratio:
+                    worst = regression
+        if worst is not None:
+            regressions.append(worst)
+    regressions.sort(key=lambda r: r.ratio, reverse=True)
+    return regressions
+
+
+def print_regressions(threshold: float = DEFAULT_THRESHOLD) -> int:
+    """输出变慢的解决方案，返回数量"""
+    regressions = find_regressions(threshold)
+    if not regressions:
+        print(f"没有发现比历史最佳慢 {threshold:.0%} 以上的解决方案")
+        return 0
+
+    print(f"发现 {len(regressions)} 个比历史最佳慢 {threshold:.0%} 以上的解决方案:")
+    print(
+        f"{'题号':<8}{'语言':<6}{'用例':>6}{'最佳 (ms)':>12}{'最近中位数 (ms)':>18}{'变化':>10}"
+    )
+    for r in regressions:
+        print(
+            f"{r.problem_id:<8}{r.lang:<6}{r.case_index + 1:>6}{r.best_ms:>12.3f}"
+            f"{r.recent_ms:>18.3f}{r.ratio:>+10.0%}"
+        )
+        if r.best_profile != r.recent_profile:
+            print(f"    构建配置: {r.best_profile} -> {r.recent_profile}")
+    return len(regressions)
+
@@ -31,6 +31,12 @@ def setup_cpp_environment():
     # 检查g++是否安装
     if check_command("g++ --version"):
         print("√ 已安装g++编译器")
+
+        # 预编译共享的运行时头文件，加快之后每道题的编译
+        from test_solution import precompile_runtime_header
+
+        if precompile_runtime_header():
+            print("√ 已预编译运行时头文件: Scripts/leetcode_runtime.hpp.gch")
     else:
         print("× 未检测到g++编译器")
         print("  请安装MinGW-w64或MSVC++编译器")
@@ -320,7 +326,7 @@ def setup_vscode_settings():
             {
                 "label": "LeetCode: 创建题目",
                 "type": "shell",
-                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/create_problem.py ${input:problemId} ${input:language}",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc.py create_problem ${input:problemId} ${input:language}",
                 "presentation": {"reveal": "always", "panel": "new"},
                 "problemMatcher": [],
                 "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
@@ -328,7 +334,7 @@ def setup_vscode_settings():
             {
                 "label": "LeetCode: 获取每日一题",
                 "type": "shell",
-                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/daily_question.py ${input:language}",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc.py daily_question ${input:language}",
                 "presentation": {"reveal": "always", "panel": "new"},
                 "problemMatcher": [],
                 "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
@@ -336,7 +342,7 @@ def setup_vscode_settings():
             {
                 "label": "LeetCode: 测试解决方案",
                 "type": "shell",
-                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/test_solution.py ${input:problemId} ${input:language}",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc.py test_solution ${input:problemId} ${input:language}",
                 "presentation": {"reveal": "always", "panel": "new"},
                 "problemMatcher": [],
                 "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
@@ -344,7 +350,7 @@ def setup_vscode_settings():
             {
                 "label": "LeetCode: 提取提交代码",
                 "type": "shell",
-                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/test_solution.py ${input:problemId} ${input:language} --extract --open",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc.py test_solution ${input:problemId} ${input:language} --extract --open",
                 "presentation": {"reveal": "always", "panel": "new"},
                 "problemMatcher": [],
                 "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
@@ -352,7 +358,7 @@ def setup_vscode_settings():
             {
                 "label": "LeetCode: 提取当前文件代码",
                 "type": "shell",
-                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/extract_current.py --open",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc.py extract_current --open",
                 "presentation": {"reveal": "always", "panel": "new"},
                 "problemMatcher": [],
                 "options": {
@@ -362,6 +368,23 @@ def setup_vscode_settings():
                     }
                 },
             },
+            {
+                "label": "LeetCode: 启动后台服务",
+                "type": "shell",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc_daemon.py",
+                "isBackground": True,
+                "presentation": {"reveal": "silent", "panel": "dedicated"},
+                "problemMatcher": [],
+                "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
+            },
+            {
+                "label": "LeetCode: 停止后台服务",
+                "type": "shell",
+                "command": "${workspaceFolder}\\venv\\Scripts\\python.exe Scripts/lc_daemon.py --stop",
+                "presentation": {"reveal": "always", "panel": "new"},
+                "problemMatcher": [],
+                "options": {"env": {"PYTHONPATH": "${workspaceFolder}"}},
+            },
         ],
         "inputs": [
             {
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+LeetCode Python解决方案性能分析 - 运行测试代码，只分析Solution方法内部的调用
+
+测试代码构造参数、序列化和比较结果的开销不计入分析。支持两种模式:
+
+函数级（默认）: cProfile只在测试代码调用Solution的方法期间启用，方法内部的递归
+和辅助方法调用都会被记录。输出累计耗时和自身耗时最高的函数，并在解决方案所在目录保存:
+    profile.pstats   cProfile的原始数据，可用pstats、snakeviz等工具查看
+    profile.folded   折叠栈格式（"a;b;c 微秒"），可直接用于flamegraph.pl、speedscope等工具
+
+行级（--lines）: 只监视class Solution中代码的行事件，Python 3.12及以上使用
+sys.monitoring，更早的版本使用sys.settrace。统计每一行的执行次数和耗时（包括该行
+调用的函数），输出标注了统计数据的Solution类，并保存标注后的源码副本line_profile.txt。
+
+采样（--sample）: 用signal.setitimer定时中断，遍历被中断的调用栈，
+开销很低，适合运行数秒的大输入。输出样本最多的函数和行，并保存以样本数计的
+折叠栈sample_profile.folded。只支持提供setitimer的平台（Linux、macOS）。
+
+用法: python solution_profiler.py solution.py [--lines | --sample [--rate HZ]] [--top N]
+通常通过 python test_solution.py 题号 py --profile、--line-profile 或 --sample-profile 调用。
+"""
+
+import cProfile
+import functools
+import importlib.util
+import inspect
+import linecache
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+# 默认显示的函数数量
+DEFAULT_TOP = 15
+
+PSTATS_FILE_NAME = "profile.pstats"
+FOLDED_FILE_NAME = "profile.folded"
+LINE_PROFILE_FILE_NAME = "line_profile.txt"
+SAMPLE_FOLDED_FILE_NAME = "sample_profile.folded"
+
+# 采样分析默认的采样频率（每秒的样本数）
+DEFAULT_SAMPLE_RATE = 1000
+
+
+def load_solution_module(solution_file: Path):
+    """以模块方式导入解决方案文件，不执行其中的if __name__ == "__main__"部分"""
+    spec = importlib.util.spec_from_file_location("solution", solution_file)
+    module = importlib.util.module_from_spec(spec)
+    # inspect通过sys.modules查找类所在的源文件
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class ScopedProfiler:
+    """只在调用Solution的方法期间启用的cProfile"""
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.methods = {
+            name: func
+            for name, func in vars(cls).items()
+            if inspect.isfunction(func) and not name.startswith("__")
+        }
+        self.wrappers = {name: self._wrap(func) for name, func in self.methods.items()}
+        self.profiler = cProfile.Profile()
+        self.calls = 0
+
+    def _wrap(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # 调用期间恢复原方法，方法内部的递归和辅助方法调用不经过包装
+            self._install(self.methods)
+            self.calls += 1
+            self.profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.profiler.disable()
+                self._install(self.wrappers)
+
+        return wrapper
+
+    def _install(self, functions):
+        for name, func in functions.items():
+            setattr(self.cls, name, func)
+
+    def __enter__(self):
+        self._install(self.wrappers)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._install(self.methods)
+
+
+def function_label(func) -> str:
+    """pstats函数键(文件, 行号, 函数名)的显示名称"""
+    filename, line, name = func
+    if filename == "~":
+        # 内置函数，如<built-in method builtins.len>
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def profiled_stats(profiler: cProfile.Profile):
+    """cProfile的统计数据，去掉停止分析的调用本身"""
+    profiler.create_stats()
+    return {
+        func: data
+        for func, data in profiler.stats.items()
+        if "_lsprof.Profiler" not in func[2]
+    }
+
+
+def print_top(stats, key_index: int, title: str, top: int):
+    """按累计耗时（key_index=3）或自身耗时（key_index=2）输出前top个函数"""
+    print(f"\n{title}:")
+    print(f"{'调用次数':>10}{'自身 (ms)':>12}{'累计 (ms)':>12}  函数")
+    ranked = sorted(stats.items(), key=lambda item: item[1][key_index], reverse=True)
+    for func, (primitive_calls, calls, tottime, cumtime, _) in ranked[:top]:
+        ncalls = str(calls) if calls == primitive_calls else f"{calls}/{primitive_calls}"
+        print(
+            f"{ncalls:>10}{tottime * 1000:>12.3f}{cumtime * 1000:>12.3f}  "
+            f"{function_label(func)}"
+        )
+
+
+def collapsed_stacks(stats):
+    """将cProfile的调用关系展开为折叠栈，返回{栈: 微秒}
+
+    cProfile只记录调用者和被调用者之间的耗时，不记录完整的调用栈，
+    因此按每条调用边的累计耗时比例分配，结果是近似的；递归调用在第一次重复处截断。
+    """
+    children = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, {})[func] = edge[3]
+    # 没有调用者（或只有递归调用自身）的函数是测试代码直接调用的Solution方法
+    roots = [func for func, data in stats.items() if set(data[4]) <= {func}]
+
+    folded = {}
+
+    def walk(func, stack, cumtime):
+        total_cumtime = stats[func][3]
+        if total_cumtime <= 0:
+            return
+        scale = cumtime / total_cumtime
+        stack = stack + [function_label(func).replace(";", ",")]
+        key = ";".join(stack)
+        folded[key] = folded.get(key, 0) + stats[func][2] * scale
+        for child, edge_cumtime in children.get(func, {}).items():
+            if function_label(child) in stack:
+                continue
+            walk(child, stack, edge_cumtime * scale)
+
+    for root in roots:
+        walk(root, [], stats[root][3])
+    return {
+        stack: round(seconds * 1_000_000)
+        for stack, seconds in folded.items()
+        if round(seconds * 1_000_000) > 0
+    }
+
+
+def write_folded(folded, path: Path):
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, micros in sorted(folded.items()):
+            f.write(f"{stack} {micros}\n")
+
+
+def load_solution_class(solution_file: Path):
+    """导入解决方案，返回(模块, Solution类)；缺少Solution类或测试函数时返回None"""
+    module = load_solution_module(solution_file)
+    cls = getattr(module, "Solution", None)
+    if cls is None or not hasattr(module, "test_solution"):
+        print(f"错误: {solution_file} 中没有Solution类或测试函数")
+        return None
+    return module, cls
+
+
+def profile_solution(solution_file: Path, top: int = DEFAULT_TOP) -> int:
+    """运行测试代码并分析Solution方法的调用，返回退出码"""
+    loaded = load_solution_class(solution_file)
+    if loaded is None:
+        return 1
+    module, cls = loaded
+
+    scoped = ScopedProfiler(cls)
+    with scoped:
+        module.test_solution()
+    if not scoped.calls:
+        print("错误: 测试代码没有调用Solution的方法")
+        return 1
+
+    pstats_file = solution_file.parent / PSTATS_FILE_NAME
+    folded_file = solution_file.parent / FOLDED_FILE_NAME
+    scoped.profiler.dump_stats(str(pstats_file))
+    stats = profiled_stats(scoped.profiler)
+    total_ms = sum(data[2] for data in stats.values()) * 1000
+
+    print(f"\n===== 性能分析: {scoped.calls} 次Solution方法调用，共 {total_ms:.3f} ms =====")
+    print_top(stats, 3, "累计耗时最高的函数", top)
+    print_top(stats, 2, "自身耗时最高的函数", top)
+
+    write_folded(collapsed_stacks(stats), folded_file)
+    print(f"\n已保存cProfile数据: {pstats_file}")
+    print(f"已保存折叠栈: {folded_file}")
+    return 0
+
+
+def solution_code_objects(cls) -> Set:
+    """Solution类中定义的所有代码对象，包括嵌套函数、lambda和推导式"""
+    pending = []
+    for value in vars(cls).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        elif isinstance(value, property):
+            pending.extend(f.__code__ for f in (value.fget, value.fset) if f)
+            continue
+        if inspect.isfunction(value):
+            pending.append(value.__code__)
+
+    codes = set()
+    while pending:
+        code = pending.pop()
+        if code in codes:
+            continue
+        codes.add(code)
+        pending.extend(c for c in code.co_consts if inspect.iscode(c))
+    return codes
+
+
+class LineProfiler:
+    """统计Solution代码每一行的执行次数和耗时
+
+    一行的耗时是从该行开始执行到同一调用中下一行开始（或函数返回）的时间，
+    因此包括该行调用的函数，与line_profiler相同。
+    """
+
+    def __init__(self, codes):
+        self.codes = codes
+        self.hits: Dict[int, int] = {}
+        self.times: Dict[int, int] = {}
+        # 每个正在执行的调用（以帧的id区分）当前所在的行和开始时间
+        self.pending: Dict[int, tuple] = {}
+        self.backend = None
+
+    def _line(self, frame_key: int, line: int):
+        now = time.perf_counter_ns()
+        self._close(frame_key, now)
+        self.pending[frame_key] = (line, now)
+        self.hits[line] = self.hits.get(line, 0) + 1
+
+    def _close(self, frame_key: int, now: int = None):
+        current = self.pending.pop(frame_key, None)
+        if current is not None:
+            line, started = current
+            elapsed = (now or time.perf_counter_ns()) - started
+            self.times[line] = self.times.get(line, 0) + elapsed
+
+    # sys.monitoring（Python 3.12+）的回调，sys._getframe(1)是被监视的帧
+    def _monitor_start(self, code, offset):
+        self.pending.pop(id(sys._getframe(1)), None)
+
+    def _monitor_line(self, code, line):
+        self._line(id(sys._getframe(1)), line)
+
+    def _monitor_exit(self, code, offset, value):
+        self._close(id(sys._getframe(1)))
+
+    # sys.settrace的回调
+    def _trace_call(self, frame, event, arg):
+        if event == "call" and frame.f_code in self.codes:
+            self.pending.pop(id(frame), None)
+            return self._trace_local
+        return None
+
+    def _trace_local(self, frame, event, arg):
+        if event == "line":
+            self._line(id(frame), frame.f_lineno)
+        elif event == "return":
+            self._close(id(frame))
+        return self._trace_local
+
+    def _start_monitoring(self) -> bool:
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is None:
+            return False
+        tool = monitoring.PROFILER_ID
+        try:
+            monitoring.use_tool_id(tool, "leetcode-line-profiler")
+        except ValueError:
+            # 其他分析器正在使用该工具编号
+            return False
+        events = monitoring.events
+        monitoring.register_callback(tool, events.PY_START, self._monitor_start)
+        monitoring.register_callback(tool, events.LINE, self._monitor_line)
+        monitoring.register_callback(tool, events.PY_RETURN, self._monitor_exit)
+        monitoring.register_callback(tool, events.PY_YIELD, self._monitor_exit)
+        # 只为Solution的代码对象开启事件，其他代码（包括测试代码）没有额外开销
+        local_events = events.PY_START | events.LINE | events.PY_RETURN | events.PY_YIELD
+        for code in self.codes:
+            monitoring.set_local_events(tool, code, local_events)
+        return True
+
+    def _stop_monitoring(self):
+        monitoring = sys.monitoring
+        tool = monitoring.PROFILER_ID
+        for code in self.codes:
+            monitoring.set_local_events(tool, code, 0)
+        for event in ("PY_START", "LINE", "PY_RETURN", "PY_YIELD"):
+            monitoring.register_callback(tool, getattr(monitoring.events, event), None)
+        monitoring.free_tool_id(tool)
+
+    def __enter__(self):
+        if self._start_monitoring():
+            self.backend = "sys.monitoring"
+        else:
+            self.backend = "sys.settrace"
+            sys.settrace(self._trace_call)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.backend == "sys.monitoring":
+            self._stop_monitoring()
+        else:
+            sys.settrace(None)
+
+
+def annotate_lines(source_lines, profiler: LineProfiler, first: int, last: int):
+    """为first到last行（从1开始）的源码加上执行次数、总耗时和每次耗时的标注"""
+    annotated = []
+    for line_number in range(first, last + 1):
+        text = source_lines[line_number - 1].rstrip("\n")
+        hits = profiler.hits.get(line_number)
+        if hits:
+            total_ms = profiler.times.get(line_number, 0) / 1_000_000
+            per_hit_us = total_ms * 1000 / hits
+            columns = f"{hits:>9}{total_ms:>12.3f}{per_hit_us:>12.3f}"
+        else:
+            columns = " " * 33
+        annotated.append(f"{columns}  {line_number:>5}  {text}")
+    return annotated
+
+
+def line_profile_solution(solution_file: Path, top: int = DEFAULT_TOP) -> int:
+    """运行测试代码并统计Solution类中每一行的执行次数和耗时，返回退出码"""
+    loaded = load_solution_class(solution_file)
+    if loaded is None:
+        return 1
+    module, cls = loaded
+
+    profiler = LineProfiler(solution_code_objects(cls))
+    with profiler:
+        module.test_solution()
+    if not profiler.hits:
+        print("错误: 测试代码没有执行Solution中的代码")
+        return 1
+
+    with open(solution_file, "r", encoding="utf-8") as f:
+        source_lines = f.readlines()
+    class_lines, class_start = inspect.getsourcelines(cls)
+    class_end = class_start + len(class_lines) - 1
+    header = f"{'次数':>7}{'总耗时 (ms)':>12}{'每次 (us)':>12}  {'行号':>4}  代码"
+
+    print(f"\n===== 行级性能分析（{profiler.backend}） =====")
+    print(header)
+    for line in annotate_lines(source_lines, profiler, class_start, class_end):
+        print(line)
+
+    hottest = sorted(profiler.times.items(), key=lambda item: item[1], reverse=True)
+    print("\n耗时最高的行:")
+    for line_number, elapsed in hottest[:top]:
+        code = source_lines[line_number - 1].strip()
+        print(f"  {line_number:>5}  {elapsed / 1_000_000:>10.3f} ms  {code}")
+
+    output_file = solution_file.parent / LINE_PROFILE_FILE_NAME
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(f"# 行级性能分析（{profiler.backend}）: {solution_file.name}\n")
+        f.write(header + "\n")
+        for line in annotate_lines(source_lines, profiler, 1, len(source_lines)):
+            f.write(line + "\n")
+    print(f"\n已保存标注后的源码: {output_file}")
+    return 0
+
+
+class StackSampler:
+    """基于SIGALRM定时器的采样分析器
+
+    每隔1/rate秒触发一次信号，处理函数从被中断的帧向上遍历调用栈，
+    只保留从最外层Solution帧开始的部分，测试代码中的样本只计数。Python只在字节码
+    之间处理信号，耗时较长的内置函数（如sorted）返回后才会采样，样本计入调用它的行。
+    使用按实际时间计时的ITIMER_REAL: 按CPU时间计时的ITIMER_PROF受内核时钟节拍限制，
+    在常见的配置下每秒最多只有100~250个样本；测试代码单线程且以计算为主，两者基本一致。
+    """
+
+    def __init__(self, codes, rate: int):
+        self.codes = codes
+        self.interval = 1 / rate
+        # 调用栈（从外到内的代码对象）到样本数的映射
+        self.stacks: Dict[tuple, int] = {}
+        # 最内层的(代码对象, 行号)到样本数的映射
+        self.lines: Dict[tuple, int] = {}
+        self.other_samples = 0
+        self.handler_seconds = 0.0
+        self.elapsed = 0.0
+        self.handling = False
+        # (代码对象, 指令偏移)到行号的缓存，用于没有行号的指令
+        self.line_cache: Dict[tuple, Optional[int]] = {}
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def _handle(self, signum, frame):
+        # 处理函数运行较慢时下一个信号可能在处理函数内部到达，此时丢弃该样本，
+        # 避免把处理函数自身的帧计入Solution的调用栈
+        if self.handling:
+            return
+        self.handling = True
+        try:
+            started = time.perf_counter()
+            self._record(frame)
+            self.handler_seconds += time.perf_counter() - started
+        finally:
+            self.handling = False
+
+    def _record(self, frame):
+        # 信号在设置handling之前到达时，被中断的是处理函数自身，跳过这些帧
+        while frame is not None and frame.f_code in _SAMPLER_CODES:
+            frame = frame.f_back
+        frames = []
+        outermost = -1
+        while frame is not None:
+            if frame.f_code in self.codes:
+                outermost = len(frames)
+            frames.append(frame)
+            frame = frame.f_back
+        if outermost < 0:
+            self.other_samples += 1
+            return
+        stack = tuple([f.f_code for f in reversed(frames[: outermost + 1])])
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        leaf = frames[0]
+        line = leaf.f_lineno
+        if line is None:
+            line = self._line_before(leaf.f_code, leaf.f_lasti)
+        if line is not None:
+            key = (leaf.f_code, line)
+            self.lines[key] = self.lines.get(key, 0) + 1
+
+    def _line_before(self, code, lasti):
+        """没有行号的指令（如Python 3.11中循环末尾的JUMP_BACKWARD，信号正是在这里
+        处理的）之前最近的一行"""
+        key = (code, lasti)
+        if key not in self.line_cache:
+            line = None
+            for start, _, lineno in code.co_lines():
+                if start > lasti:
+                    break
+                if lineno is not None:
+                    line = lineno
+            self.line_cache[key] = line
+        return self.line_cache[key]
+
+    def __enter__(self):
+        self.previous_handler = signal.signal(signal.SIGALRM, self._handle)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self.previous_handler)
+        self.elapsed = time.perf_counter() - self.started
+
+
+_SAMPLER_CODES = {
+    StackSampler._handle.__code__,
+    StackSampler._record.__code__,
+    StackSampler._line_before.__code__,
+}
+
+
+def code_label(code) -> str:
+    return function_label((code.co_filename, code.co_firstlineno, code.co_name))
+
+
+def sample_profile_solution(
+    solution_file: Path, top: int = DEFAULT_TOP, rate: int = DEFAULT_SAMPLE_RATE
+) -> int:
+    """在采样分析器下运行测试代码，输出Solution中样本最多的函数和行，返回退出码"""
+    if not hasattr(signal, "setitimer"):
+        print("错误: 当前平台不支持signal.setitimer，无法进行采样分析")
+        return 1
+    loaded = load_solution_class(solution_file)
+    if loaded is None:
+        return 1
+    module, cls = loaded
+
+    sampler = StackSampler(solution_code_objects(cls), rate)
+    with sampler:
+        module.test_solution()
+
+    total = sampler.samples
+    overhead = sampler.handler_seconds / sampler.elapsed if sampler.elapsed else 0
+    print(
+        f"\n===== 采样分析: {rate} Hz，Solution中 {total} 个样本，"
+        f"测试代码中 {sampler.other_samples} 个，采样开销约 {overhead:.1%} ====="
+    )
+    if not total:
+        print("没有采集到Solution中的样本，用例运行时间太短；可以提高--rate或使用更大的输入")
+        return 0
+
+    self_samples: Dict = {}
+    total_samples: Dict = {}
+    for stack, count in sampler.stacks.items():
+        self_samples[stack[-1]] = self_samples.get(stack[-1], 0) + count
+        for code in set(stack):
+            total_samples[code] = total_samples.get(code, 0) + count
+
+    print(f"\n{'自身样本':>10}{'自身%':>8}{'总样本':>10}{'总%':>8}  函数")
+    ranked = sorted(
+        total_samples,
+        key=lambda code: (self_samples.get(code, 0), total_samples[code]),
+        reverse=True,
+    )
+    for code in ranked[:top]:
+        own = self_samples.get(code, 0)
+        print(
+            f"{own:>10}{own / total:>8.1%}{total_samples[code]:>10}"
+            f"{total_samples[code] / total:>8.1%}  {code_label(code)}"
+        )
+
+    print("\n样本最多的行:")
+    hottest = sorted(sampler.lines.items(), key=lambda item: item[1], reverse=True)
+    for (code, line), count in hottest[:top]:
+        location = f"{os.path.basename(code.co_filename)}:{line}"
+        text = linecache.getline(code.co_filename, line).strip()
+        print(f"  {count:>8}{count / total:>8.1%}  {location}  {text}")
+
+    folded = {}
+    for stack, count in sampler.stacks.items():
+        key = ";".join(code_label(code).replace(";", ",") for code in stack)
+        folded[key] = folded.get(key, 0) + count
+    folded_file = solution_file.parent / SAMPLE_FOLDED_FILE_NAME
+    write_folded(folded, folded_file)
+    print(f"\n已保存折叠栈（样本数）: {folded_file}")
+    return 0
+
+
+def main():
+    """主函数"""
+    args = sys.argv[1:]
+    top = DEFAULT_TOP
+    if "--top" in args:
+        index = args.index("--top")
+        top = int(args[index + 1])
+        del args[index : index + 2]
+    rate = DEFAULT_SAMPLE_RATE
+    if "--rate" in args:
+        index = args.index("--rate")
+        rate = int(args[index + 1])
+        del args[index : index + 2]
+    line_mode = "--lines" in args
+    sample_mode = "--sample" in args
+    args = [arg for arg in args if arg not in ("--lines", "--sample")]
+    if not args:
+        print(
+            "用法: python solution_profiler.py solution.py "
+            "[--lines | --sample [--rate HZ]] [--top N]"
+        )
+        return 1
+    if sample_mode:
+        return sample_profile_solution(Path(args[0]), top, rate)
+    if line_mode:
+        return line_profile_solution(Path(args[0]), top)
+    return profile_solution(Path(args[0]), top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
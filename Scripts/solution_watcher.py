@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+LeetCode解决方案监视 - 保存solution.py/solution.cpp后自动重新测试对应的题目
+
+Linux上通过ctypes调用inotify监视Tags目录，其他平台或inotify不可用时
+定期比较文件的修改时间。编辑器保存文件时通常会产生一连串事件，
+事件停止DEBOUNCE_SECONDS秒后才开始测试；测试进行中再次保存时，
+正在进行的测试会被取消，以最新的文件重新测试。
+
+每次测试在子进程中运行test_solution.py，与手动运行的编译和测试流程完全相同。
+用法: python test_solution.py --watch
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# 保存事件停止后等待的时间（秒），合并编辑器的连续写入
+DEBOUNCE_SECONDS = 0.3
+
+# 轮询模式下检查修改时间的间隔（秒）
+POLL_INTERVAL = 0.5
+
+# 监视的解决方案文件
+SOLUTION_FILES = ("solution.py", "solution.cpp")
+
+TEST_SCRIPT = Path(__file__).resolve().parent / "test_solution.py"
+
+# inotify事件掩码，见inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# struct inotify_event的固定部分: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_solution_file(path: Path) -> bool:
+    return path.name in SOLUTION_FILES
+
+
+class InotifyWatcher:
+    """基于inotify的目录监视，递归监视目录及之后新建的子目录"""
+
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, root: Path):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1失败")
+        # 监视描述符到目录的映射
+        self.watches: Dict[int, Path] = {}
+        self.add_tree(root)
+
+    def add_tree(self, directory: Path):
+        """监视目录及其所有子目录"""
+        for current, _, _ in os.walk(directory):
+            wd = self.libc.inotify_add_watch(
+                self.fd, os.fsencode(current), self.WATCH_MASK
+            )
+            if wd >= 0:
+                self.watches[wd] = Path(current)
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """等待最多timeout秒，返回被写入的解决方案文件"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                # 新建的题目目录，mkdir -p可能已经创建了更深的子目录
+                if mask & IN_CREATE:
+                    self.add_tree(path)
+                    changed.update(
+                        p for p in path.rglob("solution.*") if is_solution_file(p)
+                    )
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and is_solution_file(path):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """定期比较解决方案文件修改时间的监视，用于不支持inotify的平台"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.mtimes = self.scan()
+
+    def scan(self) -> Dict[Path, int]:
+        mtimes = {}
+        for name in SOLUTION_FILES:
+            for path in self.root.glob(f"*/*/*/{name}"):
+                try:
+                    mtimes[path] = path.stat().st_mtime_ns
+                except OSError:
+                    pass
+        return mtimes
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """等待最多timeout秒，返回修改时间变化的解决方案文件"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = POLL_INTERVAL
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+
+            mtimes = self.scan()
+            changed = {
+                path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime
+            }
+            self.mtimes = mtimes
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(root: Path):
+    """优先使用inotify，不可用时退回到轮询"""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"inotify不可用，改为轮询文件修改时间: {e}")
+    return PollingWatcher(root)
+
+
+class TestRun:
+    """一次在子进程中运行的测试"""
+
+    def __init__(self, solution_file: Path):
+        self.solution_file = solution_file
+        self.problem_id = solution_file.parent.name
+        self.lang = solution_file.suffix[1:]
+        self.started = time.monotonic()
+        print(f"\n[监视] 正在测试题目 {self.problem_id} ({self.lang})...", flush=True)
+        # 子进程位于独立的进程组，取消时连同g++和解决方案进程一起结束
+        self.process = subprocess.Popen(
+            [sys.executable, str(TEST_SCRIPT), self.problem_id, self.lang],
+            start_new_session=hasattr(os, "killpg"),
+        )
+
+    def finished(self) -> bool:
+        return self.process.poll() is not None
+
+    def cancel(self):
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        else:
+            self.process.terminate()
+        self.process.wait()
+        print(f"[监视] 检测到新的保存，已取消题目 {self.problem_id} ({self.lang}) 的测试")
+
+    def report(self):
+        elapsed = time.monotonic() - self.started
+        verdict = "通过" if self.process.returncode == 0 else "失败"
+        print(f"[监视] 题目 {self.problem_id} ({self.lang}): {verdict} ({elapsed:.1f}s)")
+
+
+def watch(root: Path = Path("Tags"), debounce: float = DEBOUNCE_SECONDS):
+    """监视解决方案文件，保存后重新测试对应的题目，直到按Ctrl+C"""
+    if not root.is_dir():
+        print(f"错误: 找不到目录 {root}")
+        return 1
+
+    watcher = create_watcher(root)
+    print(f"正在监视 {root} 中的解决方案文件（{type(watcher).__name__}），按Ctrl+C退出")
+
+    # 等待测试的文件，按保存顺序排列
+    queue: List[Path] = []
+    last_event = 0.0
+    current: Optional[TestRun] = None
+    try:
+        while True:
+            if queue:
+                timeout = max(debounce - (time.monotonic() - last_event), 0.05)
+            elif current:
+                timeout = 0.1
+            else:
+                timeout = None
+            changed = watcher.wait(timeout)
+
+            if changed:
+                last_event = time.monotonic()
+                cancelled = None
+                if current and not current.finished():
+                    current.cancel()
+                    cancelled = current.solution_file
+                    current = None
+                queue = [path for path in queue if path not in changed]
+                queue.extend(sorted(changed))
+                # 被取消的文件在新保存的文件之后重新测试
+                if cancelled and cancelled not in queue:
+                    queue.append(cancelled)
+                continue
+
+            if current and current.finished():
+                current.report()
+                current = None
+
+            if not current and queue and time.monotonic() - last_event >= debounce:
+                current = TestRun(queue.pop(0))
+    except KeyboardInterrupt:
+        if current and not current.finished():
+            current.cancel()
+        print("\n已停止监视")
+    finally:
+        watcher.close()
+    return 0
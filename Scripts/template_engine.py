@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+LeetCode模板引擎 - 将解决方案、README和笔记模板编译为片段列表
+
+模板语法:
+    {{name}}               变量，渲染时替换为对应的值
+    {{#name}} ... {{/name}} 命名区块，渲染时整体替换为提供的内容（按整行替换），
+                           未提供时保留区块中的默认内容
+
+区块标记独占一行时，标记所在的行不会出现在输出中。模板只编译一次，
+编译结果按文件路径和修改时间缓存；渲染只是按顺序拼接字符串，
+耗时与输出长度成线性关系。
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# 独占一行的区块标记，或行内的变量
+_TAG_PATTERN = re.compile(r"^\{\{([#/])(\w+)\}\}\n|\{\{(\w+)\}\}", re.MULTILINE)
+
+# 片段: 字面文本、变量名或(区块名, 默认内容的片段列表)
+Segment = Union[str, Tuple[str], Tuple[str, list]]
+
+
+class TemplateError(ValueError):
+    """模板语法错误"""
+
+
+class Template:
+    """编译后的模板"""
+
+    def __init__(self, source: str, name: str = "<模板>"):
+        self.name = name
+        self.segments = self._compile(source)
+
+    def _compile(self, source: str) -> List[Segment]:
+        """将模板源码编译为片段列表，区块的默认内容编译为嵌套的片段列表"""
+        root: List[Segment] = []
+        # 未闭合的区块栈，元素为(区块名, 区块的片段列表)
+        stack: List[Tuple[Optional[str], List[Segment]]] = [(None, root)]
+        pos = 0
+        for match in _TAG_PATTERN.finditer(source):
+            segments = stack[-1][1]
+            if match.start() > pos:
+                segments.append(source[pos : match.start()])
+            pos = match.end()
+
+            kind, section, variable = match.groups()
+            if variable:
+                segments.append((variable,))
+            elif kind == "#":
+                children: List[Segment] = []
+                segments.append((section, children))
+                stack.append((section, children))
+            elif stack[-1][0] != section:
+                raise TemplateError(f"{self.name}: {{{{/{section}}}}} 没有对应的开始标记")
+            else:
+                stack.pop()
+
+        if len(stack) > 1:
+            raise TemplateError(f"{self.name}: 区块 {stack[-1][0]} 没有结束标记")
+        if pos < len(source):
+            root.append(source[pos:])
+        return root
+
+    def render(
+        self, variables: Dict[str, str], sections: Dict[str, str] = None
+    ) -> str:
+        """渲染模板，未提供的变量保留原样，未提供的区块使用默认内容"""
+        parts: List[str] = []
+        self._render_into(self.segments, variables, sections or {}, parts)
+        return "".join(parts)
+
+    def _render_into(self, segments, variables, sections, parts):
+        for segment in segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+            elif len(segment) == 1:
+                name = segment[0]
+                parts.append(
+                    str(variables[name]) if name in variables else f"{{{{{name}}}}}"
+                )
+            elif segment[0] in sections:
+                # 区块按整行替换，内容末尾补充换行
+                content = sections[segment[0]]
+                parts.append(content)
+                if content and not content.endswith("\n"):
+                    parts.append("\n")
+            else:
+                self._render_into(segment[1], variables, sections, parts)
+
+
+# 编译结果缓存，键为模板路径，值为(修改时间, 编译后的模板)
+_template_cache: Dict[str, Tuple[int, Template]] = {}
+
+
+def load_template(path: Path) -> Template:
+    """读取并编译模板文件，文件未修改时复用编译结果"""
+    path = Path(path)
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime_ns
+    cached = _template_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        template = Template(f.read(), path.name)
+    _template_cache[key] = (mtime, template)
+    return template
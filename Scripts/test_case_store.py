@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+LeetCode测试用例数据文件 - 将解析后的测试用例保存为cases.jsonl
+
+生成的测试代码不再内联测试数据，而是在运行时逐行读取与解决方案
+位于同一目录的cases.jsonl。每行是一个JSON对象:
+    {"params": [参数1, 参数2, ...], "expected": 期望输出}
+没有期望输出的用例省略expected字段。
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from case_ir import ProblemIR, load_problem_ir
+
+# 测试用例数据文件名
+CASES_FILE_NAME = "cases.jsonl"
+
+
+def dump_cases(problem_ir: ProblemIR) -> str:
+    """将题目中间表示中的测试用例序列化为JSON Lines文本"""
+    lines = [
+        json.dumps(case.to_record(), ensure_ascii=False, separators=(",", ":"))
+        for case in problem_ir.cases
+    ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def build_case_data(
+    test_cases: str, meta_data: Dict[str, Any], problem_content: str = None
+) -> str:
+    """解析测试用例并生成cases.jsonl的内容"""
+    if not test_cases or not meta_data:
+        return ""
+    problem_ir = load_problem_ir(test_cases, meta_data, problem_content)
+    return dump_cases(problem_ir) if problem_ir else ""
+
+
+def write_cases(directory: Path, case_data: str) -> Path:
+    """将测试用例数据写入题目目录下的cases.jsonl"""
+    cases_file = Path(directory) / CASES_FILE_NAME
+    with open(cases_file, "w", encoding="utf-8") as f:
+        f.write(case_data)
+    return cases_file
+
+
+def merge_cases(cases_file: Path, case_data: str) -> int:
+    """将case_data中新的用例追加到已有的cases.jsonl，返回追加的用例数
+
+    已有的行（包括用户添加的用例）保持不变，参数相同的用例不会重复添加；
+    文件不存在时直接写入case_data。
+    """
+    cases_file = Path(cases_file)
+    if not cases_file.exists():
+        write_cases(cases_file.parent, case_data)
+        return sum(1 for line in case_data.splitlines() if line.strip())
+
+    with open(cases_file, "r", encoding="utf-8") as f:
+        existing = f.read()
+    known = set()
+    for line in existing.splitlines():
+        try:
+            known.add(_params_key(json.loads(line)))
+        except (ValueError, KeyError, TypeError):
+            # 空行和无法解析的行原样保留
+            continue
+
+    new_lines = []
+    for line in case_data.splitlines():
+        if not line.strip():
+            continue
+        key = _params_key(json.loads(line))
+        if key not in known:
+            known.add(key)
+            new_lines.append(line)
+    if new_lines:
+        with open(cases_file, "a", encoding="utf-8") as f:
+            if existing and not existing.endswith("\n"):
+                f.write("\n")
+            f.write("\n".join(new_lines) + "\n")
+    return len(new_lines)
+
+
+def _params_key(record: Dict[str, Any]) -> str:
+    return json.dumps(record["params"], sort_keys=True, separators=(",", ":"))
+
+
+def load_cases(cases_file: Path) -> Iterator[Dict[str, Any]]:
+    """逐行读取cases.jsonl，按需产出每个测试用例"""
+    with open(cases_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
@@ -5,20 +5,105 @@ LeetCode代码测试和提交工具
     - 测试代码: python test_solution.py 题号 [语言]
     - 提取提交代码: python test_solution.py 题号 [语言] --extract
     - 提取代码并自动跳转: python test_solution.py 题号 [语言] --extract --open
+    - 测试所有题目: python test_solution.py --all [--jobs 并行数]
+    - 测试变化的题目: python test_solution.py --changed [版本] [--jobs 并行数]
+    - 监视并自动测试: python test_solution.py --watch
+    - 查找变慢的解决方案: python test_solution.py --regressions [--threshold 比例]
+    - 固定性能基线: python test_solution.py 题号 [语言] --pin-baseline [--repeat 次数] [--tolerance 比例]
+    - 性能分析: python test_solution.py 题号 [语言] --profile [--top N]
+    - 行级性能分析: python test_solution.py 题号 py --line-profile [--top N]
+    - 采样性能分析: python test_solution.py 题号 py --sample-profile [--rate 频率] [--top N]
 示例:
     - python test_solution.py 100 cpp     # 测试第100题的C++解决方案
     - python test_solution.py 100 py --extract  # 提取第100题的Python解决方案用于提交
     - python test_solution.py 100 py --extract --open  # 提取代码并自动打开题目页面
+    - python test_solution.py --watch     # 保存任意solution.py/solution.cpp后自动重新测试该题
+    - python test_solution.py 100 py --no-cache  # 忽略缓存的测试结果，重新运行
+    - python test_solution.py --changed main     # 测试相对main分支（含未提交的修改）变化的题目
+    - python test_solution.py --regressions --threshold 0.5  # 列出最近比历史最佳慢50%以上的解决方案
+    - python test_solution.py 100 py --pin-baseline --tolerance 0.1  # 之后任一用例慢10%以上时测试失败
+    - python test_solution.py 100 py --profile  # 用cProfile分析Solution方法，保存.pstats和折叠栈
+    - python test_solution.py 100 cpp --profile  # 用gprof（以及可用时的perf stat）分析C++解决方案
+    - python test_solution.py 100 py --line-profile  # 统计Solution每一行的执行次数和耗时
+    - python test_solution.py 100 py --sample-profile --rate 500  # 低开销采样，适合运行时间长的大输入
 支持的语言: cpp, py
+
+解决方案（忽略注释和格式）、测试用例、运行时和编译器版本都未变化时，
+直接返回上次的测试结果，--all只运行发生变化的解决方案。
+每次实际运行的结果都会追加到测试历史（.lc_history.sqlite3），用于--regressions；
+--all和--changed并行运行的测试耗时不可比，不会记录。
+固定了性能基线的题目，每次测试会重复运行并与基线比较，超出容差时测试失败。
 """
 
+import json
 import os
 import sys
 import subprocess
 import re
+import tempfile
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
+
+from leetcode_runtime import MEMORY_TRACE_ENV, RESULT_FILE_ENV
+from cpp_profiler import profile_cpp_solution
+from perf_baseline import (
+    CHECK_REPEAT,
+    DEFAULT_TOLERANCE,
+    PIN_REPEAT,
+    baseline_file,
+    compare_baseline,
+    format_baseline,
+    format_violations,
+    load_baseline,
+    save_baseline,
+    summarize_runs,
+)
+from problem_store import find_problem_dirs
+from result_cache import (
+    file_digest,
+    fingerprint,
+    load_result,
+    result_key,
+    save_result,
+    toolchain_version,
+)
+from run_history import DEFAULT_THRESHOLD, print_regressions, record_run
+from test_case_store import CASES_FILE_NAME
+
+# C++编译选项，预编译头文件只有在编译选项一致时才会被使用
+CPP_FLAGS = "-std=c++17"
+
+# 所有C++解决方案共享的运行时头文件
+RUNTIME_HEADER = SCRIPTS_DIR / "leetcode_runtime.hpp"
+
+
+def precompile_runtime_header():
+    """预编译共享的运行时头文件，头文件更新后重新生成
+
+    g++会在包含leetcode_runtime.hpp时自动使用同目录下的.gch文件，
+    预编译失败时仍可直接编译，只是速度较慢。
+    """
+    pch_file = RUNTIME_HEADER.with_name(RUNTIME_HEADER.name + ".gch")
+    if pch_file.exists() and pch_file.stat().st_mtime >= RUNTIME_HEADER.stat().st_mtime:
+        return True
+
+    precompile_cmd = f'g++ {CPP_FLAGS} -x c++-header "{RUNTIME_HEADER}" -o "{pch_file}"'
+    print(f"正在预编译运行时头文件: {precompile_cmd}")
+    precompile_process = subprocess.run(
+        precompile_cmd, shell=True, capture_output=True, text=True
+    )
+    if precompile_process.returncode != 0:
+        print("警告: 预编译头文件失败，将直接编译")
+        print(precompile_process.stderr)
+        return False
+    return True
+
 
 def find_solution_file(problem_id, lang):
     """查找题目的解决方案文件"""
@@ -76,65 +161,355 @@ def get_problem_url(problem_id, solution_file):
     return f"https://leetcode.cn/problems/{problem_id}/"
 
 
-def test_solution(solution_file, lang):
+def build_profile(lang):
+    """构建配置: 编译器版本和编译选项，或解释器版本"""
+    if lang == "cpp":
+        return f"{toolchain_version('g++')} {CPP_FLAGS}"
+    return toolchain_version("python")
+
+
+def solution_result_key(solution_file, lang):
+    """测试结果的缓存键: 解决方案指纹、测试用例、性能基线和运行时的哈希，以及工具链版本"""
+    dependencies = [
+        solution_file.parent / CASES_FILE_NAME,
+        baseline_file(solution_file, lang),
+    ]
+    if lang == "cpp":
+        dependencies.append(RUNTIME_HEADER)
+    else:
+        dependencies.append(SCRIPTS_DIR / "leetcode_runtime.py")
+        dependencies.append(SCRIPTS_DIR / "result_comparator.py")
+    return result_key(solution_file, lang, build_profile(lang), dependencies)
+
+
+def run_process(command, output, env=None):
+    """运行测试进程，将其输出追加到output，返回进程结果"""
+    process = subprocess.run(
+        command, shell=True, capture_output=True, text=True, env=env
+    )
+    output.append("输出:")
+    output.append(process.stdout)
+    if process.stderr:
+        output.append("错误:")
+        output.append(process.stderr)
+    return process
+
+
+def build_solution(solution_file, lang, output):
+    """编译解决方案，返回运行测试代码的命令；编译失败时返回None"""
+    if lang != "cpp":
+        output.append(f"正在运行Python解决方案: {solution_file}")
+        return f"python {solution_file}"
+
+    # 编译C++代码
+    output_exe = solution_file.with_suffix(".exe")
+    precompile_runtime_header()
+    compile_cmd = f"g++ {CPP_FLAGS} {solution_file} -o {output_exe}"
+    output.append(f"正在编译: {compile_cmd}")
+
+    compile_process = subprocess.run(
+        compile_cmd, shell=True, capture_output=True, text=True
+    )
+
+    if compile_process.returncode != 0:
+        output.append("编译失败:")
+        output.append(compile_process.stderr)
+        return None
+
+    output.append("编译成功，正在运行...")
+    return str(output_exe)
+
+
+def run_harness(command, output, extra_env=None):
+    """运行一次测试代码，返回(进程结果, 测试代码写入LC_RESULT_FILE的结果)
+
+    测试代码没有写入结果（中途出错、找不到测试用例文件或旧版本的测试代码）时，
+    结果为None。
+    """
+    fd, result_file = tempfile.mkstemp(prefix="lc_result_", suffix=".json")
+    os.close(fd)
+    os.unlink(result_file)
+    env = dict(os.environ, **{RESULT_FILE_ENV: result_file}, **(extra_env or {}))
+    try:
+        process = run_process(command, output, env)
+        try:
+            with open(result_file, "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+            if "cases" not in recorded or "passed" not in recorded:
+                recorded = None
+        except (OSError, ValueError):
+            recorded = None
+        return process, recorded
+    finally:
+        if os.path.exists(result_file):
+            os.unlink(result_file)
+
+
+def execute_solution(solution_file, lang, repeat=1, trace_memory=False):
+    """编译并运行解决方案，返回测试结果（见run_solution）
+
+    生成的测试代码将每个用例的耗时和验证结果写入LC_RESULT_FILE，
+    没有写入结果时即使进程正常退出也视为失败。repeat大于1时重复运行，
+    每个用例的耗时取中位数，输出和验证结果以第一次运行为准；trace_memory时
+    Python解决方案额外运行一次，统计每个用例的内存。
+    """
+    output = []
+    result = {"success": False, "output": output, "cases": None, "cached": False}
+    started = time.perf_counter()
+
+    try:
+        command = build_solution(solution_file, lang, output)
+        if command is None:
+            return result
+
+        process, recorded = run_harness(command, output)
+        if recorded is None:
+            output.append(
+                "测试代码没有记录测试结果，请检查上面的输出；"
+                "旧版本的测试代码可用 python create_problem.py --regen 题号 更新"
+            )
+            return result
+        result["success"] = process.returncode == 0 and recorded["passed"]
+
+        runs = [recorded]
+        for _ in range(repeat - 1):
+            _, recorded = run_harness(command, [])
+            if recorded is None or len(recorded["cases"]) != len(runs[0]["cases"]):
+                break
+            runs.append(recorded)
+        memory_run = None
+        if trace_memory and lang == "py":
+            # tracemalloc会拖慢运行，单独运行一次统计内存，不影响耗时
+            _, memory_run = run_harness(command, [], {MEMORY_TRACE_ENV: "1"})
+
+        result["cases"], result["peak_kb"] = summarize_runs(runs, memory_run)
+        if len(runs) > 1:
+            result["repeat"] = len(runs)
+            output.append(f"共运行 {len(runs)} 次，每个用例的耗时取中位数")
+        return result
+    finally:
+        result["output"] = "\n".join(output)
+        result["elapsed"] = round(time.perf_counter() - started, 3)
+
+
+def record_history(solution_file, lang, result):
+    """将实际运行的测试结果追加到测试历史"""
+    with open(solution_file, "r", encoding="utf-8") as f:
+        source = f.read()
+    record_run(
+        solution_file.parent.name,
+        lang,
+        build_profile(lang),
+        fingerprint(source, lang),
+        result,
+        file_digest(solution_file.parent / CASES_FILE_NAME),
+    )
+
+
+def check_baseline(solution_file, lang, result, baseline, tolerance=None):
+    """将测试结果与性能基线比较，超出容差时标记为失败并在输出中说明，返回是否在容差内"""
+    violations = compare_baseline(
+        baseline,
+        result,
+        file_digest(solution_file.parent / CASES_FILE_NAME),
+        tolerance,
+    )
+    if not violations:
+        result["output"] += "\n性能基线检查通过"
+        return True
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    result["success"] = False
+    result["output"] += format_violations(
+        violations, baseline, build_profile(lang), tolerance
+    )
+    return False
+
+
+def run_solution(
+    solution_file, lang, use_cache=True, repeat=None, tolerance=None, record=True
+):
+    """测试解决方案，不输出任何内容，解决方案和测试数据未变化时直接返回缓存的结果
+
+    固定了性能基线时重复运行repeat次（默认CHECK_REPEAT）并与基线比较，
+    tolerance覆盖基线中保存的容差；指定了repeat或tolerance时总是重新运行。
+    record为False时不追加到测试历史（如与其他测试并行运行、耗时不可比时）。
+
+    返回字典:
+        success: 是否通过所有测试用例
+        output: 编译和运行的输出
+        cases: 每个用例的耗时（毫秒，重复运行时为中位数）和验证结果，旧的测试代码为None
+        peak_kb: 测试进程的峰值内存（KB），无法获取时不存在或为None
+        elapsed: 编译和运行的总耗时（秒）
+        cached: 是否为缓存的结果
+    """
+    key = solution_result_key(solution_file, lang)
+    if use_cache and repeat is None and tolerance is None:
+        cached = load_result(solution_file, lang, key)
+        if cached is not None:
+            return dict(cached, cached=True)
+
+    baseline = load_baseline(solution_file, lang)
+    if baseline is None:
+        result = execute_solution(solution_file, lang, repeat or 1)
+    else:
+        result = execute_solution(
+            solution_file, lang, repeat or CHECK_REPEAT, trace_memory=True
+        )
+    if record:
+        record_history(solution_file, lang, result)
+    within_baseline = True
+    if baseline is not None and result["success"] and result["cases"] is not None:
+        within_baseline = check_baseline(solution_file, lang, result, baseline, tolerance)
+    # 只缓存由测试代码记录了验证结果、使用默认设置的运行；
+    # 超出基线可能是计时噪声，不缓存，下次测试时重新运行
+    if (
+        result["cases"] is not None
+        and within_baseline
+        and repeat is None
+        and tolerance is None
+    ):
+        save_result(solution_file, lang, key, dict(result, cached=False))
+    return result
+
+
+def test_solution(solution_file, lang, use_cache=True, repeat=None, tolerance=None):
     """测试解决方案"""
     if not solution_file.exists():
         print(f"错误: 找不到解决方案文件 {solution_file}")
         return False
 
+    if lang not in ["cpp", "py"]:
+        print(f"不支持的语言: {lang}")
+        return False
+
     try:
-        if lang == "cpp":
-            # 编译并运行C++代码
-            output_exe = solution_file.with_suffix(".exe")
-            compile_cmd = f"g++ -std=c++17 {solution_file} -o {output_exe}"
-            print(f"正在编译: {compile_cmd}")
+        result = run_solution(solution_file, lang, use_cache, repeat, tolerance)
+    except Exception as e:
+        print(f"测试过程中出错: {str(e)}")
+        return False
 
-            compile_process = subprocess.run(
-                compile_cmd, shell=True, capture_output=True, text=True
-            )
+    if result["cached"]:
+        print("解决方案和测试数据未变化，使用缓存的测试结果（使用--no-cache重新运行）")
+    print(result["output"])
+    return result["success"]
+
+
+def pin_baseline(solution_file, lang, repeat=None, tolerance=None):
+    """重复运行解决方案，将每个用例耗时和内存的中位数固定为性能基线"""
+    result = execute_solution(
+        solution_file, lang, repeat or PIN_REPEAT, trace_memory=True
+    )
+    record_history(solution_file, lang, result)
+    if not result["success"] or result["cases"] is None:
+        print(result["output"])
+        print("\n测试未通过，无法固定性能基线")
+        return False
 
-            if compile_process.returncode != 0:
-                print("编译失败:")
-                print(compile_process.stderr)
-                return False
+    path = save_baseline(
+        solution_file,
+        lang,
+        result,
+        DEFAULT_TOLERANCE if tolerance is None else tolerance,
+        build_profile(lang),
+        file_digest(solution_file.parent / CASES_FILE_NAME),
+    )
+    print(format_baseline(path, result))
+    return True
 
-            print("编译成功，正在运行...")
-            run_process = subprocess.run(
-                str(output_exe), shell=True, capture_output=True, text=True
-            )
 
-            print("输出:")
-            print(run_process.stdout)
+def profile_solution(solution_file, lang, top=None, mode=None):
+    """在性能分析器下运行测试代码，输出测试结果和分析报告
 
-            if run_process.stderr:
-                print("错误:")
-                print(run_process.stderr)
+    mode为solution_profiler.py的模式选项，如行级分析的--lines。
+    C++解决方案只支持函数级分析（gprof和perf）。
+    """
+    if lang == "cpp" and not mode:
+        if top:
+            return profile_cpp_solution(solution_file, CPP_FLAGS, int(top))
+        return profile_cpp_solution(solution_file, CPP_FLAGS)
+    if lang != "py":
+        print("错误: 行级分析和采样分析只支持Python解决方案，C++请使用--profile")
+        return False
+    profile_cmd = f'python "{SCRIPTS_DIR / "solution_profiler.py"}" "{solution_file}"'
+    if mode:
+        profile_cmd += f" {mode}"
+    if top:
+        profile_cmd += f" --top {top}"
+    sys.stdout.flush()
+    return subprocess.run(profile_cmd, shell=True).returncode == 0
+
+
+def find_all_solution_files():
+    """查找工作区中所有题目的解决方案文件"""
+    return [
+        problem_dir / f"solution.{lang}"
+        for problem_dir in find_problem_dirs("all")
+        for lang in ("cpp", "py")
+        if (problem_dir / f"solution.{lang}").exists()
+    ]
+
+
+def test_many(solution_files, use_cache=True, jobs=None):
+    """并行测试多个解决方案，只运行发生变化的解决方案，返回失败的数量
+
+    并行运行的测试相互争用CPU，耗时偏高，不追加到测试历史；固定了性能基线的
+    解决方案在并行测试结束后逐个运行，基线检查和测试历史使用不受干扰的耗时。
+    """
+    if not solution_files:
+        print("没有需要测试的解决方案")
+        return 0
+    if any(path.suffix == ".cpp" for path in solution_files):
+        # 预编译头文件只生成一次，避免并行编译时重复生成
+        precompile_runtime_header()
 
-            return run_process.returncode == 0
+    jobs = jobs or os.cpu_count() or 1
 
-        elif lang == "py":
-            # 运行Python代码
-            print(f"正在运行Python解决方案: {solution_file}")
-            run_process = subprocess.run(
-                f"python {solution_file}", shell=True, capture_output=True, text=True
+    def run(solution_file, record=jobs == 1):
+        try:
+            return run_solution(
+                solution_file, solution_file.suffix[1:], use_cache, record=record
             )
-
-            print("输出:")
-            print(run_process.stdout)
-
-            if run_process.stderr:
-                print("错误:")
-                print(run_process.stderr)
-
-            return run_process.returncode == 0
-
-        else:
-            print(f"不支持的语言: {lang}")
-            return False
-
-    except Exception as e:
-        print(f"测试过程中出错: {str(e)}")
-        return False
+        except Exception as e:
+            output = f"测试过程中出错: {str(e)}"
+            return {"success": False, "output": output, "cached": False, "elapsed": 0}
+
+    failures = []
+    cached_count = 0
+
+    def report(solution_file, result):
+        nonlocal cached_count
+        problem_id = solution_file.parent.name
+        lang = solution_file.suffix[1:]
+        verdict = "通过" if result["success"] else "失败"
+        source = "缓存" if result["cached"] else f"{result['elapsed']:.2f}s"
+        print(f"{verdict}  {problem_id:>6} {lang:<4} ({source})")
+        cached_count += result["cached"]
+        if not result["success"]:
+            failures.append((solution_file, result))
+
+    baselined = [
+        path
+        for path in solution_files
+        if load_baseline(path, path.suffix[1:]) is not None
+    ]
+    parallel = [path for path in solution_files if path not in baselined]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for solution_file, result in zip(parallel, executor.map(run, parallel)):
+            report(solution_file, result)
+    for solution_file in baselined:
+        report(solution_file, run(solution_file, record=True))
+
+    for solution_file, result in failures:
+        print(f"\n===== {solution_file} =====")
+        print(result["output"])
+
+    passed_count = len(solution_files) - len(failures)
+    print(
+        f"\n共 {len(solution_files)} 个解决方案: {passed_count} 个通过，"
+        f"{len(failures)} 个失败，{cached_count} 个使用缓存结果"
+    )
+    return len(failures)
 
 
 def extract_solution(solution_file, lang, problem_id, auto_open=False):
@@ -219,38 +594,173 @@ def extract_solution(solution_file, lang, problem_id, auto_open=False):
         print(f"提取过程中出错: {str(e)}")
 
 
+def git_output(args):
+    """运行git命令，返回以NUL分隔的输出项；不是git仓库或git不可用时抛出RuntimeError"""
+    try:
+        process = subprocess.run(
+            ["git", "-c", "core.quotepath=off", *args], capture_output=True, text=True
+        )
+    except OSError as e:
+        raise RuntimeError(f"无法运行git: {e}")
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip())
+    return [item for item in process.stdout.split("\0") if item]
+
+
+def find_changed_solution_files(rev=None):
+    """查找自rev以来（默认为HEAD，即工作区中）发生变化的题目对应的解决方案文件
+
+    路径按create_directory_structure生成的Tags/主标签/难度/题号/文件名布局映射:
+    solution.py/solution.cpp只测试对应的语言，cases.jsonl变化时测试该题的所有语言。
+    """
+    changed = git_output(
+        ["diff", "--name-only", "-z", "--relative", rev or "HEAD", "--", "Tags"]
+    )
+    # 未跟踪的新题目
+    changed += git_output(
+        ["ls-files", "--others", "--exclude-standard", "-z", "--", "Tags"]
+    )
+
+    solution_files = set()
+    for name in changed:
+        path = Path(name)
+        if len(path.parts) != 5 or path.parts[0] != "Tags":
+            continue
+        problem_dir = path.parent
+        if path.name in ("solution.py", "solution.cpp"):
+            candidates = [path]
+        elif path.name == CASES_FILE_NAME:
+            candidates = [problem_dir / "solution.cpp", problem_dir / "solution.py"]
+        else:
+            continue
+        solution_files.update(p for p in candidates if p.exists())
+    return sorted(solution_files)
+
+
+# 带一个值的选项，以及值可以省略的选项
+VALUE_OPTIONS = {
+    "--jobs",
+    "--threshold",
+    "--repeat",
+    "--tolerance",
+    "--top",
+    "--rate",
+}
+OPTIONAL_VALUE_OPTIONS = {"--changed"}
+
+
+def parse_args(argv):
+    """拆分位置参数和选项，返回(位置参数列表, {选项: 值})，不带值的选项值为True"""
+    positional, options = [], {}
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+        if not arg.startswith("--"):
+            positional.append(arg)
+        elif arg in VALUE_OPTIONS:
+            options[arg] = argv[index] if index < len(argv) else None
+            index += 1
+        elif arg in OPTIONAL_VALUE_OPTIONS:
+            has_value = index < len(argv) and not argv[index].startswith("--")
+            options[arg] = argv[index] if has_value else True
+            index += has_value
+        else:
+            options[arg] = True
+    return positional, options
+
+
 def main():
     """主函数"""
-    if len(sys.argv) < 2:
-        print("用法: python test_solution.py 题号 [语言] [--extract] [--open]")
+    positional, options = parse_args(sys.argv[1:])
+
+    if "--watch" in options:
+        from solution_watcher import watch
+
+        return watch()
+
+    if "--regressions" in options:
+        # 比较测试历史中最近的耗时与历史最佳
+        try:
+            threshold = float(options.get("--threshold") or DEFAULT_THRESHOLD)
+        except ValueError:
+            print(f"错误: 无效的阈值 {options['--threshold']}")
+            return 1
+        return 1 if print_regressions(threshold) else 0
+
+    use_cache = "--no-cache" not in options
+    jobs = int(options["--jobs"]) if options.get("--jobs") else None
+    if "--all" in options:
+        # 测试工作区中的所有解决方案，未变化的直接使用缓存结果
+        return 1 if test_many(find_all_solution_files(), use_cache, jobs) else 0
+
+    if "--changed" in options:
+        # 只测试git记录的发生变化的解决方案
+        rev = options["--changed"] if options["--changed"] is not True else None
+        try:
+            solution_files = find_changed_solution_files(rev)
+        except RuntimeError as e:
+            print(f"错误: 无法获取变化的文件: {e}")
+            return 1
+        return 1 if test_many(solution_files, use_cache, jobs) else 0
+
+    if not positional:
+        print("用法: python test_solution.py 题号 [语言] [--extract] [--open] [--no-cache]")
+        print("      python test_solution.py 题号 [语言] --pin-baseline [--repeat 次数] [--tolerance 比例]")
+        print("      python test_solution.py 题号 [语言] --profile [--top N]")
+        print("      python test_solution.py 题号 py --line-profile [--top N]")
+        print("      python test_solution.py 题号 py --sample-profile [--rate 频率] [--top N]")
+        print("      python test_solution.py --all [--jobs 并行数] [--no-cache]")
+        print("      python test_solution.py --changed [版本] [--jobs 并行数]")
+        print("      python test_solution.py --watch")
+        print("      python test_solution.py --regressions [--threshold 比例]")
         print("支持的语言: cpp, py")
-        return
+        return 1
 
-    problem_id = sys.argv[1]
-    lang = sys.argv[2] if len(sys.argv) > 2 else "cpp"
-    extract_mode = "--extract" in sys.argv
-    auto_open = "--open" in sys.argv
+    try:
+        repeat = int(options["--repeat"]) if options.get("--repeat") else None
+        tolerance = float(options["--tolerance"]) if options.get("--tolerance") else None
+        rate = int(options["--rate"]) if options.get("--rate") else None
+    except ValueError:
+        print("错误: --repeat和--rate需要整数，--tolerance需要小数（如0.25表示25%）")
+        return 1
+
+    problem_id = positional[0]
+    lang = positional[1] if len(positional) > 1 else "cpp"
+    extract_mode = "--extract" in options
+    auto_open = "--open" in options
 
     if lang not in ["cpp", "py"]:
         print(f"不支持的语言: {lang}")
         print("支持的语言: cpp, py")
-        return
+        return 1
 
     # 查找解决方案文件
     solution_file = find_solution_file(problem_id, lang)
 
     if not solution_file:
         print(f"错误: 找不到题号 {problem_id} 的 {lang} 解决方案")
-        return
+        return 1
 
     print(f"找到解决方案文件: {solution_file}")
 
     if extract_mode:
         # 提取用于提交的代码
         extract_solution(solution_file, lang, problem_id, auto_open)
+    elif "--pin-baseline" in options:
+        return 0 if pin_baseline(solution_file, lang, repeat, tolerance) else 1
+    elif "--profile" in options:
+        return 0 if profile_solution(solution_file, lang, options.get("--top")) else 1
+    elif "--line-profile" in options:
+        top = options.get("--top")
+        return 0 if profile_solution(solution_file, lang, top, "--lines") else 1
+    elif "--sample-profile" in options:
+        mode = f"--sample --rate {rate}" if rate else "--sample"
+        top = options.get("--top")
+        return 0 if profile_solution(solution_file, lang, top, mode) else 1
     else:
         # 测试解决方案
-        success = test_solution(solution_file, lang)
+        success = test_solution(solution_file, lang, use_cache, repeat, tolerance)
 
         if success:
             print("\n测试成功!")
@@ -260,7 +770,9 @@ def main():
             print(f"python test_solution.py {problem_id} {lang} --extract --open")
         else:
             print("\n测试失败，请检查代码并修复错误")
+            return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -10,6 +10,9 @@
  * [在此处添加您的解题思路]
  */
 
+// 共享的运行时（ListNode、TreeNode及测试辅助函数），必须最先包含才能使用预编译头文件
+#include "../../../../Scripts/leetcode_runtime.hpp"
+
 #include <iostream>
 #include <vector>
 #include <string>
@@ -20,12 +23,15 @@
 #include <algorithm>
 using namespace std;
 
+{{#solution}}
 class Solution
 {
 public:
     // 在此处添加您的解决方案
 };
+{{/solution}}
 
+{{#test}}
 // 测试函数
 void test_solution()
 {
@@ -39,4 +45,6 @@ int main()
 {
     test_solution();
     return 0;
-}
\ No newline at end of file
+}
+{{/test}}
+// 测试函数结束
@@ -10,21 +10,32 @@ LeetCode - {{problem_id}}
 [在此处添加您的解题思路]
 """
 
+import os
+import sys
 from typing import List, Optional
 
+# 将工作区的Scripts目录加入模块搜索路径，以便导入共享的运行时（ListNode、TreeNode等）
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), *[os.pardir] * 4, "Scripts")))
+from leetcode_runtime import *  # noqa: E402,F403
 
+
+{{#solution}}
 class Solution:
     # 在此处添加您的解决方案
     pass
+{{/solution}}
 
 
+{{#test}}
 # 测试函数
 def test_solution():
     sol = Solution()
     # 在此添加测试用例
     
     print("所有测试用例通过！")
+{{/test}}
+# 测试函数结束
 
 
 if __name__ == "__main__":
-    test_solution()
\ No newline at end of file
+    test_solution()